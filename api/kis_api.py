@@ -2,6 +2,7 @@
 from api.kis_auth import KISAuth
 from api.kis_market_data import KISMarketData
 from api.kis_order import KISOrder
+from utils.tracing import traced
 
 class KISApi:
     def __init__(self, is_mock=False):
@@ -11,86 +12,128 @@ class KISApi:
         self.order = KISOrder(auth=self.auth)
 
     # 편의 메서드 제공 (외부 인터페이스)
+    @traced(cat='kis_api')
     def get_current_price(self, ticker):
         """
         지정 종목의 현재 주가와 거래 정지 여부를 반환합니다.
         """
         return self.market_data.get_current_price(ticker)
 
+    @traced(cat='kis_api')
     def get_upper_limit_stocks(self):
         """
         상한가 종목 목록을 반환합니다.
         """
         return self.market_data.get_upper_limit_stocks()
 
+    @traced(cat='kis_api')
     def get_upAndDown_rank(self):
         """
         상승/하락 순위 정보를 반환합니다.
         """
         return self.market_data.get_upAndDown_rank()
 
+    @traced(cat='kis_api')
     def get_volume_rank(self):
         """
         거래량 상위 종목 정보를 반환합니다.
         """
         return self.market_data.get_volume_rank()
 
+    @traced(cat='kis_api')
     def get_stock_volume(self, ticker, days=3):
         """
         지정 종목의 최근 n일간 거래량을 반환합니다.
         """
         return self.market_data.get_stock_volume(ticker, days)
 
+    @traced(cat='kis_api')
     def compare_volumes(self, volumes):
         """
         3일간 거래량 비교 결과(백분율 차이)를 반환합니다.
         """
         return self.market_data.compare_volumes(volumes)
 
+    @traced(cat='kis_api')
     def get_basic_stock_info(self, ticker):
         """
         종목 기본 정보를 반환합니다.
         """
         return self.market_data.get_basic_stock_info(ticker)
 
+    @traced(cat='kis_api')
     def place_order(self, ticker, quantity, order_type, price=None):
         """
         매수/매도 주문을 실행합니다.
         """
         return self.order.place_order(ticker, quantity, order_type, price)
 
+    @traced(cat='kis_api')
+    def build_order_request(self, ticker, quantity, order_type, price=None):
+        """
+        주문 요청(헤더/본문)을 미리 만들어 반환합니다 (send_order_request로 전송).
+        """
+        return self.order.build_order_request(order_type, ticker, quantity, price)
+
+    @traced(cat='kis_api')
+    def send_order_request(self, request):
+        """
+        미리 만든 주문 요청을 전송합니다.
+        """
+        return self.order.send_order_request(request)
+
+    @traced(cat='kis_api')
     def sell_order(self, ticker, quantity, price=None):
         """
         매도 주문을 실행합니다.
         """
         return self.order.sell_order(ticker, quantity, price)
 
+    @traced(cat='kis_api')
     def cancel_order(self, order_num):
         """
         주문취소를 실행합니다.
         """
         return self.order.cancel_order(order_num)
 
+    @traced(cat='kis_api')
     def revise_order(self, order_num):
         """
         주문 정정을 실행합니다.
         """
         return self.order.revise_order(order_num)
 
+    @traced(cat='kis_api')
     def purchase_availability_inquiry(self, ticker=None):
         """
         주문 가능 조회를 실행합니다.
         """
         return self.order.purchase_availability_inquiry(ticker)
 
-    def daily_order_execution_inquiry(self, order_num):
+    @traced(cat='kis_api')
+    def daily_order_execution_inquiry(self, order_num=""):
         """
         일별 주문 체결 조회를 실행합니다.
         """
         return self.order.daily_order_execution_inquiry(order_num)
 
+    @traced(cat='kis_api')
     def balance_inquiry(self):
         """
         잔고 조회를 실행합니다.
         """
         return self.order.balance_inquiry()
+
+    @traced(cat='kis_api')
+    def daily_order_executions(self):
+        """
+        당일 전체 주문체결 내역을 연속조회로 모두 가져옵니다.
+        """
+        return self.order.daily_order_executions()
+
+    @traced(cat='kis_api')
+    def balance_holdings(self):
+        """
+        보유 종목 잔고를 연속조회로 모두 가져옵니다.
+        """
+        return self.order.balance_holdings()
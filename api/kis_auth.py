@@ -1,20 +1,24 @@
 import json
 import requests
 import logging
+import threading
 from requests.exceptions import RequestException
 from utils.string_utils import unicode_to_korean
-from config.config import R_APP_KEY, R_APP_SECRET, M_APP_KEY, M_APP_SECRET, M_ACCOUNT_NUMBER
+from config.config import R_APP_KEY, R_APP_SECRET, M_APP_KEY, M_APP_SECRET, M_ACCOUNT_NUMBER, KIS_RATE_LIMIT_REAL, KIS_RATE_LIMIT_MOCK
 from config.condition import BUY_DAY_AGO
 from datetime import datetime, timedelta
 from database.db_manager import DatabaseManager
+from utils.metrics import get_metrics
+from utils.rate_limiter import RateLimiter
 import time
 
+logger = logging.getLogger(__name__)
+
 class KISAuth:
     """한국투자증권 API와 상호작용하기 위한 클래스입니다."""
 
     def __init__(self):
         """KISAuth 클래스의 인스턴스를 초기화합니다."""
-        self.headers = {"content-type": "application/json; charset=utf-8"}
         self.w_headers = {"content-type": "utf-8"}
         self.real_token = None
         self.mock_token = None
@@ -24,9 +28,17 @@ class KISAuth:
         self.mock_approval = None
         self.real_approval_expires_at = None
         self.mock_approval_expires_at = None
-        self.hashkey = None
         self.upper_limit_stocks = {}
         self.watchlist = set()
+        # 모든 REST 호출이 공유하는 HTTP 세션 (keep-alive로 TLS 핸드셰이크 재사용)
+        self.session = requests.Session()
+        self.metrics = get_metrics()
+        # 서버별 유량 제한 (이 인증 객체를 공유하는 모든 스레드의 REST 호출에 적용)
+        self.rate_limiters = {
+            'real': RateLimiter(KIS_RATE_LIMIT_REAL, name='kis_real'),
+            'mock': RateLimiter(KIS_RATE_LIMIT_MOCK, name='kis_mock'),
+        }
+        self.token_lock = threading.Lock()  # 만료 시 여러 스레드가 동시에 재발급하지 않도록
 
 ######################################################################################
 #########################    인증 관련 메서드   #######################################
@@ -51,7 +63,7 @@ class KISAuth:
         # Check if we have a valid cached token
         cached_token, cached_expires_at = db_manager.get_token(token_type)
         if cached_token and cached_expires_at > datetime.utcnow():
-            logging.info("Using cached %s token", token_type)
+            logger.info("Using cached %s token", token_type)
             return cached_token, cached_expires_at
 
         url = "https://openapi.koreainvestment.com:9443/oauth2/tokenP"
@@ -64,7 +76,7 @@ class KISAuth:
 
         for attempt in range(max_retries):
             try:
-                response = requests.post(url, headers=headers, json=body, timeout=10)
+                response = self.request('POST', url, headers=headers, json=body, timeout=10)
                 response.raise_for_status()
                 token_data = response.json()
                 
@@ -76,17 +88,17 @@ class KISAuth:
                     db_manager.save_token(token_type, access_token, expires_at)
                     db_manager.close()
                     
-                    logging.info("Successfully obtained and cached %s token on attempt %d", token_type, attempt + 1)
+                    logger.info("Successfully obtained and cached %s token on attempt %d", token_type, attempt + 1)
                     return access_token, expires_at
                 else:
-                    logging.warning("Unexpected response format on attempt %d: %s", attempt + 1, token_data)
+                    logger.warning("Unexpected response format on attempt %d: %s", attempt + 1, token_data)
             except RequestException as e:
-                logging.error("An error occurred while fetching the %s token on attempt %d: %s", token_type, attempt + 1, e)
+                logger.error("An error occurred while fetching the %s token on attempt %d: %s", token_type, attempt + 1, e)
                 if attempt < max_retries - 1:
-                    logging.info("Retrying in %d seconds...", retry_delay)
+                    logger.info("Retrying in %d seconds...", retry_delay)
                     time.sleep(retry_delay)
                 else:
-                    logging.error("Max retries reached. Unable to obtain %s token.", token_type)
+                    logger.error("Max retries reached. Unable to obtain %s token.", token_type)
         db_manager.close()
         return None, None
 
@@ -101,35 +113,72 @@ class KISAuth:
             str: 유효한 액세스 토큰
         """
         now = datetime.now()
-        if is_mock:
-            if not self.mock_token or now >= self.mock_token_expires_at:
-                self.mock_token, self.mock_token_expires_at = self._get_token(M_APP_KEY, M_APP_SECRET, "mock")
-            return self.mock_token
-        else:
-            if not self.real_token or now >= self.real_token_expires_at:
-                self.real_token, self.real_token_expires_at = self._get_token(R_APP_KEY, R_APP_SECRET, "real")
-            return self.real_token
+        with self.token_lock:
+            if is_mock:
+                if not self.mock_token or now >= self.mock_token_expires_at:
+                    self.mock_token, self.mock_token_expires_at = self._get_token(M_APP_KEY, M_APP_SECRET, "mock")
+                return self.mock_token
+            else:
+                if not self.real_token or now >= self.real_token_expires_at:
+                    self.real_token, self.real_token_expires_at = self._get_token(R_APP_KEY, R_APP_SECRET, "real")
+                return self.real_token
+
+######################################################################################
+###############################    HTTP 요청   ########################################
+######################################################################################
+
+    def request(self, method, url, **kwargs):
+        """
+        공용 HTTP 세션으로 요청하고 엔드포인트/tr_id별 응답 시간을 기록합니다.
+        모의/실전 서버별 유량 제한(rate_limiters)을 넘지 않도록 필요하면 먼저 기다립니다.
+
+        Args:
+            method (str): 'GET' 또는 'POST'
+            url (str): 요청 URL
+            **kwargs: requests 요청 인자 (headers, params, data, json, timeout 등)
+
+        Returns:
+            requests.Response: 응답 객체
+        """
+        headers = kwargs.get('headers') or {}
+        self.rate_limiters['mock' if 'openapivts' in url else 'real'].acquire()
+        status = 'error'
+        start = time.perf_counter()
+        try:
+            response = self.session.request(method, url, **kwargs)
+            status = response.status_code
+            return response
+        finally:
+            self.metrics.observe('kis_request_seconds', time.perf_counter() - start,
+                                 endpoint=url.rsplit('/', 1)[-1], tr_id=headers.get('tr_id', ''), status=status)
 
 ######################################################################################
 ###############################    헤더와 해쉬   ########################################
 ######################################################################################
 
-    def _set_headers(self, is_mock=False, tr_id=None):
+    def build_headers(self, is_mock=False, tr_id=None):
         """
-        API 요청에 필요한 헤더를 설정합니다.
+        API 요청에 필요한 헤더를 매 요청마다 새 dict로 만듭니다.
+        인증 객체를 여러 스레드가 공유하므로 공용 상태에 헤더를 두지 않습니다.
 
         Args:
             is_mock (bool): 모의 거래 여부
             tr_id (str, optional): 거래 ID
+
+        Returns:
+            dict: 요청 헤더
         """
-        token = self._ensure_token(is_mock)
-        self.headers["authorization"] = f"Bearer {token}"
-        self.headers["appkey"] = M_APP_KEY if is_mock else R_APP_KEY
-        self.headers["appsecret"] = M_APP_SECRET if is_mock else R_APP_SECRET
+        headers = {
+            "content-type": "application/json; charset=utf-8",
+            "authorization": f"Bearer {self._ensure_token(is_mock)}",
+            "appkey": M_APP_KEY if is_mock else R_APP_KEY,
+            "appsecret": M_APP_SECRET if is_mock else R_APP_SECRET,
+            "tr_cont": "",
+            "custtype": "P",
+        }
         if tr_id:
-            self.headers["tr_id"] = tr_id
-        self.headers["tr_cont"] = ""
-        self.headers["custtype"] = "P"
+            headers["tr_id"] = tr_id
+        return headers
 
     def _get_hashkey(self, body, is_mock=False):
         """
@@ -139,22 +188,18 @@ class KISAuth:
             body (dict): 요청 본문
 
         Returns:
-            str: 생성된 해시 키
+            str: 생성된 해시 키, 실패 시 None
         """
         if is_mock:
             url = "https://openapivts.koreainvestment.com:29443/uapi/hashkey"
-            self._set_headers(is_mock=True)
-
         else:
             url = "https://openapi.koreainvestment.com:9443/uapi/hashkey"
-            self._set_headers(is_mock=False)
+        headers = self.build_headers(is_mock=is_mock)
 
-
-        
         try:
-            response = requests.post(url=url, headers=self.headers, data=json.dumps(body), timeout=10)
+            response = self.request('POST', url=url, headers=headers, data=json.dumps(body), timeout=10)
             response.raise_for_status()
-            tmp = response.json()
-            self.hashkey = tmp['HASH']
+            return response.json()['HASH']
         except requests.exceptions.RequestException as e:
-            print(f"An error occurred while fetching the hash key: {e}")
+            logger.error("An error occurred while fetching the hash key: %s", e)
+            return None
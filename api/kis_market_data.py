@@ -1,9 +1,11 @@
+import logging
 import json
-import requests
 from requests.exceptions import RequestException
 from utils.string_utils import unicode_to_korean
 from datetime import datetime, timedelta
 
+logger = logging.getLogger(__name__)
+
 
 class KISMarketData:
     def __init__(self, auth):
@@ -22,13 +24,13 @@ class KISMarketData:
         Returns:
             dict: 주가 정보를 포함한 딕셔너리
         """
-        self.auth._set_headers(is_mock=False, tr_id="FHPST01010000")
+        headers = self.auth.build_headers(is_mock=False, tr_id="FHPST01010000")
         url = "https://openapi.koreainvestment.com:9443/uapi/domestic-stock/v1/quotations/inquire-price-2"
         params = {
             "FID_COND_MRKT_DIV_CODE": "J",
             "FID_INPUT_ISCD": ticker
         }
-        response = requests.get(url=url, params=params, headers=self.auth.headers, timeout=10)
+        response = self.auth.request('GET', url=url, params=params, headers=headers, timeout=10)
         json_response = response.json()
         # print(json.dumps(json_response,indent=2))
 
@@ -56,11 +58,10 @@ class KISMarketData:
             "FID_VOL_CNT": ""
         }
         
-        self.auth._get_hashkey(body, is_mock=False)
-        self.auth._set_headers(is_mock=False, tr_id="FHKST130000C0")
-        self.auth.headers["hashkey"] = self.auth.hashkey
+        headers = self.auth.build_headers(is_mock=False, tr_id="FHKST130000C0")
+        headers["hashkey"] = self.auth._get_hashkey(body, is_mock=False)
         
-        response = requests.get(url=url, headers=self.auth.headers, params=body, timeout=10)
+        response = self.auth.request('GET', url=url, headers=headers, params=body, timeout=10)
         
         upper_limit_stocks = response.json()
         return upper_limit_stocks
@@ -92,11 +93,10 @@ class KISMarketData:
 
         }
         
-        self.auth._get_hashkey(body, is_mock=False)
-        self.auth._set_headers(is_mock=False, tr_id="FHPST01700000")
-        self.auth.headers["hashkey"] = self.auth.hashkey
+        headers = self.auth.build_headers(is_mock=False, tr_id="FHPST01700000")
+        headers["hashkey"] = self.auth._get_hashkey(body, is_mock=False)
         
-        response = requests.get(url=url, headers=self.auth.headers, params=body, timeout=10)
+        response = self.auth.request('GET', url=url, headers=headers, params=body, timeout=10)
         
         updown = response.json()
         # print('상승 종목: ',json.dumps(updown, indent=2, ensure_ascii=False))
@@ -137,7 +137,7 @@ class KISMarketData:
 
     def get_volume_rank(self):
         """ 거래량 상위 종목 조회 """
-        self.auth._set_headers(tr_id="FHPST01710000")
+        headers = self.auth.build_headers(is_mock=False, tr_id="FHPST01710000")
         url = "https://openapi.koreainvestment.com:9443/uapi/domestic-stock/v1/quotations/volume-rank"
         body = {
             "FID_COND_MRKT_DIV_CODE": "J",
@@ -153,7 +153,7 @@ class KISMarketData:
             "FID_INPUT_DATE_1": ""
         }
 
-        response = requests.get(url=url, params=body, headers=self.auth.headers, timeout=10)
+        response = self.auth.request('GET', url=url, params=body, headers=headers, timeout=10)
         response.raise_for_status()
         response_json = response.json()
         # print(json.dumps(response_json, indent=2, ensure_ascii=False))
@@ -186,10 +186,9 @@ class KISMarketData:
             # "ST_DATE": start_date,
             # "END_DATE": end_date
         }
-        self.auth._get_hashkey(body, is_mock=False)
-        self.auth._set_headers(is_mock=False, tr_id="FHKST01010400")
+        headers = self.auth.build_headers(is_mock=False, tr_id="FHKST01010400")
         
-        response = requests.get(url=url, params=body, headers=self.auth.headers, timeout=10)
+        response = self.auth.request('GET', url=url, params=body, headers=headers, timeout=10)
         json_response = response.json()
         
         # print(json.dumps(json_response, indent=2, e_ascii=False))
@@ -222,18 +221,16 @@ class KISMarketData:
         return round(diff_1_2, 2), round(diff_2_3, 2)
     
     def get_basic_stock_info(self, ticker):
-        self.auth._set_headers(tr_id="FHPST01710000")
         url = "https://openapi.koreainvestment.com:9443/uapi/domestic-stock/v1/quotations/search-stock-info"
         body = {
             "PRDT_TYPE_CD": "300",
             "PDNO": ticker
         }
 
-        self.auth._get_hashkey(body, is_mock=False)
-        self.auth._set_headers(is_mock=False, tr_id="CTPF1002R")
-        self.auth.headers["hashkey"] = self.auth.hashkey
+        headers = self.auth.build_headers(is_mock=False, tr_id="CTPF1002R")
+        headers["hashkey"] = self.auth._get_hashkey(body, is_mock=False)
 
-        response = requests.get(url=url, params=body, headers=self.auth.headers, timeout=10)
+        response = self.auth.request('GET', url=url, params=body, headers=headers, timeout=10)
         response.raise_for_status()
         response_json = response.json()
         # print(json.dumps(response_json, indent=2, ensure_ascii=False))
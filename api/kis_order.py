@@ -1,11 +1,64 @@
+import logging
 import json
-import requests
-import datetime
-from config.config import M_ACCOUNT_NUMBER
+from datetime import datetime
+from config.config import M_ACCOUNT_NUMBER, KIS_MAX_PAGES
+
+logger = logging.getLogger(__name__)
+
+ORDER_URL = "https://openapivts.koreainvestment.com:29443/uapi/domestic-stock/v1/trading/order-cash"
+ORDER_TR_IDS = {'buy': "VTTC0802U", 'sell': "VTTC0801U"}  # 모의투자 현금 매수/매도
 
 class KISOrder:
     def __init__(self, auth):
         self.auth = auth  # KISAuth 인스턴스
+        self.order_templates = None  # prepare_templates()로 생성
+
+    def prepare_templates(self):
+        """
+        매수/매도 주문 요청의 고정 부분(tr_id, 계좌 본문)을 미리 만들어 둡니다.
+        장 시작 전 워밍업에서 호출하며, 호출하지 않아도 첫 주문 때 만들어집니다.
+
+        Returns:
+            dict: {'buy' | 'sell': {'tr_id', 'body'}}
+        """
+        base = {"CANO": M_ACCOUNT_NUMBER, "ACNT_PRDT_CD": "01"}
+        self.order_templates = {
+            side: {"tr_id": tr_id, "body": dict(base)} for side, tr_id in ORDER_TR_IDS.items()
+        }
+        return self.order_templates
+
+    def build_order_request(self, order_type, ticker, quantity, price=None):
+        """
+        현금 주문 요청(헤더/본문)을 보내기 직전 상태로 만들어 둡니다.
+        헤더는 요청마다 새로 만든 dict라 다른 스레드의 요청과 섞이지 않습니다.
+
+        Returns:
+            dict: {'url', 'headers', 'data'}
+        """
+        templates = self.order_templates or self.prepare_templates()
+        template = templates.get(order_type)
+        if template is None:
+            raise ValueError("Invalid order type. Must be 'buy' or 'sell'.")  # 추가된 코드: 잘못된 주문 유형 처리
+
+        headers = dict(self.auth.build_headers(is_mock=True, tr_id=template["tr_id"]), hashkey=None)
+        data = dict(
+            template["body"],
+            PDNO=ticker,
+            ORD_DVSN="01" if price is None else "00",  # 01: 시장가, 00: 지정가
+            ORD_QTY=str(quantity),
+            ORD_UNPR="0" if price is None else str(price),
+        )
+        return {"url": ORDER_URL, "headers": headers, "data": json.dumps(data)}
+
+    def send_order_request(self, request):
+        """build_order_request로 만든 요청을 그대로 보냅니다."""
+        response = self.auth.request('POST', url=request["url"], data=request["data"], headers=request["headers"],
+                                     timeout=10)
+        return response.json()
+
+    def _order_request(self, order_type, ticker, quantity, price):
+        """템플릿에 종목/수량/가격만 채워 현금 주문을 보냅니다."""
+        return self.send_order_request(self.build_order_request(order_type, ticker, quantity, price))
 
     def place_order(self, ticker, quantity, order_type=None, price=None):
         """
@@ -19,30 +72,7 @@ class KISOrder:
             Returns:
             dict: 주문 실행 결과를 포함한 딕셔너리
         """
-        
-        if order_type == 'buy':
-            tr_id_code = "VTTC0802U"
-        elif order_type == 'sell':
-            tr_id_code = "VTTC0801U"
-        else:
-            raise ValueError("Invalid order type. Must be 'buy' or 'sell'.")  # 추가된 코드: 잘못된 주문 유형 처리
-        
-        self.auth._set_headers(is_mock=True, tr_id=tr_id_code)
-        url = "https://openapivts.koreainvestment.com:29443/uapi/domestic-stock/v1/trading/order-cash"
-        data = {
-            "CANO": M_ACCOUNT_NUMBER,
-            "ACNT_PRDT_CD": "01",
-            "PDNO": ticker,
-            "ORD_DVSN": "01" if price is None else "00",  # 01: 시장가, 00: 지정가
-            "ORD_QTY": str(quantity),
-            "ORD_UNPR": "0" if price is None else str(price),
-        }
-        self.headers["hashkey"] = None
-
-        response = requests.post(url=url, data=json.dumps(data), headers=self.headers, timeout=10)
-        json_response = response.json()
-
-        return json_response
+        return self._order_request(order_type, ticker, quantity, price)
 
 
     def sell_order(self, ticker, quantity, price=None):
@@ -57,23 +87,7 @@ class KISOrder:
         Returns:
             dict: 주문 실행 결과를 포함한 딕셔너리
         """
-        self.auth._set_headers(is_mock=True, tr_id="VTTC0801U")  # 매도 거래 ID
-        url = "https://openapivts.koreainvestment.com:29443/uapi/domestic-stock/v1/trading/order-cash"
-        
-        data = {
-            "CANO": M_ACCOUNT_NUMBER,
-            "ACNT_PRDT_CD": "01",
-            "PDNO": ticker,
-            "ORD_DVSN": "01" if price is None else "00",  # 01: 시장가, 00: 지정가
-            "ORD_QTY": str(quantity),
-            "ORD_UNPR": "0" if price is None else str(price),
-        }
-        self.headers["hashkey"] = None
-
-        response = requests.post(url=url, data=json.dumps(data), headers=self.headers, timeout=10)
-        json_response = response.json()
-
-        return json_response
+        return self._order_request('sell', ticker, quantity, price)
 
 
     def cancel_order(self, order_num):
@@ -97,11 +111,10 @@ class KISOrder:
             "QTY_ALL_ORD_YN": "Y"
         }
 
-        self._get_hashkey(body, is_mock=True)
-        self.auth._set_headers(is_mock=True, tr_id="VTTC0803U")
-        self.headers["hashkey"] = self.hashkey
+        headers = self.auth.build_headers(is_mock=True, tr_id="VTTC0803U")
+        headers["hashkey"] = self.auth._get_hashkey(body, is_mock=True)
         
-        response = requests.post(url=url, headers=self.headers, json=body, timeout=10)
+        response = self.auth.request('POST', url=url, headers=headers, json=body, timeout=10)
         json_response = response.json()
         
         return json_response
@@ -111,7 +124,7 @@ class KISOrder:
         """
         주문취소 API
         """
-        print("revise_order:- ",order_num, type(order_num))
+        logger.debug("revise_order: %s", order_num)
         
         # 주문번호는 8자리로 맞춰야 함
         order_num = str(order_num).zfill(8)
@@ -129,11 +142,10 @@ class KISOrder:
             "QTY_ALL_ORD_YN": "Y",
             "ALGO_NO": ""
         }
-        self._get_hashkey(body, is_mock=True)
-        self.auth._set_headers(is_mock=True, tr_id="VTTC0803U")
-        self.headers["hashkey"] = self.hashkey
+        headers = self.auth.build_headers(is_mock=True, tr_id="VTTC0803U")
+        headers["hashkey"] = self.auth._get_hashkey(body, is_mock=True)
         
-        response = requests.post(url=url, headers=self.headers, json=body, timeout=10)
+        response = self.auth.request('POST', url=url, headers=headers, json=body, timeout=10)
         json_response = response.json()
         
         return json_response
@@ -154,11 +166,10 @@ class KISOrder:
             "OVRS_ICLD_YN": "N"
         }
         
-        self._get_hashkey(body, is_mock=True)
-        self.auth._set_headers(is_mock=True, tr_id="VTTC8908R")
-        self.headers["hashkey"] = self.hashkey
+        headers = self.auth.build_headers(is_mock=True, tr_id="VTTC8908R")
+        headers["hashkey"] = self.auth._get_hashkey(body, is_mock=True)
 
-        response = requests.get(url=url, headers=self.headers, params=body, timeout=10)
+        response = self.auth.request('GET', url=url, headers=headers, params=body, timeout=10)
         json_response = response.json()
         
         return json_response
@@ -167,9 +178,10 @@ class KISOrder:
 ################################    잔고 메서드   ###################################
 ######################################################################################
 
-    def daily_order_execution_inquiry(self, order_num):
+    def daily_order_execution_inquiry(self, order_num=""):
         """
         주식일별주문체결조회
+        order_num을 비우면 당일 전체 주문을 조회합니다.
         """
         today = datetime.now()
         formatted_date = today.strftime('%Y%m%d')
@@ -193,13 +205,12 @@ class KISOrder:
             "CTX_AREA_NK100": "",
         }
 
-        self._get_hashkey(body, is_mock=True)
-        self.auth._set_headers(is_mock=True, tr_id="VTTC8001R")
-        self.headers["hashkey"] = self.hashkey
+        headers = self.auth.build_headers(is_mock=True, tr_id="VTTC8001R")
+        headers["hashkey"] = self.auth._get_hashkey(body, is_mock=True)
         
-        response = requests.get(url=url, headers=self.headers, params=body, timeout=10)
+        response = self.auth.request('GET', url=url, headers=headers, params=body, timeout=10)
         json_response = response.json()
-        print("daily_order_execution_inquiry 정상 실행")
+        logger.debug("daily_order_execution_inquiry 정상 실행")
         
         
         return json_response
@@ -226,12 +237,86 @@ class KISOrder:
             "CTX_AREA_NK100": "",
         }
                 
-        self._get_hashkey(body, is_mock=True)
-        self.auth._set_headers(is_mock=True, tr_id="VTTC8434R")
-        self.headers["hashkey"] = self.hashkey
+        headers = self.auth.build_headers(is_mock=True, tr_id="VTTC8434R")
+        headers["hashkey"] = self.auth._get_hashkey(body, is_mock=True)
         
-        response = requests.get(url=url, headers=self.headers, params=body, timeout=10)
+        response = self.auth.request('GET', url=url, headers=headers, params=body, timeout=10)
         json_response = response.json()
         
         return json_response.get("output1")
-    
\ No newline at end of file
+    
+
+
+    def _paged_inquiry(self, url, tr_id, params, max_pages=KIS_MAX_PAGES):
+        """
+        연속조회로 모든 페이지의 output1을 모읍니다.
+        응답 헤더 tr_cont가 'M'/'F'면 다음 페이지가 있으므로 응답의 ctx_area_fk100/nk100을 넣고
+        요청 헤더 tr_cont='N'으로 이어서 조회합니다.
+        """
+        params = dict(params)
+        rows = []
+        tr_cont = ""
+        for _ in range(max_pages):
+            headers = self.auth.build_headers(is_mock=True, tr_id=tr_id)
+            headers["tr_cont"] = tr_cont
+            response = self.auth.request('GET', url=url, headers=headers, params=params, timeout=10)
+            json_response = response.json()
+            rows.extend(json_response.get("output1") or [])
+            if response.headers.get("tr_cont") not in ("M", "F"):
+                return rows
+            params["CTX_AREA_FK100"] = json_response.get("ctx_area_fk100", "")
+            params["CTX_AREA_NK100"] = json_response.get("ctx_area_nk100", "")
+            tr_cont = "N"
+        logger.warning("연속조회 최대 페이지(%d) 도달: %s", max_pages, tr_id)
+        return rows
+
+    def daily_order_executions(self):
+        """
+        당일 전체 주문체결 내역 (모든 페이지)
+
+        Returns:
+            list: output1 행 목록 (odno, pdno, tot_ccld_qty, tot_ccld_amt 등)
+        """
+        today = datetime.now().strftime('%Y%m%d')
+        url = "https://openapivts.koreainvestment.com:29443/uapi/domestic-stock/v1/trading/inquire-daily-ccld"
+        params = {
+            "CANO": M_ACCOUNT_NUMBER,
+            "ACNT_PRDT_CD": "01",
+            "INQR_STRT_DT": today,
+            "INQR_END_DT": today,
+            "UNPR_DVSN": "01",
+            "SLL_BUY_DVSN_CD": "00",
+            "INQR_DVSN": "00",
+            "PDNO": "",
+            "CCLD_DVSN": "00",
+            "ORD_GNO_BRNO": "",
+            "ODNO": "",
+            "INQR_DVSN_3": "00",
+            "INQR_DVSN_1": "",
+            "CTX_AREA_FK100": "",
+            "CTX_AREA_NK100": "",
+        }
+        return self._paged_inquiry(url, "VTTC8001R", params)
+
+    def balance_holdings(self):
+        """
+        보유 종목 잔고 (모든 페이지)
+
+        Returns:
+            list: output1 행 목록 (pdno, hldg_qty, pchs_avg_pric 등)
+        """
+        url = "https://openapivts.koreainvestment.com:29443/uapi/domestic-stock/v1/trading/inquire-balance"
+        params = {
+            "CANO": M_ACCOUNT_NUMBER,
+            "ACNT_PRDT_CD": "01",
+            "AFHR_FLPR_YN": "N",
+            "OFL_YN": "",
+            "INQR_DVSN": "02",
+            "UNPR_DVSN": "01",
+            "FUND_STTL_ICLD_YN": "N",
+            "FNCG_AMT_AUTO_RDPT_YN": "N",
+            "PRCS_DVSN": "00",
+            "CTX_AREA_FK100": "",
+            "CTX_AREA_NK100": "",
+        }
+        return self._paged_inquiry(url, "VTTC8434R", params)
@@ -2,30 +2,70 @@
 import json
 import asyncio
 import websockets
+import time
 import logging
 import requests
-from datetime import datetime, timedelta, time as dtime
+from base64 import b64decode
+from cryptography.hazmat.primitives import padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from datetime import datetime, timedelta
 from requests.exceptions import RequestException
 from websockets.exceptions import ConnectionClosed
-from config.config import R_APP_KEY, R_APP_SECRET, M_APP_KEY, M_APP_SECRET
+from config.config import R_APP_KEY, R_APP_SECRET, M_APP_KEY, M_APP_SECRET, HTS_ID
 from config.condition import SELLING_POINT_UPPER, RISK_MGMT_UPPER
 from utils.slack_logger import SlackLogger
-from database.db_manager import DatabaseManager
+from api.order_book import OrderBookRegistry
+from trading.market_clock import get_market_clock
+from database.async_repository import AsyncApprovalRepository
+from utils.metrics import get_metrics
+from utils.tracing import get_tracer
+from utils.log_setup import bind_log_context
+
+logger = logging.getLogger(__name__)
+
+class NoticeCipher:
+    """체결통보 복호화기. 구독 응답의 key/iv로 한 번 만들어 재사용합니다 (AES-256-CBC)."""
+
+    def __init__(self, key, iv):
+        self.cipher = Cipher(algorithms.AES(key.encode('utf-8')), modes.CBC(iv.encode('utf-8')))
+
+    def decrypt(self, cipher_text):
+        decryptor = self.cipher.decryptor()
+        padded = decryptor.update(b64decode(cipher_text)) + decryptor.finalize()
+        unpadder = padding.PKCS7(algorithms.AES.block_size).unpadder()
+        return (unpadder.update(padded) + unpadder.finalize()).decode('utf-8')
+
 
 class KISWebSocket:
-    def __init__(self, callback=None, is_mock=True):
-        # 내부 의존성 초기화: DB, 슬랙 로거 등
-        self.db_manager = DatabaseManager()
-        self.slack_logger = SlackLogger()
+    def __init__(self, callback=None, is_mock=True, fill_tracker=None, order_books=None, approval_repo=None,
+                 market_clock=None, slack_logger=None):
+        # 내부 의존성 초기화: DB(전용 스레드에서 실행되는 비동기 리포지토리), 슬랙 로거 등
+        self.approval_repo = approval_repo if approval_repo else AsyncApprovalRepository()
+        self.slack_logger = slack_logger if slack_logger else SlackLogger()
+        # 장 구분/시간 구간 플래그 (틱마다 시스템 시계를 읽지 않음)
+        self.market_clock = market_clock if market_clock else get_market_clock()
+        self.metrics = get_metrics()
+        self.tracer = get_tracer()
         self.callback = callback  # 매도 주문 콜백 함수
         self.is_mock = is_mock
 
+        # 실시간 체결통보 (FillTracker로 전달)
+        self.fill_tracker = fill_tracker
+        self.notice_tr_id = "H0STCNI9" if is_mock else "H0STCNI0"
+        self.notice_cipher = None
+
+        # 종목별 10단계 호가창 (H0STASP0 프레임으로 제자리 갱신)
+        self.order_books = order_books if order_books else OrderBookRegistry()
+
         # 웹소켓 관련 속성
         self.websocket = None
         self.is_connected = False
         self.subscribed_tickers = set()
+        self.prewarmed = set()       # 장 시작 전 호가창을 미리 받기 위해 구독한 매수 후보 종목
         self.ticker_queues = {}      # 종목별 메시지 큐
         self.active_tasks = {}       # 종목별 모니터링 태스크
+        self.monitored = {}          # 종목별 모니터링 중인 세션 정보 튜플
+        self.receiver_task = None
         self.background_tasks = set()  # 전체 백그라운드 태스크 집합
 
         # 승인 및 연결 헤더 관련
@@ -39,16 +79,17 @@ class KISWebSocket:
 
         # 종목별 락 관리 (매도 처리 시 동시 접근 방지)
         self.locks = {}
-        self.LOCK_TIMEOUT = 10  # 초
+        self.LOCK_TIMEOUT = 10  # 초 (락 획득 대기에만 적용, 매도 자체는 제한하지 않음)
+        self.selling = set()  # 매도 스레드가 실행 중인 세션 ID
 
         # 메시지 수신용 큐
         self.message_queue = asyncio.Queue()
 
     async def _get_approval(self, app_key, app_secret, approval_type, max_retries=3, retry_delay=5):
         """웹소켓 인증키(approval key) 발급 및 캐싱 처리"""
-        cached_approval, cached_expires_at = self.db_manager.get_approval(approval_type)
+        cached_approval, cached_expires_at = await self.approval_repo.get_approval(approval_type)
         if cached_approval and cached_expires_at > datetime.utcnow():
-            logging.info("Using cached %s approval", approval_type)
+            logger.info("Using cached %s approval", approval_type)
             return cached_approval, cached_expires_at
 
         url = "https://openapi.koreainvestment.com:9443/oauth2/Approval"
@@ -67,17 +108,17 @@ class KISWebSocket:
                 if "approval_key" in approval_data:
                     self.approval_key = approval_data["approval_key"]
                     expires_at = datetime.utcnow() + timedelta(seconds=86400)
-                    self.db_manager.save_approval(approval_type, self.approval_key, expires_at)
-                    logging.info("Obtained %s approval on attempt %d", approval_type, attempt+1)
+                    await self.approval_repo.save_approval(approval_type, self.approval_key, expires_at)
+                    logger.info("Obtained %s approval on attempt %d", approval_type, attempt+1)
                     return self.approval_key, expires_at
                 else:
-                    logging.warning("Unexpected approval response on attempt %d: %s", attempt+1, approval_data)
+                    logger.warning("Unexpected approval response on attempt %d: %s", attempt+1, approval_data)
             except RequestException as e:
-                logging.error("Error fetching %s approval on attempt %d: %s", approval_type, attempt+1, e)
+                logger.error("Error fetching %s approval on attempt %d: %s", approval_type, attempt+1, e)
                 if attempt < max_retries - 1:
                     await asyncio.sleep(retry_delay)
                 else:
-                    logging.error("Max retries reached for %s approval.", approval_type)
+                    logger.error("Max retries reached for %s approval.", approval_type)
         return None, None
 
     async def _ensure_approval(self, is_mock):
@@ -95,7 +136,7 @@ class KISWebSocket:
         """웹소켓 연결을 수립합니다."""
         try:
             if self.websocket and not self.websocket.closed:
-                logging.info("WebSocket already connected.")
+                logger.info("WebSocket already connected.")
                 return
             self.approval_key = await self._ensure_approval(self.is_mock)
             url = 'ws://ops.koreainvestment.com:31000/tryitout/H0STASP0'
@@ -107,10 +148,13 @@ class KISWebSocket:
             }
             self.websocket = await websockets.connect(url, extra_headers=self.connect_headers)
             self.is_connected = True
-            logging.info("WebSocket connected successfully.")
+            logger.info("WebSocket connected successfully.")
+            if self.fill_tracker:
+                await self.subscribe_fill_notice()
         except Exception as e:
-            logging.error("WebSocket connection failed: %s", e)
+            logger.error("WebSocket connection failed: %s", e)
             self.is_connected = False
+            self._set_notice_alive(False)
 
     async def close(self):
         """웹소켓 연결 종료 및 자원 정리"""
@@ -118,12 +162,13 @@ class KISWebSocket:
             await self.websocket.close()
             self.is_connected = False
             self.subscribed_tickers.clear()
-            logging.info("WebSocket connection closed.")
+            self._set_notice_alive(False)
+            logger.info("WebSocket connection closed.")
 
-    async def subscribe_ticker(self, ticker):
-        """종목 구독 요청"""
-        if ticker in self.subscribed_tickers:
-            logging.info("Ticker %s already subscribed.", ticker)
+    async def subscribe_ticker(self, ticker, force=False):
+        """종목 구독 요청 (force=True면 재연결 후 재구독처럼 이미 구독 중이어도 다시 요청)"""
+        if ticker in self.subscribed_tickers and not force:
+            logger.info("Ticker %s already subscribed.", ticker)
             return
         self.connect_headers['tr_type'] = "1"
         request_data = {
@@ -133,14 +178,14 @@ class KISWebSocket:
         try:
             await self.websocket.send(json.dumps(request_data))
             self.subscribed_tickers.add(ticker)
-            logging.info("Subscribed to ticker: %s", ticker)
+            logger.info("Subscribed to ticker: %s", ticker)
         except Exception as e:
-            logging.error("Failed to subscribe ticker %s: %s", ticker, e)
+            logger.error("Failed to subscribe ticker %s: %s", ticker, e)
 
     async def unsubscribe_ticker(self, ticker):
         """종목 구독 해제 요청"""
         if ticker not in self.subscribed_tickers:
-            logging.info("Ticker %s is not subscribed.", ticker)
+            logger.info("Ticker %s is not subscribed.", ticker)
             return
         self.connect_headers['tr_type'] = "2"
         request_data = {
@@ -150,9 +195,43 @@ class KISWebSocket:
         try:
             await self.websocket.send(json.dumps(request_data))
             self.subscribed_tickers.remove(ticker)
-            logging.info("Unsubscribed ticker: %s", ticker)
+            self.order_books.discard(ticker)
+            logger.info("Unsubscribed ticker: %s", ticker)
+        except Exception as e:
+            logger.error("Failed to unsubscribe ticker %s: %s", ticker, e)
+
+    async def subscribe_fill_notice(self):
+        """실시간 체결통보 구독 요청 (구독 응답의 key/iv는 _message_receiver에서 캐싱)"""
+        if not HTS_ID:
+            logger.warning("HTS_ID is not set; fill notices disabled, FillTracker will poll.")
+            return
+        request_data = {
+            "header": {**self.connect_headers, "tr_type": "1"},
+            "body": {"input": {"tr_id": self.notice_tr_id, "tr_key": HTS_ID}}
+        }
+        try:
+            await self.websocket.send(json.dumps(request_data))
+            logger.info("Subscribed to fill notices: %s", self.notice_tr_id)
         except Exception as e:
-            logging.error("Failed to unsubscribe ticker %s: %s", ticker, e)
+            logger.error("Failed to subscribe fill notices: %s", e)
+
+    def _set_notice_alive(self, alive):
+        if self.fill_tracker:
+            self.fill_tracker.set_feed_alive(alive)
+
+    def _handle_fill_notice(self, data):
+        """체결통보 프레임(암호화 여부|tr_id|건수|데이터)을 복호화해 FillTracker에 전달합니다."""
+        encrypted, _, _, payload = data.split('|', 3)
+        if encrypted == '1':
+            if self.notice_cipher is None:
+                logger.error("Fill notice received before cipher key; dropped.")
+                return
+            payload = self.notice_cipher.decrypt(payload)
+        self.fill_tracker.handle_notice(payload.split('^'))
+
+    def get_order_book(self, ticker):
+        """종목의 최근 호가창 복사본을 반환합니다. 수신 전이면 None."""
+        return self.order_books.snapshot(ticker)
 
     async def add_new_stock_to_monitoring(self, session_id, ticker, name, qty, price, start_date, target_date):
         """새 종목을 모니터링 대상으로 추가합니다."""
@@ -163,10 +242,90 @@ class KISWebSocket:
         task.add_done_callback(self.background_tasks.discard)
         self.background_tasks.add(task)
         self.active_tasks[ticker] = task
-        logging.info("Added monitoring task for ticker: %s", ticker)
+        self.monitored[ticker] = (session_id, ticker, name, qty, price, start_date, target_date)
+        logger.info("Added monitoring task for ticker: %s", ticker)
+
+    async def stop_monitoring(self, ticker, unsubscribe=True):
+        """종목 모니터링 태스크를 정리하고 구독을 해제합니다."""
+        task = self.active_tasks.pop(ticker, None)
+        self.monitored.pop(ticker, None)
+        if task and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+        if unsubscribe:
+            await self.unsubscribe_ticker(ticker)
+            self.ticker_queues.pop(ticker, None)
+        logger.info("Stopped monitoring ticker: %s", ticker)
+
+    async def prewarm(self, tickers):
+        """
+        장 시작 전 워밍업: 연결(승인키 포함)을 확인하고 매수 후보 종목의 호가창을 미리 구독해
+        첫 매수 주문 가격을 호가창 기준으로 바로 정할 수 있게 합니다.
+
+        Returns:
+            dict: {'connected', 'subscribed'}
+        """
+        if not self.websocket or self.websocket.closed:
+            await self.connect_websocket()
+        if not self.is_connected:
+            return {'connected': False, 'subscribed': []}
+        self.ensure_receiver()
+        subscribed = []
+        for ticker in tickers:
+            if ticker in self.subscribed_tickers:
+                continue
+            await self.subscribe_ticker(ticker)
+            if ticker in self.subscribed_tickers:
+                self.prewarmed.add(ticker)
+                subscribed.append(ticker)
+        return {'connected': True, 'subscribed': subscribed}
+
+    async def release_prewarmed(self):
+        """워밍업으로 구독한 종목 중 세션 모니터링 대상이 되지 않은 종목의 구독을 해제합니다."""
+        released = [t for t in self.prewarmed if t not in self.monitored]
+        for ticker in released:
+            await self.unsubscribe_ticker(ticker)
+        self.prewarmed.clear()
+        return released
+
+    def ensure_receiver(self):
+        """수신 코루틴이 없거나 종료됐으면 다시 시작합니다."""
+        if self.receiver_task is None or self.receiver_task.done():
+            self.receiver_task = asyncio.create_task(self._message_receiver())
+
+    async def sync_monitoring(self, sessions_info):
+        """
+        원하는 세션 목록과 현재 모니터링 대상을 비교해 구독/해제를 일괄 처리합니다.
+        세션 정보(수량, 평단가 등)가 바뀐 종목은 구독은 유지한 채 모니터링 태스크만 교체합니다.
+
+        Args:
+            sessions_info: List of tuples (session_id, ticker, name, quantity, avr_price, start_date, target_date)
+
+        Returns:
+            dict: {'added': [...], 'removed': [...], 'updated': [...]}
+        """
+        desired = {info[1]: tuple(info) for info in sessions_info if info[3]}
+        removed = [t for t in self.monitored if t not in desired]
+        added, updated = [], []
+        for ticker, info in desired.items():
+            task = self.active_tasks.get(ticker)
+            if task is None or task.done():
+                added.append(ticker)
+            elif self.monitored.get(ticker) != info:
+                updated.append(ticker)
+
+        if removed:
+            await asyncio.gather(*(self.stop_monitoring(t) for t in removed))
+        if updated:
+            await asyncio.gather(*(self.stop_monitoring(t, unsubscribe=False) for t in updated))
+        if added or updated:
+            await asyncio.gather(*(self.add_new_stock_to_monitoring(*desired[t]) for t in added + updated))
+        if added or removed or updated:
+            logger.info("Monitoring synced - added: %s, removed: %s, updated: %s", added, removed, updated)
+        return {'added': added, 'removed': removed, 'updated': updated}
 
     async def _monitor_ticker(self, session_id, ticker, name, quantity, avr_price, target_date):
         """개별 종목에 대한 모니터링 코루틴"""
+        bind_log_context(ticker=ticker, session_id=session_id)
         if ticker not in self.ticker_queues:
             self.ticker_queues[ticker] = asyncio.Queue()
         self.slack_logger.send_log(
@@ -176,20 +335,23 @@ class KISWebSocket:
         )
         while self.is_connected and ticker in self.subscribed_tickers:
             try:
-                recvvalue = await asyncio.wait_for(self.ticker_queues[ticker].get(), timeout=5.0)
+                received_at, recvvalue = await asyncio.wait_for(self.ticker_queues[ticker].get(), timeout=5.0)
                 sell_completed = await self.sell_condition(recvvalue, session_id, ticker, name, quantity, avr_price, target_date)
+                # 틱 수신부터 매도 판단(주문 포함)까지
+                self.metrics.observe('ws_tick_to_decision_seconds', time.perf_counter() - received_at,
+                                     sold=bool(sell_completed))
                 if sell_completed:
                     await self.unsubscribe_ticker(ticker)
-                    logging.info("Sell completed for ticker: %s", ticker)
+                    logger.info("Sell completed for ticker: %s", ticker)
                     return True
                 self.ticker_queues[ticker].task_done()
             except asyncio.TimeoutError:
                 continue
             except asyncio.CancelledError:
-                logging.info("Monitoring cancelled for ticker: %s", ticker)
+                logger.info("Monitoring cancelled for ticker: %s", ticker)
                 return False
             except Exception as e:
-                logging.error("Monitoring error for ticker %s: %s", ticker, e)
+                logger.error("Monitoring error for ticker %s: %s", ticker, e)
                 continue
         return False
 
@@ -211,55 +373,29 @@ class KISWebSocket:
         try:
             target_price = int(recvvalue[15])
         except Exception as e:
-            logging.error("Error parsing target price for ticker %s: %s", ticker, e)
+            logger.error("Error parsing target price for ticker %s: %s", ticker, e)
             return False
 
-        if ticker not in self.locks:
-            self.locks[ticker] = asyncio.Lock()
+        # 이전 틱에서 시작한 매도가 아직 진행 중이면 이번 틱은 무시
+        if session_id in self.selling:
+            return False
 
-        now = datetime.now()
-        today = now.date()
-        current_time = now.time()
-        sell_time = dtime(15, 10)
+        clock = self.market_clock
         sell_reason = None
-        if today > target_date and current_time >= sell_time:
+        if clock.today > target_date and clock.in_window('forced_sell'):
             sell_reason = {"reason": "Expired holding period", "target_date": str(target_date)}
         elif target_price > (avr_price * SELLING_POINT_UPPER):
             sell_reason = {"reason": "Profit target reached", "target_price": target_price, "condition": avr_price * SELLING_POINT_UPPER}
         elif target_price < (avr_price * RISK_MGMT_UPPER):
             sell_reason = {"reason": "Risk management trigger", "target_price": target_price, "condition": avr_price * RISK_MGMT_UPPER}
+        if not sell_reason:
+            return False
 
+        if ticker not in self.locks:
+            self.locks[ticker] = asyncio.Lock()
+        lock = self.locks[ticker]
         try:
-            async with asyncio.timeout(self.LOCK_TIMEOUT):
-                async with self.locks[ticker]:
-                    if sell_reason:
-                        try:
-                            # 매도 주문 콜백 (동기 함수라면 asyncio.to_thread() 사용 가능)
-                            sell_completed = self.callback(session_id, ticker, quantity, target_price)
-                            await self.unsubscribe_ticker(ticker)
-                            if sell_completed:
-                                self.slack_logger.send_log(
-                                    level="WARNING",
-                                    message="Sell condition met",
-                                    context={"ticker": ticker, **sell_reason}
-                                )
-                                await self.stop_monitoring(ticker)
-                                return True
-                        except Exception as e:
-                            try:
-                                await self.subscribe_ticker(ticker)
-                                self.slack_logger.send_log(
-                                    level="ERROR",
-                                    message=f"Sell failed; subscription restored: {e}",
-                                    context={"ticker": ticker}
-                                )
-                            except Exception as sub_error:
-                                self.slack_logger.send_log(
-                                    level="CRITICAL",
-                                    message="Subscription restoration failed",
-                                    context={"ticker": ticker, "error": str(sub_error)}
-                                )
-                            raise e
+            await asyncio.wait_for(lock.acquire(), timeout=self.LOCK_TIMEOUT)
         except asyncio.TimeoutError:
             self.slack_logger.send_log(
                 level="WARNING",
@@ -267,11 +403,56 @@ class KISWebSocket:
                 context={"ticker": ticker}
             )
             return False
+
+        try:
+            if session_id in self.selling:
+                return False
+            try:
+                # 매도 주문 콜백은 주문 대기와 세션 삭제(DB)를 포함하므로 루프 밖 스레드에서 실행
+                self.selling.add(session_id)
+                with self.tracer.span('KISWebSocket.sell', cat='websocket', ticker=ticker,
+                                      reason=sell_reason['reason']):
+                    sell_completed = await asyncio.to_thread(self._run_sell, session_id, ticker, quantity, target_price)
+                    await self.unsubscribe_ticker(ticker)
+                if sell_completed:
+                    self.slack_logger.send_log(
+                        level="WARNING",
+                        message="Sell condition met",
+                        context={"ticker": ticker, **sell_reason}
+                    )
+                    await self.stop_monitoring(ticker)
+                    return True
+            except Exception as e:
+                try:
+                    await self.subscribe_ticker(ticker)
+                    self.slack_logger.send_log(
+                        level="ERROR",
+                        message=f"Sell failed; subscription restored: {e}",
+                        context={"ticker": ticker}
+                    )
+                except Exception as sub_error:
+                    self.slack_logger.send_log(
+                        level="CRITICAL",
+                        message="Subscription restoration failed",
+                        context={"ticker": ticker, "error": str(sub_error)}
+                    )
+                raise e
         finally:
-            if ticker in self.locks and not self.locks[ticker].locked():
+            lock.release()
+            if self.locks.get(ticker) is lock and not lock.locked():
                 del self.locks[ticker]
         return False
 
+    def _run_sell(self, session_id, ticker, quantity, price):
+        """
+        매도 콜백을 실행하고 끝나면 selling에서 세션을 뺍니다.
+        대기 중인 코루틴이 취소되어도 스레드는 끝까지 실행되므로 해제는 스레드 쪽에서 합니다.
+        """
+        try:
+            return self.callback(session_id, ticker, quantity, price)
+        finally:
+            self.selling.discard(session_id)
+
     async def _message_receiver(self):
         """웹소켓 메시지 수신을 전담하는 코루틴"""
         retry_count = 0
@@ -281,37 +462,55 @@ class KISWebSocket:
                 if not self.is_connected:
                     try:
                         await self.connect_websocket()
-                        for ticker in self.subscribed_tickers:
-                            await self.subscribe_ticker(ticker)
+                        for ticker in list(self.subscribed_tickers):
+                            await self.subscribe_ticker(ticker, force=True)
                     except Exception as e:
-                        logging.error("Reconnection failed: %s", e)
+                        logger.error("Reconnection failed: %s", e)
                         await asyncio.sleep(5)
                         continue
                 data = await self.websocket.recv()
+                received_at = time.perf_counter()
                 if '"tr_id":"PINGPONG"' in data:
                     await self.websocket.pong(data)
                     continue
                 if "SUBSCRIBE SUCCESS" in data:
                     data_dict = json.loads(data)
                     ticker = data_dict['header']['tr_key']
+                    if data_dict['header'].get('tr_id') == self.notice_tr_id and self.fill_tracker:
+                        output = data_dict.get('body', {}).get('output', {})
+                        self.notice_cipher = NoticeCipher(output['key'], output['iv'])
+                        self._set_notice_alive(True)
+                    continue
+                if data.startswith((f"0|{self.notice_tr_id}|", f"1|{self.notice_tr_id}|")):
+                    if self.fill_tracker:
+                        self._handle_fill_notice(data)
                     continue
                 recvvalue = data.split('^')
                 if len(recvvalue) > 1:
                     ticker = recvvalue[0].split('|')[-1]
                     if ticker in self.subscribed_tickers:
-                        await self.ticker_queues[ticker].put(recvvalue)
+                        try:
+                            self.order_books.update(ticker, recvvalue)
+                        except (IndexError, ValueError) as e:
+                            logger.error("Malformed orderbook frame for %s: %s", ticker, e)
+                        # 워밍업으로 선구독한 종목은 호가창만 갱신 (모니터링 큐 없음)
+                        ticker_queue = self.ticker_queues.get(ticker)
+                        if ticker_queue is not None:
+                            await ticker_queue.put((received_at, recvvalue))
                 retry_count = 0  # 성공 시 초기화
             except ConnectionClosed:
                 retry_count += 1
-                logging.error("WebSocket connection closed. Reconnecting...")
+                logger.error("WebSocket connection closed. Reconnecting...")
                 self.is_connected = False
+                self._set_notice_alive(False)
                 self.websocket = None
                 await asyncio.sleep(2 ** retry_count)  # 지수 백오프
                 continue
             except Exception as e:
                 retry_count += 1
-                logging.error("Receiver error: %s", e)
+                logger.error("Receiver error: %s", e)
                 self.is_connected = False
+                self._set_notice_alive(False)
                 self.websocket = None
                 await asyncio.sleep(2 ** retry_count)  # 지수 백오프
                 continue
@@ -328,16 +527,16 @@ class KISWebSocket:
             for session in sessions_info:
                 session_id, ticker, name, qty, price, start_date, target_date = session
                 await self.add_new_stock_to_monitoring(session_id, ticker, name, qty, price, start_date, target_date)
-            asyncio.create_task(self._message_receiver())
+            self.ensure_receiver()
             while self.background_tasks:
                 done, _ = await asyncio.wait(self.background_tasks, return_when=asyncio.FIRST_COMPLETED)
                 for task in done:
                     try:
                         await task
                     except Exception as e:
-                        logging.error("Task error: %s", e)
+                        logger.error("Task error: %s", e)
             results = await asyncio.gather(*self.background_tasks, return_exceptions=True)
-            logging.info("Monitoring results: %s", results)
+            logger.info("Monitoring results: %s", results)
             return results
         except Exception as e:
-            logging.error("Real-time monitoring error: %s", e)
+            logger.error("Real-time monitoring error: %s", e)
@@ -1,7 +1,5 @@
-import pandas as pd
 import datetime
 import time
-from pykrx import stock
 from utils.date_utils import DateUtils
 
 
@@ -11,6 +9,8 @@ class KRXApi:
         self.date_utils = DateUtils()
         
     def get_OHLCV(self, ticker, day_ago): 
+        # pykrx는 pandas까지 함께 불러와 느리므로 처음 조회할 때 불러옵니다.
+        from pykrx import stock
         time.sleep(1)
         # 오늘 날짜
         today = datetime.datetime.now()
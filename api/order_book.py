@@ -0,0 +1,141 @@
+# api/order_book.py
+import time
+import threading
+from array import array
+
+BOOK_LEVELS = 10
+
+# H0STASP0(주식호가) 필드 인덱스
+ASKP_START = 3          # ASKP1 ~ ASKP10
+BIDP_START = 13         # BIDP1 ~ BIDP10
+ASKP_RSQN_START = 23    # ASKP_RSQN1 ~ ASKP_RSQN10
+BIDP_RSQN_START = 33    # BIDP_RSQN1 ~ BIDP_RSQN10
+TOTAL_ASKP_RSQN = 43
+TOTAL_BIDP_RSQN = 44
+
+
+class OrderBook:
+    """
+    종목별 10단계 호가창.
+    고정 크기 배열을 프레임마다 제자리 갱신하고, 누적 잔량을 함께 계산해 두어
+    최우선 호가/스프레드/누적 잔량/불균형 조회를 O(1)로 처리합니다.
+    """
+
+    def __init__(self, ticker):
+        self.ticker = ticker
+        self.ask_prices = array('l', [0] * BOOK_LEVELS)
+        self.bid_prices = array('l', [0] * BOOK_LEVELS)
+        self.ask_qty = array('l', [0] * BOOK_LEVELS)
+        self.bid_qty = array('l', [0] * BOOK_LEVELS)
+        self.ask_cum = array('l', [0] * BOOK_LEVELS)
+        self.bid_cum = array('l', [0] * BOOK_LEVELS)
+        self.total_ask_qty = 0
+        self.total_bid_qty = 0
+        self.bsop_hour = None
+        self.updated_at = 0.0  # time.monotonic()
+        self.lock = threading.Lock()
+
+    def update(self, fields):
+        """
+        H0STASP0 프레임('^' 분리 필드)으로 호가창을 갱신합니다.
+        fields[0]은 '0|H0STASP0|001|종목코드' 형태여도 무방합니다.
+        """
+        with self.lock:
+            ask_cum = bid_cum = 0
+            for i in range(BOOK_LEVELS):
+                self.ask_prices[i] = int(fields[ASKP_START + i])
+                self.bid_prices[i] = int(fields[BIDP_START + i])
+                ask = int(fields[ASKP_RSQN_START + i])
+                bid = int(fields[BIDP_RSQN_START + i])
+                self.ask_qty[i] = ask
+                self.bid_qty[i] = bid
+                ask_cum += ask
+                bid_cum += bid
+                self.ask_cum[i] = ask_cum
+                self.bid_cum[i] = bid_cum
+            self.total_ask_qty = int(fields[TOTAL_ASKP_RSQN])
+            self.total_bid_qty = int(fields[TOTAL_BIDP_RSQN])
+            self.bsop_hour = fields[1]
+            self.updated_at = time.monotonic()
+
+    @property
+    def is_ready(self):
+        return self.updated_at > 0
+
+    @property
+    def best_ask(self):
+        return self.ask_prices[0]
+
+    @property
+    def best_bid(self):
+        return self.bid_prices[0]
+
+    @property
+    def spread(self):
+        return self.ask_prices[0] - self.bid_prices[0]
+
+    @property
+    def mid_price(self):
+        return (self.ask_prices[0] + self.bid_prices[0]) / 2
+
+    def ask_depth(self, levels=BOOK_LEVELS):
+        """매도 1~levels호가 누적 잔량"""
+        return self.ask_cum[min(levels, BOOK_LEVELS) - 1]
+
+    def bid_depth(self, levels=BOOK_LEVELS):
+        """매수 1~levels호가 누적 잔량"""
+        return self.bid_cum[min(levels, BOOK_LEVELS) - 1]
+
+    def imbalance(self, levels=BOOK_LEVELS):
+        """
+        매수/매도 잔량 불균형 (-1 ~ 1). 양수면 매수 잔량 우위.
+        """
+        bid = self.bid_depth(levels)
+        ask = self.ask_depth(levels)
+        total = bid + ask
+        return (bid - ask) / total if total else 0.0
+
+    def age(self):
+        """마지막 갱신 이후 경과 시간(초)"""
+        return time.monotonic() - self.updated_at if self.updated_at else float('inf')
+
+    def snapshot(self):
+        """다른 스레드에서 안전하게 읽을 수 있는 복사본을 반환합니다."""
+        copy = OrderBook(self.ticker)
+        with self.lock:
+            copy.ask_prices[:] = self.ask_prices
+            copy.bid_prices[:] = self.bid_prices
+            copy.ask_qty[:] = self.ask_qty
+            copy.bid_qty[:] = self.bid_qty
+            copy.ask_cum[:] = self.ask_cum
+            copy.bid_cum[:] = self.bid_cum
+            copy.total_ask_qty = self.total_ask_qty
+            copy.total_bid_qty = self.total_bid_qty
+            copy.bsop_hour = self.bsop_hour
+            copy.updated_at = self.updated_at
+        return copy
+
+
+class OrderBookRegistry:
+    """종목코드별 OrderBook 보관소. 웹소켓 수신 루프와 주문 스레드가 공유합니다."""
+
+    def __init__(self):
+        self.books = {}
+
+    def update(self, ticker, fields):
+        book = self.books.get(ticker)
+        if book is None:
+            book = self.books[ticker] = OrderBook(ticker)
+        book.update(fields)
+        return book
+
+    def get(self, ticker):
+        return self.books.get(ticker)
+
+    def snapshot(self, ticker):
+        """최근 호가창 복사본. 수신 이력이 없으면 None."""
+        book = self.books.get(ticker)
+        return book.snapshot() if book and book.is_ready else None
+
+    def discard(self, ticker):
+        self.books.pop(ticker, None)
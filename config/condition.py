@@ -34,6 +34,88 @@ SELL_WAIT = 3
 DAYS_LATER = 7 #마지막 매수로부터 4(7-3)일째 매도
 
 
+######################################################
+##################    주문 관리   #####################
+######################################################
+
+# 주문 에스컬레이션 정책: (주문 방식, 기준가 대비 유리한 방향 호가 틱 수, 체결 대기 초)
+# 주문 방식 - 'limit': 지정가, 'marketable': 호가창 기준 즉시 체결 가능한 지정가, 'market': 시장가
+# 마지막 단계는 전량 체결까지 반복
+ORDER_ESCALATION = {
+    'buy': [('marketable', 0, BUY_WAIT), ('marketable', 2, BUY_WAIT), ('market', 0, BUY_WAIT)],
+    'sell': [('marketable', 0, SELL_WAIT), ('marketable', 2, SELL_WAIT), ('market', 0, SELL_WAIT)],
+}
+# 주문 1건당 최대 발주(정정 포함) 횟수
+ORDER_MAX_ATTEMPTS = 10
+# 취소 주문 후 재주문까지 대기 / 초
+ORDER_CANCEL_SETTLE = 1
+# 호가창이 없거나 잔량이 부족할 때 기준가에 더할 여유 틱 수
+PRICING_SLIPPAGE_TICKS = 2
+# 실시간 호가창을 최신으로 인정하는 시간 / 초
+PRICING_MAX_BOOK_AGE = 3
+
+
+######################################################
+##################    모니터링   ######################
+######################################################
+
+# 세션 변경 알림이 없어도 DB를 다시 읽어 모니터링 대상을 맞추는 주기 / 초
+SESSION_RECONCILE_INTERVAL = 5
+
+# 메모리 세션 저장소가 외부 변경을 반영하려고 DB를 다시 읽는 주기 / 초
+SESSION_STORE_REFRESH_INTERVAL = 30
+
+# 이벤트 루프 감시 - 지연 측정 주기 / 초
+LOOP_LAG_INTERVAL = 0.1
+# 루프가 이 시간 이상 막히면 루프 스레드 스택을 캡처 / 초
+LOOP_BLOCK_THRESHOLD = 0.1
+# 캡처할 스택 깊이 (안쪽 프레임부터)
+LOOP_BLOCK_STACK_DEPTH = 8
+# 일자별 보고에 포함할 차단 지점 수
+LOOP_BLOCK_REPORT_TOP = 10
+
+
+######################################################
+##################    체결 통보   #####################
+######################################################
+
+# 체결통보 웹소켓이 끊겼을 때 일괄 체결조회 주기 / 초
+FILL_POLL_INTERVAL = 2
+# 체결통보 수신 전 도착한 체결 내역 보관 시간 / 초
+FILL_BACKLOG_TTL = 60
+
+
+######################################################
+##################    거래 캘린더   ###################
+######################################################
+
+# 영업일 캘린더를 미리 계산할 연도 범위
+CALENDAR_START_YEAR = 2020
+CALENDAR_END_YEAR = 2035
+# 공휴일 외 KRX 휴장일 (임시공휴일 등, 'YYYY-MM-DD')
+KRX_EXTRA_CLOSURES = ['2024-10-01']
+
+
+######################################################
+##################    장 운영 시간   ##################
+######################################################
+
+# KRX 장 구분 시작 시각 (영업일 기준, 마지막 구분은 자정까지)
+MARKET_PHASES = [
+    ('closed', '00:00'),
+    ('pre_open', '08:30'),         # 장전 시간외 + 장전 동시호가
+    ('continuous', '09:00'),       # 정규장 접속매매
+    ('closing_auction', '15:20'),  # 장 마감 동시호가
+    ('after_hours', '15:30'),      # 장후 시간외 (종가/단일가)
+    ('closed', '18:00'),
+]
+# 시간 구간 플래그 (시작, 끝) - 끝은 포함하지 않음
+MARKET_WINDOWS = {
+    'strategy_check': ('15:10', '15:11'),  # 추세 매매 조건 확인 시각
+    'forced_sell': ('15:10', '24:00'),     # 보유기간 만료 종목 매도 가능 시각
+}
+
+
 ######################################################
 ##################    스케줄링   ######################
 ######################################################
@@ -55,6 +137,23 @@ ORDER_MINUTE_2 = 30
 # ORDER_HOUR_3 = 15
 # ORDER_MINUTE_3 = 00
 
+# 정시 주문 발송: 매수 시각 DISPATCH_LEAD초 전에 요청을 미리 만들고 정각에 전송
+DISPATCH_LEAD = 30            # 요청 준비 시작 (매수 시각 기준 몇 초 전)
+DISPATCH_SPIN = 0.005         # 목표 시각 직전 바쁜 대기 구간 / 초 (그 전까지는 sleep)
+DISPATCH_RATE_LIMIT_RETRY = 0.2  # 초당 거래건수 초과 응답 시 재전송 간격 / 초
+SESSION_UPDATE_SETTLE = 0.8   # 주문 후 체결/잔고 조회 전 대기 / 초 (세션 업데이트 배치당 한 번)
+SESSION_ORDER_WORKERS = 8     # 세션별 매수 준비/전송을 동시에 처리할 스레드 수 (실제 속도는 KIS 유량 제한이 결정)
+
+# 장 시작 전 워밍업 (토큰/해시키, HTTP/DB/웹소켓 연결, 매수 후보 시세/호가창, 주문 템플릿)
+WARMUP_HOUR = 8
+WARMUP_MINUTE = 50
+WARMUP_MAX_TICKERS = 10       # 워밍업에서 시세 조회/호가창 선구독할 최대 매수 후보 수
+WARMUP_DB_CONNECTIONS = 3     # 미리 열어 확인해 둘 DB 연결 수
+WARMUP_TIMEOUT = 30           # 웹소켓 워밍업 대기 시간 / 초
+# 세션이 되지 않은 선구독 종목 해제 시각 (마지막 매수 작업 이후)
+WARMUP_RELEASE_HOUR = 10
+WARMUP_RELEASE_MINUTE = 40
+
 
 
 ###############################################################
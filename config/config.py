@@ -16,11 +16,20 @@ M_APP_SECRET = os.getenv('M_APP_SECRET')
 R_ACCOUNT_NUMBER = os.getenv('R_ACCOUNT_NUMBER')
 M_ACCOUNT_NUMBER = os.getenv('M_ACCOUNT_NUMBER')
 
+# HTS ID (실시간 체결통보 구독 키)
+HTS_ID = os.getenv('HTS_ID')
+
 # API URLs
 BASE_URL = "https://openapi.koreainvestment.com:9443"
+# REST 호출 유량 제한 (앱키 기준, KISAuth를 공유하는 모든 스레드가 같은 버킷 사용) / 초당 건수
+KIS_RATE_LIMIT_REAL = float(os.getenv('KIS_RATE_LIMIT_REAL', 18))   # 실전 서버 (한도 20)
+KIS_RATE_LIMIT_MOCK = float(os.getenv('KIS_RATE_LIMIT_MOCK', 2))    # 모의 서버
+KIS_MAX_PAGES = 20                                                   # 연속조회 최대 페이지 수
 
-# Database - sqlite3
-DB_NAME = "quant_trading.db"
+# Database - 저장소 선택 ('mariadb' 또는 'sqlite')
+DB_BACKEND = os.getenv('DB_BACKEND', 'mariadb')
+# Database - sqlite3 (파일 경로 또는 ':memory:')
+DB_NAME = os.getenv('SQLITE_DB', "quant_trading.db")
 # Database - mariadb
 def validate_db_config(config):
     required_keys = ['host', 'user', 'password', 'database', 'port']
@@ -40,5 +49,49 @@ DB_CONFIG = validate_db_config({
     'collation': 'utf8mb4_general_ci'
 })
 
+# Database - 커넥션 풀
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 8))          # 최대 연결 수
+DB_POOL_TIMEOUT = 10                                      # 빈 연결 대기 시간 / 초
+DB_POOL_VALIDATE_IDLE = 30                                # 이 시간 이상 쉰 연결은 ping 후 사용 / 초
+DB_EXECUTOR_WORKERS = 2                                   # 비동기 리포지토리용 DB 전용 스레드 수
+DB_BATCH_CHUNK_SIZE = 500                                 # multi-row INSERT 한 번(한 트랜잭션)에 쓰는 행 수
+UPPER_LIMIT_PARTITION_MONTHS_AHEAD = 3                    # upper_limit_stocks 월 파티션을 미리 만들어 둘 개월 수
+
 # Slack
-SLACK_TOKEN = os.getenv('SLACK_TOKEN')
\ No newline at end of file
+SLACK_TOKEN = os.getenv('SLACK_TOKEN')
+SLACK_QUEUE_SIZE = 1000          # 전송 대기 메시지 최대 개수 (넘치면 낮은 등급부터 버림)
+SLACK_BATCH_LINGER = 1.0         # 배치로 묶기 위해 기다리는 시간 / 초 (CRITICAL은 즉시)
+SLACK_MAX_BLOCKS = 50            # Slack 메시지 1건당 최대 블록 수
+SLACK_MIN_INTERVAL = 1.0         # 채널별 전송 최소 간격 / 초 (chat.postMessage 제한)
+
+# Metrics - 지연 시간 계측 (비활성화 시 계측 호출은 즉시 반환)
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', '0') == '1'
+METRICS_PORT = int(os.getenv('METRICS_PORT', 0))         # 127.0.0.1:포트/metrics (0이면 엔드포인트 없음)
+METRICS_SNAPSHOT_PATH = os.getenv('METRICS_SNAPSHOT_PATH')  # JSON 스냅샷 파일 경로 (없으면 쓰지 않음)
+METRICS_SNAPSHOT_INTERVAL = 60                            # 스냅샷 파일 갱신 주기 / 초
+METRICS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)  # 히스토그램 버킷 / 초
+
+# Tracing - 구간 추적 (Chrome trace / Perfetto JSON, 일자별 파일)
+TRACE_ENABLED = os.getenv('TRACE_ENABLED', '0') == '1'
+TRACE_DIR = os.getenv('TRACE_DIR', 'traces')              # trace-YYYYMMDD.json을 쓰는 디렉터리
+TRACE_FLUSH_INTERVAL = 1.0                                # 버퍼를 파일에 쓰는 주기 / 초
+TRACE_BUFFER_SIZE = 100000                                # 쓰기 전 보관할 최대 구간 수 (넘치면 오래된 것부터 버림)
+
+# Logging - 큐 기반 비동기 로깅 (JSON lines 파일 + 콘솔)
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+LOG_MODULE_LEVELS = {                                     # 모듈별 레벨 (환경변수 LOG_LEVELS="모듈=레벨,..."로 덮어씀)
+    'urllib3': 'WARNING',
+    'websockets': 'INFO',
+    'apscheduler': 'WARNING',
+    'asyncio': 'WARNING',
+}
+LOG_FILE = os.getenv('LOG_FILE', 'logs/trading.jsonl')    # JSON lines 로그 파일 (빈 값이면 파일 기록 안 함)
+LOG_MAX_BYTES = 20 * 1024 * 1024                          # 로그 파일 회전 크기
+LOG_BACKUP_COUNT = 10                                     # 보관할 회전 파일 수
+LOG_QUEUE_SIZE = 10000                                    # 기록 대기 로그 최대 개수 (넘치면 버림)
+LOG_CONSOLE = os.getenv('LOG_CONSOLE', '1') == '1'        # 콘솔 출력 여부
+
+# Import benchmark - 시작 시간 예산 (python -m utils.import_benchmark)
+IMPORT_TIME_BUDGET = float(os.getenv('IMPORT_TIME_BUDGET', 1.0))  # 진입 모듈 import 허용 시간 / 초
+IMPORT_BENCHMARK_MODULES = ('process.main_process', 'process.test_process', 'extract_hts_kor_isnm')
+IMPORT_LAZY_MODULES = ('pandas', 'pykrx', 'slack_sdk')   # 진입 모듈 import 시 불러오면 안 되는 무거운 패키지
@@ -0,0 +1,130 @@
+# database/async_repository.py
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from config.config import DB_EXECUTOR_WORKERS
+from database.db_connection_manager import DBConnectionManager
+from database.token_repository import TokenRepository
+from database.approval_repository import ApprovalRepository
+from database.stock_repository import StockRepository
+from database.trading_session_repository import TradingSessionRepository
+from utils.metrics import get_metrics
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_db_executor():
+    """DB 전용 실행기(작업 큐 + 전용 스레드)를 반환합니다 (최초 호출 시 생성)."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=DB_EXECUTOR_WORKERS, thread_name_prefix="db")
+    return _executor
+
+
+def shutdown_db_executor(wait=True):
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor:
+        executor.shutdown(wait=wait)
+
+
+class AsyncRepository:
+    """
+    동기 리포지토리의 비동기 래퍼.
+    호출마다 DB 전용 스레드에서 풀 연결을 빌려 리포지토리 메서드를 실행하고 반납하므로
+    이벤트 루프 스레드에서는 DB I/O가 일어나지 않습니다.
+    """
+    repository_class = None
+
+    def __init__(self, pool=None, executor=None):
+        self.pool = pool
+        self.executor = executor
+
+    def _run(self, method, *args, **kwargs):
+        with DBConnectionManager(self.pool) as db:
+            return getattr(self.repository_class(db), method)(*args, **kwargs)
+
+    async def _call(self, method, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        try:
+            return await loop.run_in_executor(
+                self.executor or get_db_executor(), lambda: self._run(method, *args, **kwargs))
+        finally:
+            # DB 스레드 대기 시간 포함
+            get_metrics().observe('db_call_seconds', time.perf_counter() - start,
+                                  call=f"{self.repository_class.__name__}.{method}")
+
+
+class AsyncTokenRepository(AsyncRepository):
+    repository_class = TokenRepository
+
+    async def save_token(self, token_type, access_token, expires_at):
+        return await self._call('save_token', token_type, access_token, expires_at)
+
+    async def get_token(self, token_type):
+        return await self._call('get_token', token_type)
+
+
+class AsyncApprovalRepository(AsyncRepository):
+    repository_class = ApprovalRepository
+
+    async def save_approval(self, approval_type, approval_key, expires_at):
+        return await self._call('save_approval', approval_type, approval_key, expires_at)
+
+    async def get_approval(self, approval_type):
+        return await self._call('get_approval', approval_type)
+
+
+class AsyncStockRepository(AsyncRepository):
+    repository_class = StockRepository
+
+    async def save_upper_limit_stocks(self, date, stocks):
+        return await self._call('save_upper_limit_stocks', date, stocks)
+
+    async def get_upper_limit_stocks(self, start_date, end_date):
+        return await self._call('get_upper_limit_stocks', start_date, end_date)
+
+    async def delete_old_stocks(self, date):
+        return await self._call('delete_old_stocks', date)
+
+    async def save_selected_stocks(self, stocks):
+        return await self._call('save_selected_stocks', stocks)
+
+    async def get_selected_stocks(self):
+        return await self._call('get_selected_stocks')
+
+    async def claim_selected_stocks(self, count):
+        return await self._call('claim_selected_stocks', count)
+
+    async def delete_selected_stocks(self):
+        return await self._call('delete_selected_stocks')
+
+    async def delete_selected_stock_by_no(self, no):
+        return await self._call('delete_selected_stock_by_no', no)
+
+
+class AsyncTradingSessionRepository(AsyncRepository):
+    repository_class = TradingSessionRepository
+
+    async def save_trading_session(self, session_id, start_date, current_date, ticker, name, fund, spent_fund,
+                                   quantity, avr_price, count):
+        return await self._call('save_trading_session', session_id, start_date, current_date, ticker, name, fund,
+                                spent_fund, quantity, avr_price, count)
+
+    async def save_trading_sessions(self, sessions):
+        return await self._call('save_trading_sessions', sessions)
+
+    async def load_trading_session(self, session_id=None):
+        return await self._call('load_trading_session', session_id)
+
+    async def load_trading_session_by_ticker(self, ticker):
+        return await self._call('load_trading_session_by_ticker', ticker)
+
+    async def delete_session_row(self, session_id):
+        return await self._call('delete_session_row', session_id)
@@ -0,0 +1,144 @@
+# database/backends.py
+import re
+import sqlite3
+import logging
+import threading
+from datetime import date, datetime
+from config.config import DB_NAME, DB_POOL_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+
+class MariaDBDialect:
+    """MariaDB SQL 방언. 리포지토리 쿼리는 이 방언을 기준으로 작성되어 있습니다."""
+    name = 'mariadb'
+    supports_partitions = True
+    supports_skip_locked = True       # SELECT ... FOR UPDATE SKIP LOCKED (MariaDB 10.6+)
+    supports_delete_returning = False  # DELETE ... RETURNING은 있지만 같은 테이블 서브쿼리 LIMIT 불가
+
+    def upsert_clause(self, keys, columns):
+        """INSERT ... VALUES 뒤에 붙는 upsert 절"""
+        return "ON DUPLICATE KEY UPDATE " + ", ".join(f"{c} = VALUES({c})" for c in columns)
+
+    def ddl(self, sql):
+        return sql
+
+
+class SQLiteDialect:
+    """SQLite SQL 방언. %s 자리표시자는 SQLiteCursor가 ?로 바꿉니다."""
+    name = 'sqlite'
+    supports_partitions = False
+    supports_skip_locked = False
+    supports_delete_returning = True   # SQLite 3.35+
+
+    def upsert_clause(self, keys, columns):
+        return (f"ON CONFLICT ({', '.join(keys)}) DO UPDATE SET "
+                + ", ".join(f"{c} = excluded.{c}" for c in columns))
+
+    def ddl(self, sql):
+        """MariaDB 전용 DDL 구문을 SQLite용으로 바꿉니다."""
+        sql = re.sub(r"\)\s*ENGINE\s*=\s*\w+", ")", sql, flags=re.IGNORECASE)
+        return re.sub(r"\bINT\s+AUTO_INCREMENT\s+PRIMARY\s+KEY\b", "INTEGER PRIMARY KEY AUTOINCREMENT", sql,
+                      flags=re.IGNORECASE)
+
+
+MARIADB = MariaDBDialect()
+SQLITE = SQLiteDialect()
+
+
+# DATE/DATETIME 컬럼을 MariaDB 드라이버와 같은 date/datetime 객체로 주고받음
+sqlite3.register_adapter(date, date.isoformat)
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(" "))
+sqlite3.register_converter("DATE", lambda value: date.fromisoformat(value.decode()[:10]))
+sqlite3.register_converter("DATETIME", lambda value: datetime.fromisoformat(value.decode()))
+
+
+class SQLiteCursor:
+    """mysql.connector의 dictionary 커서와 같은 방식으로 쓰는 SQLite 커서"""
+
+    def __init__(self, conn):
+        self.cursor = conn.cursor()
+
+    def execute(self, sql, params=()):
+        self.cursor.execute(sql.replace('%s', '?'), tuple(params) if params else ())
+
+    def _to_dict(self, row):
+        return dict(zip([column[0] for column in self.cursor.description], row))
+
+    def fetchone(self):
+        row = self.cursor.fetchone()
+        return self._to_dict(row) if row is not None else None
+
+    def fetchall(self):
+        return [self._to_dict(row) for row in self.cursor.fetchall()]
+
+    @property
+    def rowcount(self):
+        return self.cursor.rowcount
+
+    @property
+    def lastrowid(self):
+        return self.cursor.lastrowid
+
+    def close(self):
+        self.cursor.close()
+
+
+class SQLitePool:
+    """
+    SQLite 연결 하나를 프로세스에서 공유하는 풀 (파일 또는 ':memory:').
+    SQLite는 쓰기가 한 번에 하나뿐이라 checkout은 연결을 잠그고 release는 잠금을 풉니다.
+    같은 스레드에서는 중첩 checkout이 가능합니다.
+    """
+    dialect = SQLITE
+    Error = sqlite3.Error
+
+    def __init__(self, path=DB_NAME, timeout=DB_POOL_TIMEOUT):
+        self.path = path
+        self.timeout = timeout
+        self.conn = None
+        self.lock = threading.RLock()
+        self.checkouts = 0
+        self.waits = 0
+
+    def _connect(self):
+        logger.info("SQLite 데이터베이스를 엽니다: %s", self.path)
+        conn = sqlite3.connect(self.path, check_same_thread=False, detect_types=sqlite3.PARSE_DECLTYPES,
+                               timeout=self.timeout)
+        if self.path != ':memory:':
+            conn.execute('PRAGMA journal_mode=WAL')
+        return conn
+
+    def checkout(self):
+        if not self.lock.acquire(blocking=False):
+            self.waits += 1
+            if not self.lock.acquire(timeout=self.timeout):
+                raise sqlite3.OperationalError(f"SQLite 연결 대기 시간 초과 ({self.timeout}s)")
+        try:
+            if self.conn is None:
+                self.conn = self._connect()
+        except Exception:
+            self.lock.release()
+            raise
+        self.checkouts += 1
+        return self.conn
+
+    def release(self, conn, discard=False):
+        self.lock.release()
+
+    def cursor(self, conn):
+        return SQLiteCursor(conn)
+
+    def metrics(self):
+        return {
+            "backend": self.dialect.name,
+            "path": self.path,
+            "checkouts": self.checkouts,
+            "waits": self.waits,
+        }
+
+    def close_all(self):
+        with self.lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
@@ -0,0 +1,91 @@
+# database/batch_writer.py
+import logging
+from config.config import DB_BATCH_CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
+
+SAVEPOINT = "batch_chunk"
+
+
+class BatchResult:
+    """배치 쓰기 결과. failed에는 실패한 입력 행의 (번호, 오류 메시지)를 담습니다."""
+
+    def __init__(self, total):
+        self.total = total
+        self.written = 0
+        self.chunks = 0
+        self.failed = []
+
+    @property
+    def ok(self):
+        return not self.failed
+
+    def __repr__(self):
+        return f"BatchResult(total={self.total}, written={self.written}, chunks={self.chunks}, failed={len(self.failed)})"
+
+
+def write_batch(db_manager, cursor, insert_sql, row_placeholder, rows, on_duplicate='', convert=None,
+                chunk_size=DB_BATCH_CHUNK_SIZE):
+    """
+    rows를 chunk_size 단위의 multi-row INSERT로 씁니다. 배치 전체가 트랜잭션 하나입니다.
+    청크마다 세이브포인트를 두고, 청크가 실패하면 그 세이브포인트로 되돌린 뒤 같은 트랜잭션 안에서
+    행 단위로 다시 써서 실패한 행만 건너뜁니다. 커밋이 실패하면 배치 전체가 반영되지 않습니다.
+
+    Args:
+        db_manager: commit/rollback을 제공하는 DBConnectionManager
+        cursor: db_manager의 커서
+        insert_sql (str): 'INSERT INTO t (a, b)'까지의 구문
+        row_placeholder (str): 행 하나의 자리표시자 '(%s, %s)'
+        rows (list): 입력 행 목록
+        on_duplicate (str): 'ON DUPLICATE KEY UPDATE ...' 절 (없으면 빈 문자열)
+        convert (callable): 입력 행을 파라미터 튜플로 바꾸는 함수. 변환 실패 행은 실패로 기록
+        chunk_size (int): 청크당 행 수
+
+    Returns:
+        BatchResult
+    """
+    result = BatchResult(len(rows))
+    prepared = []  # [(입력 행 번호, 파라미터)]
+    for index, row in enumerate(rows):
+        try:
+            prepared.append((index, tuple(convert(row)) if convert else tuple(row)))
+        except Exception as e:
+            result.failed.append((index, str(e)))
+
+    try:
+        for start in range(0, len(prepared), chunk_size):
+            chunk = prepared[start:start + chunk_size]
+            sql = f"{insert_sql} VALUES {', '.join([row_placeholder] * len(chunk))} {on_duplicate}"
+            params = [value for _, row in chunk for value in row]
+            cursor.execute(f"SAVEPOINT {SAVEPOINT}")
+            try:
+                cursor.execute(sql, params)
+                result.written += len(chunk)
+            except Exception as e:
+                cursor.execute(f"ROLLBACK TO SAVEPOINT {SAVEPOINT}")
+                logger.warning("Batch chunk of %d rows failed (%s), retrying row by row", len(chunk), e)
+                _write_rows(cursor, f"{insert_sql} VALUES {row_placeholder} {on_duplicate}", chunk, result)
+            result.chunks += 1
+        db_manager.commit()
+    except Exception as e:
+        # 커밋(또는 세이브포인트 복구)이 실패하면 배치 전체가 반영되지 않음
+        db_manager.rollback()
+        failed = {index for index, _ in result.failed}
+        result.failed.extend((index, str(e)) for index, _ in prepared if index not in failed)
+        result.written = 0
+
+    if result.failed:
+        logger.error("Batch write: %d/%d rows failed: %s", len(result.failed), result.total, result.failed[:10])
+    return result
+
+
+def _write_rows(cursor, sql, chunk, result):
+    """실패한 청크를 행 단위로 다시 씁니다. 행마다 세이브포인트를 두어 실패한 문장만 되돌립니다."""
+    for index, row in chunk:
+        cursor.execute(f"SAVEPOINT {SAVEPOINT}")
+        try:
+            cursor.execute(sql, row)
+            result.written += 1
+        except Exception as e:
+            cursor.execute(f"ROLLBACK TO SAVEPOINT {SAVEPOINT}")
+            result.failed.append((index, str(e)))
@@ -1,61 +1,241 @@
 import mysql.connector
 import logging
-from config.config import DB_CONFIG
-import os
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+import queue
+import threading
+import time
+from config.config import DB_CONFIG, DB_BACKEND, DB_POOL_SIZE, DB_POOL_TIMEOUT, DB_POOL_VALIDATE_IDLE
+from database.backends import MARIADB, SQLitePool
+from utils.metrics import get_metrics
 
-class DBConnectionManager:
-    def __init__(self):
-        # 환경 변수 디버깅
-        logging.debug(f"DB_HOST: {os.getenv('DB_HOST')}")
-        logging.debug(f"DB_USER: {os.getenv('DB_USER')}")
-        logging.debug(f"DB_NAME: {os.getenv('DB_NAME')}")
-        logging.debug(f"DB_PORT: {os.getenv('DB_PORT')}")
-        
-        # DB_CONFIG 전체 출력
-        logging.debug(f"DB_CONFIG: {DB_CONFIG}")
-        
+logger = logging.getLogger(__name__)
+
+
+class DBConnectionPool:
+    """
+    프로세스 공용 MariaDB 커넥션 풀.
+    checkout()으로 빌리고 release()로 돌려주며, 최대 pool_size개까지 필요할 때 연결을 만듭니다.
+    """
+    dialect = MARIADB
+    Error = mysql.connector.Error
+
+    def __init__(self, pool_size=DB_POOL_SIZE, timeout=DB_POOL_TIMEOUT, validate_idle=DB_POOL_VALIDATE_IDLE):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.validate_idle = validate_idle
+        self.idle = queue.LifoQueue()  # (connection, 반납 시각)
+        self.lock = threading.Lock()
+        self.created = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.checkouts = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.reconnects = 0
+        self.errors = 0
+
+    def _connect(self):
         try:
-            # 연결 시도 전 추가 로깅
-            logging.info(f"데이터베이스 연결을 시도합니다... (호스트: {DB_CONFIG['host']}, 포트: {DB_CONFIG['port']})")
-            
-            # 연결 시도 및 타임아웃 설정
-            self.conn = mysql.connector.connect(
+            logger.info(f"데이터베이스 연결을 시도합니다... (호스트: {DB_CONFIG['host']}, 포트: {DB_CONFIG['port']})")
+            conn = mysql.connector.connect(
                 **DB_CONFIG,
                 connection_timeout=10  # 10초 타임아웃 설정
             )
-            
-            # 연결 상태 확인
-            if not self.conn.is_connected():
+            if not conn.is_connected():
                 raise mysql.connector.Error("데이터베이스 연결에 실패했습니다.")
-            
-            logging.info("데이터베이스 연결에 성공했습니다.")
+            logger.info("데이터베이스 연결에 성공했습니다.")
+            return conn
         except mysql.connector.Error as e:
-            logging.error(f"데이터베이스 연결 오류: {e}")
-            logging.error(f"연결 시도 설정: {DB_CONFIG}")
-            
+            logger.error(f"데이터베이스 연결 오류: {e}")
             # 추가 진단 정보 로깅
             if 'Access denied' in str(e):
-                logging.error("접근이 거부되었습니다. 사용자 권한을 확인해주세요.")
+                logger.error("접근이 거부되었습니다. 사용자 권한을 확인해주세요.")
             elif 'Unknown database' in str(e):
-                logging.error("데이터베이스가 존재하지 않습니다. 데이터베이스 이름을 확인해주세요.")
-            
-            raise
-        except Exception as e:
-            logging.error(f"예상치 못한 오류 발생: {e}")
+                logger.error("데이터베이스가 존재하지 않습니다. 데이터베이스 이름을 확인해주세요.")
             raise
 
+    def checkout(self):
+        """유휴 연결을 빌려주고, 없으면 새로 만들거나 반납될 때까지 대기합니다."""
+        conn = None
+        try:
+            conn, returned_at = self.idle.get_nowait()
+        except queue.Empty:
+            with self.lock:
+                can_create = self.created < self.pool_size
+                if can_create:
+                    self.created += 1
+            if can_create:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self.lock:
+                        self.created -= 1
+                        self.errors += 1
+                    raise
+                returned_at = time.monotonic()
+            else:
+                started = time.perf_counter()
+                try:
+                    conn, returned_at = self.idle.get(timeout=self.timeout)
+                except queue.Empty:
+                    with self.lock:
+                        self.errors += 1
+                    raise mysql.connector.errors.PoolError(
+                        f"DB 커넥션 풀 대기 시간 초과 ({self.timeout}s, size={self.pool_size})")
+                with self.lock:
+                    self.waits += 1
+                    self.wait_time += time.perf_counter() - started
+        if time.monotonic() - returned_at > self.validate_idle:
+            conn = self._validate(conn)
+        with self.lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+        return conn
+
+    def _validate(self, conn):
+        """오래 쉬던 연결은 ping으로 확인하고 끊겼으면 다시 연결합니다."""
+        try:
+            conn.ping(reconnect=True, attempts=1, delay=0)
+        except mysql.connector.Error:
+            with self.lock:
+                self.reconnects += 1
+            try:
+                conn.close()
+            except Exception:
+                pass
+            try:
+                conn = self._connect()
+            except Exception:
+                # 닫은 연결 자리를 비워야 이후 checkout()이 새로 만들 수 있습니다.
+                with self.lock:
+                    self.created -= 1
+                    self.errors += 1
+                raise
+        return conn
+
+    def release(self, conn, discard=False):
+        """연결을 풀에 반납합니다. 오류로 상태가 불확실한 연결은 discard=True로 버립니다."""
+        with self.lock:
+            self.in_use -= 1
+        if discard:
+            with self.lock:
+                self.created -= 1
+            try:
+                conn.close()
+            except Exception:
+                pass
+            return
+        self.idle.put((conn, time.monotonic()))
+
+    def cursor(self, conn):
+        return conn.cursor(buffered=True, dictionary=True)
+
+    def metrics(self):
+        with self.lock:
+            return {
+                "backend": self.dialect.name,
+                "pool_size": self.pool_size,
+                "created": self.created,
+                "idle": self.idle.qsize(),
+                "in_use": self.in_use,
+                "peak_in_use": self.peak_in_use,
+                "checkouts": self.checkouts,
+                "waits": self.waits,
+                "avg_wait_ms": round(self.wait_time / self.waits * 1000, 2) if self.waits else 0.0,
+                "reconnects": self.reconnects,
+                "errors": self.errors,
+            }
+
+    def close_all(self):
+        while True:
+            try:
+                conn, _ = self.idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                conn.close()
+            except Exception:
+                pass
+            with self.lock:
+                self.created -= 1
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def create_pool(backend=DB_BACKEND, **kwargs):
+    """설정된 저장소 종류('mariadb' 또는 'sqlite')의 풀을 만듭니다."""
+    if backend == 'mariadb':
+        return DBConnectionPool(**kwargs)
+    if backend == 'sqlite':
+        return SQLitePool(**kwargs)
+    raise ValueError(f"Unknown DB backend: {backend}")
+
+
+def get_pool():
+    """프로세스 공용 커넥션 풀을 반환합니다 (최초 호출 시 DB_BACKEND로 생성)."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = create_pool()
+    return _pool
+
+
+def set_pool(pool):
+    """프로세스 공용 풀을 교체합니다 (백테스트/시뮬레이션에서 SQLitePool(':memory:') 등)."""
+    global _pool
+    with _pool_lock:
+        previous, _pool = _pool, pool
+    if previous is not None and previous is not pool:
+        previous.close_all()
+
+
+class DBConnectionManager:
+    """풀에서 빌린 연결 하나. close() 또는 with 블록 종료 시 풀에 반납합니다."""
+
+    def __init__(self, pool=None):
+        self.pool = pool if pool else get_pool()
+        self.dialect = self.pool.dialect
+        self.checkout_at = time.perf_counter()
+        self.conn = self.pool.checkout()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type:
+            self.rollback()
+        self.close()
+        return False
+
     def get_cursor(self):
-        return self.conn.cursor(buffered=True, dictionary=True)
+        return self.pool.cursor(self.conn)
 
     def commit(self):
-        if self.conn and self.conn.is_connected():
+        if self.conn:
             self.conn.commit()
 
+    def rollback(self):
+        if self.conn:
+            try:
+                self.conn.rollback()
+            except self.pool.Error as e:
+                logger.error("Rollback failed: %s", e)
+
     def close(self):
-        if self.conn and self.conn.is_connected():
-            self.conn.commit()
-            self.conn.close()
+        if self.conn is None:
+            return
+        conn, self.conn = self.conn, None
+        try:
+            conn.commit()
+        except self.pool.Error as e:
+            logger.error("Commit on release failed: %s", e)
+            self.pool.release(conn, discard=True)
+            return
+        finally:
+            # 풀 대기부터 반납 전 커밋까지 (동기 DatabaseManager 호출 포함)
+            get_metrics().observe('db_connection_hold_seconds', time.perf_counter() - self.checkout_at,
+                                  backend=self.dialect.name)
+        self.pool.release(conn)
@@ -4,16 +4,29 @@ from database.token_repository import TokenRepository
 from database.approval_repository import ApprovalRepository
 from database.stock_repository import StockRepository
 from database.trading_session_repository import TradingSessionRepository
+from utils.date_utils import DateUtils
+from config.condition import BUY_DAY_AGO
+from datetime import datetime
 
 class DatabaseManager:
-    def __init__(self):
-        # 내부적으로 새 DB 연결 매니저와 리포지토리들을 생성합니다.
-        self.db_connection = DBConnectionManager()
+    def __init__(self, pool=None):
+        # 공용 커넥션 풀에서 연결을 빌려 리포지토리들을 구성합니다. (테이블 생성은 migrations.migrate)
+        self.db_connection = DBConnectionManager(pool)
+        self.cursor = self.db_connection.get_cursor()
         self.token_repo = TokenRepository(self.db_connection)
         self.approval_repo = ApprovalRepository(self.db_connection)
         self.stock_repo = StockRepository(self.db_connection)
         self.session_repo = TradingSessionRepository(self.db_connection)
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type:
+            self.db_connection.rollback()
+        self.close()
+        return False
+
     # 기존에 trading 코드에서 사용한 메서드들을 동일한 이름과 시그니처로 구현합니다.
     
     def save_token(self, token_type, access_token, expires_at):
@@ -22,27 +35,53 @@ class DatabaseManager:
     def get_token(self, token_type):
         return self.token_repo.get_token(token_type)
 
+    def save_approval(self, approval_type, approval_key, expires_at):
+        self.approval_repo.save_approval(approval_type, approval_key, expires_at)
+
+    def get_approval(self, approval_type):
+        return self.approval_repo.get_approval(approval_type)
+
     def save_upper_limit_stocks(self, date, stocks):
-        self.stock_repo.save_upper_limit_stocks(date, stocks)
+        return self.stock_repo.save_upper_limit_stocks(date, stocks)
 
     def get_upper_limit_stocks(self, start_date, end_date):
         return self.stock_repo.get_upper_limit_stocks(start_date, end_date)
 
+    def get_upper_limit_stocks_days_ago(self, days_ago=BUY_DAY_AGO):
+        """days_ago 영업일 전 상한가 종목을 반환합니다."""
+        target = DateUtils.get_previous_business_day(datetime.now(), days_ago)
+        return self.stock_repo.get_upper_limit_stocks(target, target)
+
     def save_trading_session(self, session_id, start_date, current_date, ticker, name, fund, spent_fund, quantity, avr_price, count):
         self.session_repo.save_trading_session(session_id, start_date, current_date, ticker, name, fund, spent_fund, quantity, avr_price, count)
 
+    def save_trading_sessions(self, sessions):
+        return self.session_repo.save_trading_sessions(sessions)
+
     def load_trading_session(self, session_id=None):
         return self.session_repo.load_trading_session(session_id)
 
+    def load_trading_session_by_ticker(self, ticker):
+        return self.session_repo.load_trading_session_by_ticker(ticker)
+
     def delete_session_one_row(self, session_id):
-        self.session_repo.delete_session_one_row(session_id)
+        self.session_repo.delete_session_row(session_id)
 
     def delete_old_stocks(self, date):
         self.stock_repo.delete_old_stocks(date)
 
+    def save_selected_stocks(self, stocks):
+        return self.stock_repo.save_selected_stocks(stocks)
+
     def get_selected_stocks(self):
         return self.stock_repo.get_selected_stocks()
 
+    def peek_selected_stocks(self, limit):
+        return self.stock_repo.peek_selected_stocks(limit)
+
+    def claim_selected_stocks(self, count):
+        return self.stock_repo.claim_selected_stocks(count)
+
     def delete_selected_stocks(self):
         self.stock_repo.delete_selected_stocks()
 
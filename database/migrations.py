@@ -0,0 +1,223 @@
+# database/migrations.py
+import logging
+import threading
+from datetime import datetime, timedelta
+from database.db_connection_manager import DBConnectionManager
+from database.token_repository import TokenRepository
+from database.approval_repository import ApprovalRepository
+from database.stock_repository import StockRepository
+from database.trading_session_repository import TradingSessionRepository
+
+logger = logging.getLogger(__name__)
+
+INITIAL_SCHEMA = [
+    '''
+    CREATE TABLE IF NOT EXISTS tokens (
+        token_type VARCHAR(50) PRIMARY KEY,
+        access_token TEXT,
+        expires_at DATETIME
+    ) ENGINE=InnoDB
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS approvals (
+        approval_type VARCHAR(50) PRIMARY KEY,
+        approval_key TEXT,
+        expires_at DATETIME
+    ) ENGINE=InnoDB
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS upper_limit_stocks (
+        date DATE,
+        ticker VARCHAR(20),
+        name VARCHAR(100),
+        closing_price DECIMAL(10,2),
+        upper_rate DECIMAL(5,2),
+        PRIMARY KEY (date, ticker)
+    ) ENGINE=InnoDB
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS selected_stocks (
+        no INT AUTO_INCREMENT PRIMARY KEY,
+        date DATE,
+        ticker VARCHAR(20),
+        name VARCHAR(100),
+        closing_price DECIMAL(10,2)
+    ) ENGINE=InnoDB
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS trading_session (
+        id INT PRIMARY KEY,
+        start_date DATE,
+        `current_date` DATE,
+        ticker VARCHAR(20),
+        name VARCHAR(100),
+        fund INT,
+        spent_fund INT,
+        quantity INT,
+        avr_price INT,
+        count INT
+    ) ENGINE=InnoDB
+    ''',
+]
+
+
+def _partition_upper_limit_stocks(db):
+    """upper_limit_stocks를 월 단위 RANGE 파티션으로 전환합니다 (오래된 데이터는 파티션 단위로 삭제)."""
+    if not db.dialect.supports_partitions:
+        return
+    cursor = db.get_cursor()
+    cursor.execute('''
+        ALTER TABLE upper_limit_stocks
+        PARTITION BY RANGE (TO_DAYS(date)) (PARTITION pmax VALUES LESS THAN MAXVALUE)
+    ''')
+    StockRepository(db).ensure_partitions()
+
+
+# (버전, 설명, DDL 목록 또는 callable(db)) - 적용된 버전은 schema_migrations에 기록
+MIGRATIONS = [
+    (1, "initial schema", INITIAL_SCHEMA),
+    (2, "secondary indexes for repository queries", [
+        "CREATE INDEX IF NOT EXISTS idx_selected_stocks_date_no ON selected_stocks (date, no)",
+        "CREATE INDEX IF NOT EXISTS idx_trading_session_ticker ON trading_session (ticker)",
+    ]),
+    (3, "monthly partitions for upper_limit_stocks", _partition_upper_limit_stocks),
+]
+
+_migrated_pools = set()
+_migrate_lock = threading.Lock()
+
+
+def migrate(pool=None):
+    """
+    미적용 마이그레이션을 버전 순서대로 적용합니다. 풀(저장소)마다 한 번만 실행됩니다.
+    DDL은 저장소 방언에 맞게 바꿔 실행합니다.
+
+    Returns:
+        list: 이번에 적용한 버전 목록
+    """
+    with _migrate_lock:
+        applied_now = []
+        with DBConnectionManager(pool) as db:
+            if id(db.pool) in _migrated_pools:
+                return []
+            cursor = db.get_cursor()
+            cursor.execute(db.dialect.ddl('''
+                CREATE TABLE IF NOT EXISTS schema_migrations (
+                    version INT PRIMARY KEY,
+                    description VARCHAR(200),
+                    applied_at DATETIME
+                ) ENGINE=InnoDB
+            '''))
+            cursor.execute('SELECT version FROM schema_migrations')
+            applied = {row['version'] for row in cursor.fetchall()}
+            for version, description, steps in MIGRATIONS:
+                if version in applied:
+                    continue
+                if callable(steps):
+                    steps(db)
+                else:
+                    for sql in steps:
+                        cursor.execute(db.dialect.ddl(sql))
+                cursor.execute(
+                    'INSERT INTO schema_migrations (version, description, applied_at) VALUES (%s, %s, %s)',
+                    (version, description, datetime.now())
+                )
+                db.commit()
+                applied_now.append(version)
+                logger.info("Applied migration %d: %s", version, description)
+            # 앞으로 쓸 월 파티션 미리 생성
+            StockRepository(db).ensure_partitions()
+            _migrated_pools.add(id(db.pool))
+        return applied_now
+
+
+def _query_plan_checks():
+    today = datetime.now().date()
+    return [
+        ("tokens by type", TokenRepository.SELECT_TOKEN, ("real",)),
+        ("approvals by type", ApprovalRepository.SELECT_APPROVAL, ("real",)),
+        ("upper_limit_stocks by date range", StockRepository.SELECT_UPPER_LIMIT_STOCKS, (today - timedelta(days=7), today)),
+        ("delete old upper_limit_stocks", StockRepository.DELETE_OLD_UPPER_LIMIT_STOCKS, (today - timedelta(days=60),)),
+        ("next selected stock", StockRepository.SELECT_NEXT_SELECTED_STOCK, ()),
+        ("peek selected stocks", StockRepository.PEEK_SELECTED_STOCKS, (10,)),
+        ("delete selected stock by no", StockRepository.DELETE_SELECTED_STOCK_BY_NO, (0,)),
+        ("trading_session by id", TradingSessionRepository.SELECT_SESSION_BY_ID, (0,)),
+        ("trading_session by ticker", TradingSessionRepository.SELECT_SESSION_BY_TICKER, ("000000",)),
+        ("delete trading_session by id", TradingSessionRepository.DELETE_SESSION_BY_ID, (0,)),
+    ]
+
+
+# 인덱스 없이도 스캔이 필요 없는 실행 계획
+TRIVIAL_PLAN_EXTRAS = ("Impossible WHERE", "no matching row", "Select tables optimized away", "No tables used")
+# 점검 전 통계를 갱신할 테이블
+QUERY_PLAN_TABLES = ("tokens", "approvals", "upper_limit_stocks", "selected_stocks", "trading_session")
+
+
+def _partition_counts(cursor):
+    """파티션 테이블별 전체 파티션 수 {테이블: 개수}"""
+    cursor.execute('''
+        SELECT TABLE_NAME, COUNT(*) AS n
+        FROM information_schema.PARTITIONS
+        WHERE TABLE_SCHEMA = DATABASE() AND PARTITION_NAME IS NOT NULL
+        GROUP BY TABLE_NAME
+    ''')
+    return {row['TABLE_NAME']: row['n'] for row in cursor.fetchall()}
+
+
+def _uses_index(row, partition_counts):
+    """EXPLAIN 한 행이 인덱스, 파티션 프루닝 또는 const 접근으로 풀스캔을 피하는지"""
+    if row.get('key') or row.get('type') in ('const', 'system'):
+        return True
+    if any(extra in (row.get('Extra') or '') for extra in TRIVIAL_PLAN_EXTRAS):
+        return True
+    partitions = row.get('partitions')
+    total = partition_counts.get(row.get('table'))
+    return bool(partitions and total and len(partitions.split(',')) < total)
+
+
+def check_query_plans(pool=None):
+    """
+    리포지토리 쿼리마다 EXPLAIN을 실행해 인덱스(또는 파티션 프루닝)를 타는지 확인합니다.
+    MariaDB는 key가 있거나, 파티션이 프루닝되었거나, const 접근이어야 통과합니다.
+    테이블이 작으면 옵티마이저가 풀스캔을 고를 수 있어 통계를 갱신하고
+    max_seeks_for_key=1로 인덱스 탐색 비용을 낮춘 세션에서 점검합니다.
+    SQLite는 EXPLAIN QUERY PLAN에서 인덱스 없는 SCAN이 있는지 봅니다.
+
+    Returns:
+        list: [{'name', 'ok', 'plan'}] - 인덱스를 쓰지 않는 쿼리는 ok=False
+    """
+    report = []
+    with DBConnectionManager(pool) as db:
+        cursor = db.get_cursor()
+        sqlite = db.dialect.name == 'sqlite'
+        if not sqlite:
+            cursor.execute(f"ANALYZE TABLE {', '.join(QUERY_PLAN_TABLES)}")
+            cursor.fetchall()
+            cursor.execute('SET SESSION max_seeks_for_key = 1')
+            partition_counts = _partition_counts(cursor)
+        try:
+            for name, sql, params in _query_plan_checks():
+                if sqlite:
+                    cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+                    plan = [{'detail': row.get('detail')} for row in cursor.fetchall()]
+                    ok = all(not row['detail'].startswith('SCAN') or 'INDEX' in row['detail'] for row in plan)
+                else:
+                    cursor.execute('EXPLAIN ' + sql, params)
+                    plan = [
+                        {k: row.get(k) for k in ('table', 'partitions', 'type', 'key', 'possible_keys', 'rows', 'Extra')}
+                        for row in cursor.fetchall()
+                    ]
+                    ok = all(_uses_index(row, partition_counts) for row in plan)
+                report.append({'name': name, 'ok': ok, 'plan': plan})
+                if not ok:
+                    logger.warning("Query without index: %s %s", name, plan)
+        finally:
+            if not sqlite:
+                cursor.execute('SET SESSION max_seeks_for_key = DEFAULT')
+    return report
+
+
+if __name__ == "__main__":
+    print("적용한 마이그레이션:", migrate())
+    for item in check_query_plans():
+        print("OK " if item['ok'] else "NG ", item['name'], item['plan'])
@@ -1,61 +1,249 @@
 import logging
 from datetime import datetime
+from config.config import UPPER_LIMIT_PARTITION_MONTHS_AHEAD, DB_BATCH_CHUNK_SIZE
+from database.batch_writer import write_batch
+from database.backends import MARIADB
+
+logger = logging.getLogger(__name__)
+
+
+def _add_months(day, months):
+    """day(월 초일)에서 months개월 뒤의 월 초일"""
+    month = day.month - 1 + months
+    return day.replace(year=day.year + month // 12, month=month % 12 + 1, day=1)
+
 
 class StockRepository:
+    # 조회/삭제 쿼리 (migrations.check_query_plans에서 인덱스 사용 여부를 점검)
+    SELECT_UPPER_LIMIT_STOCKS = '''
+        SELECT date, ticker, name, closing_price
+        FROM upper_limit_stocks
+        WHERE date BETWEEN %s AND %s
+        ORDER BY date, name
+    '''
+    SELECT_NEXT_SELECTED_STOCK = '''
+        SELECT no, date, ticker, name, closing_price
+        FROM selected_stocks
+        WHERE date = (SELECT MAX(date) FROM selected_stocks)
+        ORDER BY no
+        LIMIT 1
+    '''
+    PEEK_SELECTED_STOCKS = '''
+        SELECT no, date, ticker, name, closing_price
+        FROM selected_stocks
+        WHERE date = (SELECT MAX(date) FROM selected_stocks)
+        ORDER BY no
+        LIMIT %s
+    '''
+    DELETE_SELECTED_STOCK_BY_NO = 'DELETE FROM selected_stocks WHERE no = %s'
+    # 가장 최근 선별일 후보를 순번대로 limit개 잠금 (다른 트랜잭션이 잠근 행은 건너뜀)
+    LOCK_NEXT_SELECTED_STOCKS = '''
+        SELECT no, date, ticker, name, closing_price
+        FROM selected_stocks
+        WHERE date = (SELECT MAX(date) FROM selected_stocks)
+        ORDER BY no
+        LIMIT %s
+        FOR UPDATE SKIP LOCKED
+    '''
+    CLAIM_NEXT_SELECTED_STOCKS = '''
+        DELETE FROM selected_stocks
+        WHERE no IN (
+            SELECT no FROM selected_stocks
+            WHERE date = (SELECT MAX(date) FROM selected_stocks)
+            ORDER BY no
+            LIMIT %s
+        )
+        RETURNING no, date, ticker, name, closing_price
+    '''
+    DELETE_OLD_UPPER_LIMIT_STOCKS = 'DELETE FROM upper_limit_stocks WHERE date < %s'
+
     def __init__(self, db_manager):
         self.db_manager = db_manager
         self.cursor = self.db_manager.get_cursor()
-        self._create_tables()
+        self.dialect = getattr(self.db_manager, 'dialect', MARIADB)
 
-    def _create_tables(self):
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS upper_limit_stocks (
-                date DATE,
-                ticker VARCHAR(20),
-                name VARCHAR(100),
-                closing_price DECIMAL(10,2),
-                upper_rate DECIMAL(5,2),
-                PRIMARY KEY (date, ticker)
-            ) ENGINE=InnoDB
-        ''')
+    def save_upper_limit_stocks(self, date, stocks, chunk_size=DB_BATCH_CHUNK_SIZE):
+        """
+        (종목코드, 종목명, 종가, 등락률) 목록을 date 기준으로 upsert 합니다.
+        매일 실행되므로 쓰기 전에 앞으로 쓸 월 파티션도 미리 만들어 둡니다.
+
+        Returns:
+            BatchResult: 반영 행 수와 실패 행 (번호, 오류)
+        """
+        try:
+            self.ensure_partitions()
+            return write_batch(
+                self.db_manager, self.cursor,
+                'INSERT INTO upper_limit_stocks (date, ticker, name, closing_price, upper_rate)',
+                '(%s, %s, %s, %s, %s)', stocks,
+                on_duplicate=self.dialect.upsert_clause(['date', 'ticker'], ['name', 'closing_price', 'upper_rate']),
+                convert=lambda s: (date, s[0], s[1], float(s[2]), float(s[3])),
+                chunk_size=chunk_size,
+            )
+        except Exception as e:
+            logger.error("Error saving upper limit stocks: %s", e)
+            raise
+
+    def get_upper_limit_stocks(self, start_date, end_date):
+        try:
+            self.cursor.execute(self.SELECT_UPPER_LIMIT_STOCKS, (start_date, end_date))
+            return self.cursor.fetchall()
+        except Exception as e:
+            logger.error("Error retrieving upper limit stocks: %s", e)
+            raise
+
+    def delete_old_stocks(self, date):
+        """
+        date 이전 상한가 종목을 삭제합니다.
+        통째로 지난 월 파티션은 DROP PARTITION으로 지우고, 경계 월만 DELETE 합니다.
+        앞으로 쓸 월 파티션이 모자라면 새로 만들어 새 행이 pmax에 쌓이지 않게 합니다.
+        """
+        try:
+            self.ensure_partitions()
+            dropped = self.drop_partitions_before(date)
+            self.cursor.execute(self.DELETE_OLD_UPPER_LIMIT_STOCKS, (date,))
+            self.db_manager.commit()
+            logger.info("Deleted upper limit stocks before %s (dropped partitions: %s, rows: %d)",
+                         date, dropped, self.cursor.rowcount)
+        except Exception as e:
+            logger.error("Error deleting old stocks: %s", e)
+            raise
+
+    def get_partitions(self):
+        """upper_limit_stocks 파티션 목록 [(이름, 상한 TO_DAYS 값 또는 None)]. 파티션을 지원하지 않는 저장소는 []"""
+        if not self.dialect.supports_partitions:
+            return []
         self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS selected_stocks (
-                no INT AUTO_INCREMENT PRIMARY KEY,
-                date DATE,
-                ticker VARCHAR(20),
-                name VARCHAR(100),
-                closing_price DECIMAL(10,2)
-            ) ENGINE=InnoDB
+            SELECT PARTITION_NAME, PARTITION_DESCRIPTION
+            FROM information_schema.PARTITIONS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'upper_limit_stocks' AND PARTITION_NAME IS NOT NULL
+            ORDER BY PARTITION_ORDINAL_POSITION
         ''')
-        self.db_manager.commit()
-
-    def save_upper_limit_stocks(self, date, stocks):
-        try:
-            for ticker, name, closing_price, upper_rate in stocks:
-                self.cursor.execute('''
-                    INSERT INTO upper_limit_stocks (date, ticker, name, closing_price, upper_rate)
-                    VALUES (%s, %s, %s, %s, %s)
-                    ON DUPLICATE KEY UPDATE
-                        name = VALUES(name),
-                        closing_price = VALUES(closing_price),
-                        upper_rate = VALUES(upper_rate)
-                ''', (date, ticker, name, float(closing_price), float(upper_rate)))
-            self.db_manager.commit()
+        partitions = []
+        for row in self.cursor.fetchall():
+            bound = row['PARTITION_DESCRIPTION']
+            partitions.append((row['PARTITION_NAME'], None if bound == 'MAXVALUE' else int(bound)))
+        return partitions
+
+    def drop_partitions_before(self, date):
+        """상한이 date 이하인(전부 date 이전 데이터인) 월 파티션을 삭제합니다."""
+        partitions = self.get_partitions()
+        if not partitions:
+            return []
+        self.cursor.execute('SELECT TO_DAYS(%s) AS days', (date,))
+        cutoff = self.cursor.fetchone()['days']
+        old = [name for name, bound in partitions if bound is not None and bound <= cutoff]
+        if old:
+            self.cursor.execute(f"ALTER TABLE upper_limit_stocks DROP PARTITION {', '.join(old)}")
+        return old
+
+    def ensure_partitions(self, months_ahead=UPPER_LIMIT_PARTITION_MONTHS_AHEAD):
+        """
+        이번 달 + months_ahead개월까지 월 파티션(pYYYYMM)이 있도록 pmax를 분할합니다.
+        파티션이 없는 테이블이면 아무것도 하지 않습니다.
+
+        Returns:
+            list: 새로 만든 파티션 이름
+        """
+        partitions = self.get_partitions()
+        if not partitions:
+            return []
+        bounds = [bound for _, bound in partitions if bound is not None]
+        if bounds:
+            self.cursor.execute('SELECT FROM_DAYS(%s) AS day', (max(bounds),))
+            month = self.cursor.fetchone()['day']
+        else:
+            self.cursor.execute('SELECT MIN(date) AS day FROM upper_limit_stocks')
+            month = (self.cursor.fetchone()['day'] or datetime.now().date()).replace(day=1)
+        end = _add_months(datetime.now().date().replace(day=1), months_ahead + 1)
+
+        names, definitions = [], []
+        while month < end:
+            next_month = _add_months(month, 1)
+            names.append(f"p{month:%Y%m}")
+            definitions.append(f"PARTITION p{month:%Y%m} VALUES LESS THAN (TO_DAYS('{next_month:%Y-%m-%d}'))")
+            month = next_month
+        if definitions:
+            definitions.append("PARTITION pmax VALUES LESS THAN MAXVALUE")
+            self.cursor.execute(
+                f"ALTER TABLE upper_limit_stocks REORGANIZE PARTITION pmax INTO ({', '.join(definitions)})"
+            )
+            logger.info("Created upper_limit_stocks partitions: %s", names)
+        return names
+
+    def save_selected_stocks(self, stocks, chunk_size=DB_BATCH_CHUNK_SIZE):
+        """매수 후보 종목을 오늘 날짜로 저장합니다. 입력 순서대로 no가 매겨집니다."""
+        today = datetime.now().date()
+        try:
+            return write_batch(
+                self.db_manager, self.cursor,
+                'INSERT INTO selected_stocks (date, ticker, name, closing_price)',
+                '(%s, %s, %s, %s)', stocks,
+                convert=lambda s: (today, s.get('ticker'), s.get('name'), float(s.get('closing_price'))),
+                chunk_size=chunk_size,
+            )
         except Exception as e:
-            logging.error("Error saving upper limit stocks: %s", e)
+            logger.error("Error saving selected stocks: %s", e)
             raise
 
-    def get_upper_limit_stocks(self, start_date, end_date):
+    def get_selected_stocks(self):
+        """가장 최근 선별일의 매수 후보 중 다음 순번 한 종목을 반환합니다."""
         try:
-            self.cursor.execute('''
-                SELECT date, ticker, name, closing_price 
-                FROM upper_limit_stocks 
-                WHERE date BETWEEN %s AND %s
-                ORDER BY date, name
-            ''', (start_date, end_date))
+            self.cursor.execute(self.SELECT_NEXT_SELECTED_STOCK)
+            return self.cursor.fetchone()
+        except Exception as e:
+            logger.error("Error retrieving selected stocks: %s", e)
+            raise
+
+    def peek_selected_stocks(self, limit):
+        """가장 최근 선별일의 매수 후보를 순번대로 최대 limit개 조회합니다 (배정하지 않음)."""
+        try:
+            self.cursor.execute(self.PEEK_SELECTED_STOCKS, (limit,))
             return self.cursor.fetchall()
         except Exception as e:
-            logging.error("Error retrieving upper limit stocks: %s", e)
+            logger.error("Error retrieving selected stocks: %s", e)
             raise
 
-    # selected_stocks, 삭제, 정렬 관련 메서드 등도 여기에 포함
+    def claim_selected_stocks(self, count):
+        """
+        가장 최근 선별일의 매수 후보를 순번대로 최대 count개 꺼냅니다 (조회와 삭제를 한 트랜잭션으로).
+        동시에 여러 작업이 호출해도 같은 종목을 두 번 배정하지 않습니다.
+
+        Returns:
+            list: 배정된 종목 (순번 순)
+        """
+        if count <= 0:
+            return []
+        try:
+            if self.dialect.supports_delete_returning:
+                self.cursor.execute(self.CLAIM_NEXT_SELECTED_STOCKS, (count,))
+                claimed = sorted(self.cursor.fetchall(), key=lambda stock: stock['no'])
+            else:
+                self.cursor.execute(self.LOCK_NEXT_SELECTED_STOCKS, (count,))
+                claimed = self.cursor.fetchall()
+                if claimed:
+                    placeholders = ', '.join(['%s'] * len(claimed))
+                    self.cursor.execute(f'DELETE FROM selected_stocks WHERE no IN ({placeholders})',
+                                        [stock['no'] for stock in claimed])
+            self.db_manager.commit()
+            return claimed
+        except Exception as e:
+            self.db_manager.rollback()
+            logger.error("Error claiming selected stocks: %s", e)
+            raise
+
+    def delete_selected_stocks(self):
+        try:
+            self.cursor.execute('DELETE FROM selected_stocks')
+            self.db_manager.commit()
+        except Exception as e:
+            logger.error("Error deleting selected stocks: %s", e)
+            raise
+
+    def delete_selected_stock_by_no(self, no):
+        try:
+            self.cursor.execute(self.DELETE_SELECTED_STOCK_BY_NO, (no,))
+            self.db_manager.commit()
+        except Exception as e:
+            logger.error("Error deleting selected stock: %s", e)
+            raise
@@ -1,65 +1,81 @@
 import logging
+from config.config import DB_BATCH_CHUNK_SIZE
+from database.batch_writer import write_batch
+from database.backends import MARIADB
+
+logger = logging.getLogger(__name__)
 
 class TradingSessionRepository:
+    # 조회/삭제 쿼리 (migrations.check_query_plans에서 인덱스 사용 여부를 점검)
+    SELECT_SESSION_BY_ID = 'SELECT * FROM trading_session WHERE id = %s'
+    SELECT_SESSION_BY_TICKER = 'SELECT * FROM trading_session WHERE ticker = %s'
+    DELETE_SESSION_BY_ID = 'DELETE FROM trading_session WHERE id = %s'
+    # current_date는 예약어라 백쿼트가 필요
+    INSERT_SESSION = '''
+        INSERT INTO trading_session
+        (id, start_date, `current_date`, ticker, name, fund, spent_fund, quantity, avr_price, count)
+    '''
+    SESSION_ROW = '(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)'
+    UPDATE_COLUMNS = ['start_date', '`current_date`', 'ticker', 'name', 'fund', 'spent_fund', 'quantity',
+                      'avr_price', 'count']
+
     def __init__(self, db_manager):
         self.db_manager = db_manager
         self.cursor = self.db_manager.get_cursor()
-        self._create_table()
-
-    def _create_table(self):
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS trading_session (
-                id INT PRIMARY KEY,
-                start_date DATE,
-                `current_date` DATE,
-                ticker VARCHAR(20),
-                name VARCHAR(100),
-                fund INT,
-                spent_fund INT,
-                quantity INT,
-                avr_price INT,
-                count INT
-            ) ENGINE=InnoDB
-        ''')
-        self.db_manager.commit()
+        self.dialect = getattr(self.db_manager, 'dialect', MARIADB)
+        self.upsert_update = self.dialect.upsert_clause(['id'], self.UPDATE_COLUMNS)
 
     def save_trading_session(self, session_id, start_date, current_date, ticker, name, fund, spent_fund, quantity, avr_price, count):
         try:
-            self.cursor.execute('''
-                INSERT INTO trading_session 
-                (id, start_date, current_date, ticker, name, fund, spent_fund, quantity, avr_price, count)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON DUPLICATE KEY UPDATE
-                    start_date = VALUES(start_date),
-                    current_date = VALUES(current_date),
-                    ticker = VALUES(ticker),
-                    name = VALUES(name),
-                    fund = VALUES(fund),
-                    spent_fund = VALUES(spent_fund),
-                    quantity = VALUES(quantity),
-                    avr_price = VALUES(avr_price),
-                    count = VALUES(count)
-            ''', (session_id, start_date, current_date, ticker, name, fund, spent_fund, quantity, avr_price, count))
+            self.cursor.execute(
+                f"{self.INSERT_SESSION} VALUES {self.SESSION_ROW} {self.upsert_update}",
+                (session_id, start_date, current_date, ticker, name, fund, spent_fund, quantity, avr_price, count)
+            )
             self.db_manager.commit()
         except Exception as e:
-            logging.error("Error saving trading session: %s", e)
+            logger.error("Error saving trading session: %s", e)
+            raise
+
+    def save_trading_sessions(self, sessions, chunk_size=DB_BATCH_CHUNK_SIZE):
+        """
+        여러 세션을 한 번에 upsert 합니다.
+
+        Args:
+            sessions (list): (id, start_date, current_date, ticker, name, fund, spent_fund, quantity, avr_price, count) 튜플 목록
+
+        Returns:
+            BatchResult: 반영 행 수와 실패 행 (번호, 오류)
+        """
+        try:
+            return write_batch(self.db_manager, self.cursor, self.INSERT_SESSION, self.SESSION_ROW, sessions,
+                               on_duplicate=self.upsert_update, chunk_size=chunk_size)
+        except Exception as e:
+            logger.error("Error saving trading sessions: %s", e)
             raise
 
     def load_trading_session(self, session_id=None):
         try:
             if session_id:
-                self.cursor.execute('SELECT * FROM trading_session WHERE id = %s', (session_id,))
+                self.cursor.execute(self.SELECT_SESSION_BY_ID, (session_id,))
             else:
                 self.cursor.execute('SELECT * FROM trading_session')
             return self.cursor.fetchall()
         except Exception as e:
-            logging.error("Error loading trading session: %s", e)
+            logger.error("Error loading trading session: %s", e)
+            raise
+
+    def load_trading_session_by_ticker(self, ticker):
+        try:
+            self.cursor.execute(self.SELECT_SESSION_BY_TICKER, (ticker,))
+            return self.cursor.fetchall()
+        except Exception as e:
+            logger.error("Error loading trading session by ticker: %s", e)
             raise
 
     def delete_session_row(self, session_id):
         try:
-            self.cursor.execute('DELETE FROM trading_session WHERE id = %s', (session_id,))
+            self.cursor.execute(self.DELETE_SESSION_BY_ID, (session_id,))
             self.db_manager.commit()
         except Exception as e:
-            logging.error("Error deleting session row: %s", e)
+            logger.error("Error deleting session row: %s", e)
             raise
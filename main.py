@@ -1,10 +1,12 @@
 # main.py
+from utils.log_setup import setup_logging
 from process.main_process import MainProcess
 from process.test_process import TestProcess
 import datetime
 import time
 
 if __name__ == "__main__":
+    setup_logging()
     main_process = MainProcess()
 
     print("초기화 완료")
@@ -1,28 +1,79 @@
 # process/main_process.py
+import logging
 import time
 import threading
 import atexit
 from datetime import datetime
 from process.scheduler_manager import SchedulerManager
 from process.monitoring_manager import MonitoringManager
-from trading.trading_logic import TradingLogic  # sell_order callback 제공을 위해 사용
+from database.migrations import migrate, check_query_plans
+from database.async_repository import shutdown_db_executor
+from process.runtime import get_runtime
+from process.warmup import WarmUp
+from utils.slack_logger import get_slack_dispatcher
+from utils.metrics import MetricsExporter
+from utils.tracing import get_tracer
+
+logger = logging.getLogger(__name__)
 
 class MainProcess:
-    def __init__(self):
+    def __init__(self, runtime=None):
         self.stop_event = threading.Event()
         self.threads = {}
-        self.scheduler_manager = SchedulerManager()
-        # TradingLogic 인스턴스를 생성하여 매도 주문 콜백을 전달합니다.
-        trading_logic = TradingLogic()
-        self.monitoring_manager = MonitoringManager(sell_order_callback=trading_logic.sell_order)
+        # 공용 구성요소 컨테이너 (KIS API/인증, DB 풀, Slack, 캘린더, 주문 관리 등을 한 번씩만 생성)
+        self.runtime = runtime if runtime else get_runtime()
+        # 스키마 마이그레이션은 시작 시 한 번만
+        migrate(self.runtime.pool)
+        check_query_plans(self.runtime.pool)
+        # 세션 상태는 메모리 저장소가 관리 (시작 시 한 번 적재, DB에는 write-through)
+        self.session_store = self.runtime.session_store
+        self.session_store.load()
+        # 장 구분 시계 (캘린더 기반, 구분이 바뀔 때만 깨어남)
+        self.market_clock = self.runtime.market_clock
+        # 지연 시간 계측 내보내기 (METRICS_ENABLED일 때만 동작)
+        self.metrics_exporter = MetricsExporter()
+        # 체결통보 기반 체결 추적기 / 주문 상태 머신 / 실시간 호가창 (스케줄러와 모니터링 스레드가 공유)
+        self.fill_tracker = self.runtime.fill_tracker
+        self.order_manager = self.runtime.order_manager
+        self.order_books = self.runtime.order_books
+        # 매도 콜백 (session_id, ticker, quantity, price)은 매도 후 세션까지 정리하는 SessionManager.sell_order
+        self.monitoring_manager = MonitoringManager(sell_order_callback=self.runtime.session_manager.sell_order,
+                                                    fill_tracker=self.fill_tracker, order_manager=self.order_manager,
+                                                    order_books=self.order_books,
+                                                    session_events=self.runtime.session_events,
+                                                    trading_logic=self.runtime.trading_logic,
+                                                    session_manager=self.runtime.session_manager,
+                                                    slack_logger=self.runtime.slack_logger)
+        # 장 시작 전 워밍업 (첫 매수 작업 전에 연결/토큰/매수 후보 호가창을 준비)
+        self.warm_up = WarmUp(self.runtime.kis_api, self.runtime.pool, self.session_store,
+                              calendar=self.runtime.calendar, monitoring_manager=self.monitoring_manager,
+                              slack_logger=self.runtime.slack_logger)
+        self.scheduler_manager = SchedulerManager(fill_tracker=self.fill_tracker, order_manager=self.order_manager,
+                                                  trading_logic=self.runtime.trading_logic,
+                                                  session_manager=self.runtime.session_manager,
+                                                  warm_up=self.warm_up)
+        logger.info("Runtime components built (ms): %s", self.runtime.built())
         atexit.register(self.cleanup)
 
     def cleanup(self):
         self.scheduler_manager.shutdown()
+        self.fill_tracker.stop()
+        self.order_manager.stop()
+        self.session_store.stop()
+        self.market_clock.stop()
+        self.metrics_exporter.stop()
+        get_tracer().stop()
+        shutdown_db_executor(wait=False)
+        get_slack_dispatcher().stop()
 
     def start_all(self):
+        self.fill_tracker.start()
+        self.order_manager.start()
+        self.session_store.start()
+        self.metrics_exporter.start()
+
         # 스케줄러 스레드 시작
-        print("스케줄러 스레드 시작")
+        logger.info("스케줄러 스레드 시작")
         scheduler_thread = threading.Thread(
             target=self.scheduler_manager.start,
             name="SchedulerManager",
@@ -31,7 +82,7 @@ class MainProcess:
         scheduler_thread.start()
         self.threads['scheduler'] = scheduler_thread
 
-        print("모니터링 스레드 시작")
+        logger.info("모니터링 스레드 시작")
         # 모니터링 스레드 시작
         monitoring_thread = threading.Thread(
             target=self.monitoring_manager.start,
@@ -4,27 +4,89 @@ import logging
 from trading.trading_logic import TradingLogic
 from trading.session_manager import SessionManager
 from api.kis_websocket import KISWebSocket
+from trading.session_events import session_events as default_session_events
+from database.async_repository import get_db_executor
+from utils.loop_monitor import LoopLagMonitor
+from config.condition import SESSION_RECONCILE_INTERVAL
+
+logger = logging.getLogger(__name__)
 
 class MonitoringManager:
-    def __init__(self, sell_order_callback):
-        self.trading_logic = TradingLogic()
-        self.kis_websocket = KISWebSocket(callback=sell_order_callback)
-        self.session_manager = SessionManager()
+    def __init__(self, sell_order_callback, fill_tracker=None, order_manager=None, order_books=None,
+                 session_events=None, trading_logic=None, session_manager=None, slack_logger=None):
+        # 의존성 주입: Runtime이 공용 인스턴스를 넘기고, 없으면 직접 생성
+        self.trading_logic = trading_logic if trading_logic else TradingLogic(fill_tracker=fill_tracker,
+                                                                             order_manager=order_manager)
+        self.kis_websocket = KISWebSocket(callback=sell_order_callback, fill_tracker=fill_tracker, order_books=order_books,
+                                          slack_logger=slack_logger)
+        self.session_events = session_events if session_events else default_session_events
+        self.session_manager = session_manager if session_manager else SessionManager(
+            fill_tracker=fill_tracker, order_manager=order_manager, session_events=self.session_events)
         # trading_logic 내부에 웹소켓 인스턴스를 설정
         self.trading_logic.kis_websocket = self.kis_websocket
+        # 모니터링 루프 지연/블로킹 호출 감시
+        self.loop_monitor = LoopLagMonitor(name='monitoring', slack_logger=slack_logger)
+        self.loop = None  # start()에서 만든 모니터링 이벤트 루프 (다른 스레드에서 작업을 넘길 때 사용)
 
     async def run_monitoring(self):
-        sessions_info = self.session_manager.get_session_info()
-        await self.session_manager.monitor_for_selling(sessions_info)
+        """
+        세션 변경 알림(또는 주기적 DB 확인)마다 모니터링 대상을 다시 맞춥니다.
+        프로세스 재시작 없이 장중에 생긴 세션도 바로 매도 조건 감시를 시작합니다.
+        """
+        changed = asyncio.Event()
+        self.session_events.subscribe_async(asyncio.get_running_loop(), changed)
+        self.loop_monitor.start()
+        try:
+            await self.kis_websocket.connect_websocket()
+            while True:
+                changed.clear()
+                await self.reconcile()
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout=SESSION_RECONCILE_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self.session_events.unsubscribe_async(changed)
+            self.loop_monitor.stop()
+
+    async def reconcile(self):
+        """DB의 세션 목록과 웹소켓 구독 상태를 일치시킵니다."""
+        try:
+            # 세션은 메모리 저장소에서 읽고, 최초 적재만 DB 전용 스레드에서
+            store = self.session_manager.session_store
+            if not store.loaded:
+                await asyncio.get_running_loop().run_in_executor(get_db_executor(), store.load)
+            sessions_info = self.session_manager.get_session_info()
+        except Exception as e:
+            logger.error("Failed to load sessions for monitoring: %s", e)
+            return
+        self.kis_websocket.ensure_receiver()
+        await self.kis_websocket.sync_monitoring(sessions_info)
+
+    def run_in_loop(self, coro, timeout):
+        """다른 스레드(스케줄러 등)에서 모니터링 루프에 코루틴을 넘기고 결과를 기다립니다."""
+        if self.loop is None or not self.loop.is_running():
+            coro.close()
+            raise RuntimeError("monitoring loop is not running")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+    def warm_up(self, tickers, timeout):
+        """웹소켓 연결 확인 및 매수 후보 호가창 선구독 (KISWebSocket.prewarm)"""
+        return self.run_in_loop(self.kis_websocket.prewarm(tickers), timeout)
+
+    def release_warm(self, timeout):
+        """세션이 되지 않은 선구독 종목 구독 해제 (KISWebSocket.release_prewarmed)"""
+        return self.run_in_loop(self.kis_websocket.release_prewarmed(), timeout)
 
     def start(self):
         # 새로운 이벤트 루프를 생성하여 모니터링 실행
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
+        self.loop = loop
         try:
             loop.run_until_complete(self.run_monitoring())
         except Exception as e:
-            logging.error("Monitoring error: %s", e)
+            logger.error("Monitoring error: %s", e)
         finally:
             pending = asyncio.all_tasks(loop)
             for task in pending:
@@ -0,0 +1,154 @@
+# process/runtime.py
+import time
+import logging
+import functools
+import threading
+from database.db_connection_manager import get_pool
+from utils.trading_calendar import get_trading_calendar
+from utils.date_utils import DateUtils
+from trading.market_clock import get_market_clock
+from utils.slack_logger import SlackLogger
+from trading.session_events import session_events
+from trading.session_store import get_session_store
+from api.kis_api import KISApi
+from api.order_book import OrderBookRegistry
+from trading.fill_tracker import FillTracker
+from trading.order_pricer import OrderPricer
+from trading.order_manager import OrderManager
+from trading.order_dispatcher import OrderDispatcher
+from trading.trading_logic import TradingLogic
+from trading.session_manager import SessionManager
+
+logger = logging.getLogger(__name__)
+
+
+def component(factory):
+    """
+    Runtime 구성요소 정의. 처음 접근할 때 factory(runtime)로 한 번만 만들고 이후에는 같은 객체를 돌려줍니다.
+    factory가 다른 구성요소를 참조해도 되도록 재진입 가능한 락을 씁니다.
+    """
+    name = factory.__name__
+
+    @functools.wraps(factory)
+    def getter(self):
+        try:
+            return self.components[name]
+        except KeyError:
+            pass
+        with self.lock:
+            if name not in self.components:
+                started = time.perf_counter()
+                self.components[name] = factory(self)
+                self.build_times[name] = round((time.perf_counter() - started) * 1000, 1)
+            return self.components[name]
+    return property(getter)
+
+
+class Runtime:
+    """
+    프로세스 공용 구성요소 컨테이너.
+    KIS API 클라이언트(인증 포함), DB 풀, Slack 로거, 거래 캘린더, 체결 추적기, 주문 관리자, TradingLogic,
+    SessionManager 등을 처음 쓸 때 한 번씩만 만들어 모든 구성요소에 같은 인스턴스를 주입합니다.
+    테스트/백테스트에서는 Runtime(kis_api=..., pool=...)처럼 원하는 구성요소를 미리 넣을 수 있습니다.
+    """
+
+    def __init__(self, is_mock=True, **overrides):
+        self.is_mock = is_mock
+        self.lock = threading.RLock()
+        self.components = dict(overrides)
+        self.build_times = {}  # {구성요소: 생성 시간 ms}
+
+    # 인프라
+
+    @component
+    def pool(self):
+        return get_pool()
+
+    @component
+    def calendar(self):
+        return get_trading_calendar()
+
+    @component
+    def date_utils(self):
+        return DateUtils()
+
+    @component
+    def market_clock(self):
+        return get_market_clock()
+
+    @component
+    def slack_logger(self):
+        return SlackLogger()
+
+    @component
+    def session_events(self):
+        return session_events
+
+    @component
+    def session_store(self):
+        return get_session_store()
+
+    # KIS API
+
+    @component
+    def kis_api(self):
+        return KISApi(is_mock=self.is_mock)
+
+    @component
+    def auth(self):
+        """토큰/해시키를 관리하는 인증 객체 (kis_api와 공유)"""
+        return self.kis_api.auth
+
+    @component
+    def order_books(self):
+        return OrderBookRegistry()
+
+    # 주문
+
+    @component
+    def fill_tracker(self):
+        return FillTracker(kis_api=self.kis_api)
+
+    @component
+    def order_pricer(self):
+        return OrderPricer(self.kis_api, self.order_books)
+
+    @component
+    def order_manager(self):
+        return OrderManager(self.kis_api, self.fill_tracker, pricer=self.order_pricer)
+
+    @component
+    def order_dispatcher(self):
+        return OrderDispatcher(self.kis_api)
+
+    # 트레이딩
+
+    @component
+    def trading_logic(self):
+        return TradingLogic(kis_api=self.kis_api, slack_logger=self.slack_logger, fill_tracker=self.fill_tracker,
+                            order_manager=self.order_manager, order_books=self.order_books)
+
+    @component
+    def session_manager(self):
+        return SessionManager(kis_api=self.kis_api, slack_logger=self.slack_logger, date_utils=self.date_utils,
+                              fill_tracker=self.fill_tracker, order_manager=self.order_manager,
+                              order_books=self.order_books, session_events=self.session_events,
+                              session_store=self.session_store, order_dispatcher=self.order_dispatcher)
+
+    def built(self):
+        """지금까지 만든 구성요소와 생성 시간(ms)"""
+        return dict(self.build_times)
+
+
+_runtime = None
+_runtime_lock = threading.Lock()
+
+
+def get_runtime():
+    """프로세스 공용 Runtime을 반환합니다 (최초 호출 시 생성, 구성요소는 각각 처음 쓸 때 생성)."""
+    global _runtime
+    if _runtime is None:
+        with _runtime_lock:
+            if _runtime is None:
+                _runtime = Runtime()
+    return _runtime
@@ -1,42 +1,85 @@
 # process/scheduler_manager.py
 import logging
+from datetime import datetime, timedelta
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.executors.pool import ThreadPoolExecutor
 from config.condition import GET_ULS_HOUR, GET_ULS_MINUTE, GET_SELECT_HOUR, GET_SELECT_MINUTE, ORDER_HOUR_1, ORDER_MINUTE_1, ORDER_HOUR_2, ORDER_MINUTE_2
+from config.condition import WARMUP_HOUR, WARMUP_MINUTE, WARMUP_RELEASE_HOUR, WARMUP_RELEASE_MINUTE, DISPATCH_LEAD
 from trading.trading_logic import TradingLogic
 from trading.session_manager import SessionManager
+from utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
 
 class SchedulerManager:
-    def __init__(self):
+    def __init__(self, fill_tracker=None, order_manager=None, trading_logic=None, session_manager=None, warm_up=None):
         executors = {'default': ThreadPoolExecutor(20)}
         self.scheduler = BackgroundScheduler(executors=executors, timezone='Asia/Seoul', daemon=False)
+        self.fill_tracker = fill_tracker
+        self.order_manager = order_manager
+        self.trading_logic = trading_logic
+        self.session_manager = session_manager
+        self.warm_up = warm_up  # 장 시작 전 워밍업 (process.warmup.WarmUp)
+        self.metrics = get_metrics()
+
+    def _timed(self, job_id, func):
+        """작업 실행 시간을 scheduler_job_seconds에 기록하도록 감쌉니다."""
+        return self.metrics.timed('scheduler_job_seconds', job=job_id)(func)
+
+    def _dispatch_job(self, session_manager, hour, minute, lead=DISPATCH_LEAD):
+        """
+        hour:minute 정각에 매수 주문을 보내는 작업과 트리거.
+        작업은 lead초 먼저 시작해 주문 요청을 만들어 두고 OrderDispatcher가 정각까지 기다렸다 전송합니다.
+        """
+        def job():
+            target = datetime.now().replace(hour=hour, minute=minute, second=0, microsecond=0)
+            return session_manager.start_trading_session(target=target.timestamp())
+        start = datetime(2000, 1, 1, hour, minute) - timedelta(seconds=lead)
+        return job, CronTrigger(hour=start.hour, minute=start.minute, second=start.second)
 
     def add_jobs(self):
-        trading_logic = TradingLogic()
-        trading_session_manager = SessionManager()
+        trading_logic = self.trading_logic if self.trading_logic else TradingLogic(
+            fill_tracker=self.fill_tracker, order_manager=self.order_manager)
+        trading_session_manager = self.session_manager if self.session_manager else SessionManager(
+            fill_tracker=self.fill_tracker, order_manager=self.order_manager)
 
         self.scheduler.add_job(
-            trading_logic.fetch_and_save_previous_upper_limit_stocks,
+            self._timed('fetch_stocks', trading_logic.fetch_and_save_previous_upper_limit_stocks),
             CronTrigger(hour=GET_ULS_HOUR, minute=GET_ULS_MINUTE),
             id='fetch_stocks',
             replace_existing=True
         )
         self.scheduler.add_job(
-            trading_logic.select_stocks_to_buy,
+            self._timed('select_stocks', trading_logic.select_stocks_to_buy),
             CronTrigger(hour=GET_SELECT_HOUR, minute=GET_SELECT_MINUTE),
             id='select_stocks',
             replace_existing=True
         )
+        if self.warm_up:
+            self.scheduler.add_job(
+                self._timed('warm_up', self.warm_up.run),
+                CronTrigger(hour=WARMUP_HOUR, minute=WARMUP_MINUTE),
+                id='warm_up',
+                replace_existing=True
+            )
+            self.scheduler.add_job(
+                self._timed('warm_up_release', self.warm_up.release),
+                CronTrigger(hour=WARMUP_RELEASE_HOUR, minute=WARMUP_RELEASE_MINUTE),
+                id='warm_up_release',
+                replace_existing=True
+            )
+        buy_job_1, buy_trigger_1 = self._dispatch_job(trading_session_manager, ORDER_HOUR_1, ORDER_MINUTE_1)
         self.scheduler.add_job(
-            trading_session_manager.start_trading_session,
-            CronTrigger(hour=ORDER_HOUR_1, minute=ORDER_MINUTE_1),
+            self._timed('buy_task_1', buy_job_1),
+            buy_trigger_1,
             id='buy_task_1',
             replace_existing=True
         )
+        buy_job_2, buy_trigger_2 = self._dispatch_job(trading_session_manager, ORDER_HOUR_2, ORDER_MINUTE_2)
         self.scheduler.add_job(
-            trading_session_manager.start_trading_session,
-            CronTrigger(hour=ORDER_HOUR_2, minute=ORDER_MINUTE_2),
+            self._timed('buy_task_2', buy_job_2),
+            buy_trigger_2,
             id='buy_task_2',
             replace_existing=True
         )
@@ -44,9 +87,9 @@ class SchedulerManager:
     def start(self):
         self.add_jobs()
         self.scheduler.start()
-        logging.info("Scheduler started with jobs: %s", self.scheduler.get_jobs())
+        logger.info("Scheduler started with jobs: %s", self.scheduler.get_jobs())
 
     def shutdown(self):
         if self.scheduler.running:
             self.scheduler.shutdown(wait=False)
-            logging.info("Scheduler shutdown")
+            logger.info("Scheduler shutdown")
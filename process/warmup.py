@@ -0,0 +1,158 @@
+# process/warmup.py
+import time
+import logging
+from datetime import date
+from config.condition import WARMUP_MAX_TICKERS, WARMUP_DB_CONNECTIONS, WARMUP_TIMEOUT
+from database.db_manager import DatabaseManager
+from utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class WarmUp:
+    """
+    장 시작 전 워밍업. 첫 매수 작업이 하던 초기 비용(토큰/해시키 발급, HTTP/DB/웹소켓 연결,
+    매수 후보 시세 조회, 주문 요청 템플릿)을 미리 치르고 단계별 결과를 보고합니다.
+    단계 하나가 실패해도 나머지 단계는 계속 진행합니다.
+    """
+
+    def __init__(self, kis_api, pool, session_store, calendar=None, monitoring_manager=None, slack_logger=None,
+                 max_tickers=WARMUP_MAX_TICKERS, db_connections=WARMUP_DB_CONNECTIONS, timeout=WARMUP_TIMEOUT):
+        self.kis_api = kis_api
+        self.pool = pool
+        self.session_store = session_store
+        self.calendar = calendar
+        self.monitoring_manager = monitoring_manager
+        self.slack_logger = slack_logger
+        self.max_tickers = max_tickers
+        self.db_connections = db_connections
+        self.timeout = timeout
+        self.metrics = get_metrics()
+        self.candidates = []
+        self.last_report = None
+
+    def run(self):
+        """
+        워밍업 단계를 차례로 실행합니다.
+
+        Returns:
+            dict: {'ready', 'elapsed_ms', 'steps': {단계: {'ok', 'ms', 'detail'}}} / 휴장일이면 None
+        """
+        if self.calendar and not self.calendar.is_session(date.today()):
+            logger.info("휴장일이라 워밍업을 건너뜁니다.")
+            return None
+        started = time.perf_counter()
+        steps = {}
+        for name, step in (
+            ('credentials', self._credentials),
+            ('db', self._db),
+            ('session_store', self._session_store),
+            ('http', self._http),
+            ('candidates', self._candidates),
+            ('websocket', self._websocket),
+            ('order_templates', self._order_templates),
+        ):
+            steps[name] = self._run_step(name, step)
+        report = {
+            'ready': all(step['ok'] for step in steps.values()),
+            'elapsed_ms': round((time.perf_counter() - started) * 1000, 1),
+            'steps': steps,
+        }
+        self.last_report = report
+        self._report(report)
+        return report
+
+    def _run_step(self, name, step):
+        started = time.perf_counter()
+        try:
+            ok, detail = step()
+        except Exception as e:
+            ok, detail = False, f"{type(e).__name__}: {e}"
+        elapsed = time.perf_counter() - started
+        self.metrics.observe('warmup_step_seconds', elapsed, step=name)
+        return {'ok': ok, 'ms': round(elapsed * 1000, 1), 'detail': detail}
+
+    # 단계
+
+    def _credentials(self):
+        """모의/실전 토큰 확보 (DB 캐시 또는 발급) 및 해시키 엔드포인트 확인"""
+        auth = self.kis_api.auth
+        mock_token = auth._ensure_token(is_mock=True)
+        real_token = auth._ensure_token(is_mock=False)
+        hashkey = auth._get_hashkey({}, is_mock=True)
+        ok = bool(mock_token and real_token and hashkey)
+        return ok, {'mock_token': bool(mock_token), 'real_token': bool(real_token), 'hashkey': bool(hashkey)}
+
+    def _db(self):
+        """풀 연결을 동시에 여러 개 빌려 열고(오래 쉰 연결은 ping 확인) 바로 반납합니다."""
+        connections = []
+        try:
+            for _ in range(self.db_connections):
+                connections.append(self.pool.checkout())
+                # SQLite 풀은 연결 하나를 공유하므로 한 번이면 충분
+                if self.pool.dialect.name == 'sqlite':
+                    break
+        finally:
+            for conn in connections:
+                self.pool.release(conn)
+        return bool(connections), {'connections': len(connections)}
+
+    def _session_store(self):
+        self.session_store.ensure_loaded()
+        return True, {'sessions': self.session_store.count()}
+
+    def _http(self):
+        """주문 서버(모의) 연결 확인 - 첫 매수 작업의 가용 현금 조회와 같은 요청"""
+        result = self.kis_api.purchase_availability_inquiry()
+        ok = result.get('rt_cd') == '0'
+        return ok, {'rt_cd': result.get('rt_cd'), 'msg': result.get('msg1')}
+
+    def _candidates(self):
+        """매수 후보(배정 전) 조회 후 시세 서버 연결 확인 겸 현재가/거래정지 여부 조회"""
+        with DatabaseManager(self.pool) as db:
+            stocks = db.peek_selected_stocks(self.max_tickers)
+        self.candidates = [stock['ticker'] for stock in stocks]
+        halted, failed = [], []
+        for ticker in self.candidates:
+            try:
+                _, temp_stop_yn = self.kis_api.get_current_price(ticker)
+                if temp_stop_yn != 'N':
+                    halted.append(ticker)
+            except Exception as e:
+                logger.warning("워밍업 시세 조회 실패: %s", e, extra={"ticker": ticker})
+                failed.append(ticker)
+        return not failed, {'tickers': self.candidates, 'halted': halted, 'failed': failed}
+
+    def _websocket(self):
+        """웹소켓 연결/승인키 확인 및 매수 후보 호가창 선구독"""
+        if self.monitoring_manager is None:
+            return True, 'skipped'
+        result = self.monitoring_manager.warm_up(self.candidates, self.timeout)
+        return result['connected'], result
+
+    def _order_templates(self):
+        templates = self.kis_api.order.prepare_templates()
+        return True, {'sides': sorted(templates)}
+
+    def release(self):
+        """세션이 되지 않은 선구독 종목의 호가창 구독을 해제합니다 (마지막 매수 작업 이후)."""
+        if self.monitoring_manager is None:
+            return []
+        released = self.monitoring_manager.release_warm(self.timeout)
+        if released:
+            logger.info("워밍업 선구독 해제: %s", released)
+        return released
+
+    def _report(self, report):
+        failed = [name for name, step in report['steps'].items() if not step['ok']]
+        summary = {name: f"{'OK' if step['ok'] else 'FAIL'} {step['ms']}ms" for name, step in report['steps'].items()}
+        if report['ready']:
+            logger.info("워밍업 완료 (%sms): %s", report['elapsed_ms'], report['steps'])
+        else:
+            logger.warning("워밍업 일부 실패 %s (%sms): %s", failed, report['elapsed_ms'], report['steps'])
+        if self.slack_logger:
+            self.slack_logger.send_log(
+                level="INFO" if report['ready'] else "WARNING",
+                message="장 시작 전 워밍업 완료" if report['ready'] else f"장 시작 전 워밍업 일부 실패: {', '.join(failed)}",
+                context={**summary, "매수후보": len(self.candidates), "소요": f"{report['elapsed_ms']}ms"}
+            )
@@ -19,9 +19,9 @@ import json
 import asyncio
 from datetime import datetime
 from trading.trading_logic import TradingLogic
-from config.condition import GET_ULS_HOUR, GET_ULS_MINUTE
 from database.db_manager import DatabaseManager
 from utils.date_utils import DateUtils
+from trading.market_clock import get_market_clock, MarketPhase
 from api.kis_api import KISApi
 from api.krx_api import KRXApi
 from api.kis_market_data import KISMarketData
@@ -33,12 +33,13 @@ def fetch_and_save_upper_limit_stocks():
     주기적으로 상한가 종목을 DB에 저장
     """
     trading = TradingLogic()
+    clock = get_market_clock()
     # trading_instacne.set_headers(is_mock=False, tr_id="FHKST130000C0")
     while True:
-        now = datetime.now()
-        if now.hour == GET_ULS_HOUR and now.minute == GET_ULS_MINUTE:  # 매일 15시 30분에 실행
-            trading.fetch_and_save_previous_upper_limit_stocks()
-        time.sleep(1)  # 1분 대기
+        # 매 영업일 장 마감(15시 30분, 시간외 시작) 시점에 실행
+        clock.wait_for(MarketPhase.CONTINUOUS)
+        clock.wait_for(MarketPhase.AFTER_HOURS)
+        trading.fetch_and_save_previous_upper_limit_stocks()
 
 def add_stocks():
     trading = TradingLogic()
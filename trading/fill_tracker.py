@@ -0,0 +1,212 @@
+# trading/fill_tracker.py
+import time
+import logging
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from config.condition import FILL_POLL_INTERVAL, FILL_BACKLOG_TTL
+
+logger = logging.getLogger(__name__)
+
+# 체결통보(H0STCNI0/H0STCNI9) 필드 인덱스
+NOTICE_ODER_NO = 2
+NOTICE_STCK_SHRN_ISCD = 8
+NOTICE_CNTG_QTY = 9
+NOTICE_CNTG_UNPR = 10
+NOTICE_RFUS_YN = 12
+NOTICE_CNTG_YN = 13
+NOTICE_ODER_QTY = 16
+
+
+def normalize_odno(odno):
+    """주문번호 자리수(0 채움)를 통일합니다."""
+    return str(odno).strip().lstrip('0')
+
+
+class TrackedOrder:
+    """체결 추적 중인 주문 하나의 상태"""
+
+    def __init__(self, odno, quantity):
+        self.odno = odno
+        self.quantity = int(quantity)
+        self.filled = 0
+        self.amount = 0
+        self.rejected = False
+        self.future = Future()
+        self.listeners = []
+
+    @property
+    def remaining(self):
+        return max(self.quantity - self.filled, 0)
+
+
+class FillTracker:
+    """
+    주문별 체결 상태를 추적합니다.
+    실시간 체결통보(KISWebSocket)가 살아있으면 통보 즉시 주문별 Future를 완료하고,
+    통보가 끊긴 동안에만 당일 주문 전체를 한 번에 조회하는 폴링으로 대체합니다.
+    """
+
+    def __init__(self, kis_api=None, poll_interval=FILL_POLL_INTERVAL):
+        self.kis_api = kis_api
+        self.poll_interval = poll_interval
+        self.orders = {}
+        self.backlog = {}  # 추적 등록 전에 도착한 체결 {odno: (filled, amount, 수신시각)}
+        self.lock = threading.Lock()
+        self.feed_alive = False
+        self.stop_event = threading.Event()
+        self.poll_thread = None
+
+    def start(self):
+        """체결통보 단절 시 사용할 폴링 스레드를 시작합니다."""
+        if self.poll_thread and self.poll_thread.is_alive():
+            return
+        self.stop_event.clear()
+        self.poll_thread = threading.Thread(target=self._poll_loop, name="FillTrackerPoller", daemon=True)
+        self.poll_thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def set_feed_alive(self, alive):
+        """웹소켓 체결통보 구독 상태를 갱신합니다."""
+        if self.feed_alive != alive:
+            logger.info("Fill notice feed %s", "up" if alive else "down, falling back to polling")
+        self.feed_alive = alive
+
+    def track(self, odno, quantity, listener=None):
+        """
+        주문을 추적 대상으로 등록하고 전량 체결 시 완료되는 Future를 반환합니다.
+
+        Args:
+            odno (str): 주문번호
+            quantity (int): 주문 수량
+            listener (callable, optional): 체결(부분체결 포함)마다 호출될 콜백 listener(order)
+
+        Returns:
+            Future: 결과값은 TrackedOrder
+        """
+        key = normalize_odno(odno)
+        with self.lock:
+            order = self.orders.get(key)
+            if order is None:
+                order = TrackedOrder(key, quantity)
+                self.orders[key] = order
+                backlog = self.backlog.pop(key, None)
+                if backlog:
+                    order.filled, order.amount = backlog[0], backlog[1]
+            if listener:
+                order.listeners.append(listener)
+        self._notify(order)
+        return order.future
+
+    def untrack(self, odno):
+        with self.lock:
+            self.orders.pop(normalize_odno(odno), None)
+
+    def get_order(self, odno):
+        return self.orders.get(normalize_odno(odno))
+
+    def wait_for_fill(self, odno, quantity, timeout):
+        """
+        전량 체결되거나 timeout이 지날 때까지 대기합니다.
+
+        Returns:
+            int: 미체결 수량
+        """
+        future = self.track(odno, quantity)
+        try:
+            order = future.result(timeout=timeout)
+        except FutureTimeoutError:
+            order = self.get_order(odno)
+        self.untrack(odno)
+        if order is None:
+            return int(quantity)
+        return order.remaining
+
+    def handle_notice(self, fields):
+        """
+        복호화된 체결통보 한 건을 반영합니다.
+
+        Args:
+            fields (list): '^'로 분리된 체결통보 필드
+        """
+        try:
+            odno = normalize_odno(fields[NOTICE_ODER_NO])
+            if fields[NOTICE_RFUS_YN] == '1':
+                self._apply_reject(odno)
+                return
+            if fields[NOTICE_CNTG_YN] != '2':
+                return  # 접수/정정/취소 확인 통보
+            qty = int(fields[NOTICE_CNTG_QTY])
+            price = int(fields[NOTICE_CNTG_UNPR])
+        except (IndexError, ValueError) as e:
+            logger.error("Malformed fill notice %s: %s", fields, e)
+            return
+        self._apply_fill(odno, qty, qty * price)
+
+    def _apply_fill(self, odno, qty, amount):
+        with self.lock:
+            order = self.orders.get(odno)
+            if order is None:
+                filled, total, _ = self.backlog.get(odno, (0, 0, 0))
+                self.backlog[odno] = (filled + qty, total + amount, time.monotonic())
+                return
+            order.filled += qty
+            order.amount += amount
+        self._notify(order)
+
+    def _apply_total(self, odno, filled, amount):
+        """폴링 결과(누적 체결수량)를 반영합니다."""
+        with self.lock:
+            order = self.orders.get(odno)
+            if order is None or filled <= order.filled:
+                return
+            order.filled, order.amount = filled, amount
+        self._notify(order)
+
+    def _apply_reject(self, odno):
+        with self.lock:
+            order = self.orders.get(odno)
+            if order is None:
+                return
+            order.rejected = True
+        logger.warning("Order %s rejected", odno)
+        if not order.future.done():
+            order.future.set_result(order)
+
+    def _notify(self, order):
+        for listener in list(order.listeners):
+            try:
+                listener(order)
+            except Exception as e:
+                logger.error("Fill listener error for order %s: %s", order.odno, e)
+        if order.remaining == 0 and not order.future.done():
+            order.future.set_result(order)
+
+    def _poll_loop(self):
+        while not self.stop_event.wait(self.poll_interval):
+            self._expire_backlog()
+            if self.feed_alive or self.kis_api is None:
+                continue
+            with self.lock:
+                pending = [odno for odno, order in self.orders.items() if order.remaining > 0]
+            if pending:
+                self.poll_once()
+
+    def poll_once(self):
+        """당일 주문 전체(연속조회로 모든 페이지)를 조회해 추적 중인 주문을 일괄 갱신합니다."""
+        try:
+            executions = self.kis_api.daily_order_executions()
+        except Exception as e:
+            logger.error("Fill polling failed: %s", e)
+            return
+        for row in executions:
+            odno = normalize_odno(row.get('odno', ''))
+            if odno in self.orders:
+                self._apply_total(odno, int(row.get('tot_ccld_qty', 0)), int(float(row.get('tot_ccld_amt', 0))))
+
+    def _expire_backlog(self):
+        now = time.monotonic()
+        with self.lock:
+            for odno in [k for k, v in self.backlog.items() if now - v[2] > FILL_BACKLOG_TTL]:
+                del self.backlog[odno]
@@ -0,0 +1,181 @@
+# trading/market_clock.py
+import logging
+import threading
+from collections import namedtuple
+from datetime import datetime, timedelta
+from enum import Enum
+from utils.trading_calendar import get_trading_calendar
+from config.condition import MARKET_PHASES, MARKET_WINDOWS
+
+logger = logging.getLogger(__name__)
+
+
+class MarketPhase(Enum):
+    CLOSED = "closed"
+    PRE_OPEN = "pre_open"
+    CONTINUOUS = "continuous"
+    CLOSING_AUCTION = "closing_auction"
+    AFTER_HOURS = "after_hours"
+
+
+# kind: 'phase' | 'window_open' | 'window_close' | 'day'
+MarketEvent = namedtuple('MarketEvent', 'kind name previous at')
+
+
+def _seconds(hhmm):
+    hour, minute = hhmm.split(':')
+    return int(hour) * 3600 + int(minute) * 60
+
+
+class MarketClock:
+    """
+    거래 캘린더와 장 운영 시간표로 현재 장 구분(장전/정규장/마감 동시호가/시간외/휴장)을 관리합니다.
+    구분이 바뀌는 시각에만 깨어나 상태를 갱신하고 스레드 콜백/asyncio 구독자에게 이벤트를 보냅니다.
+    phase, today, in_window()는 캐시된 값이라 호출 시 시스템 시계를 읽지 않습니다.
+    """
+
+    RESYNC_INTERVAL = 60  # 시스템 시계 변경에 대비한 최대 대기 / 초
+
+    def __init__(self, calendar=None, phases=MARKET_PHASES, windows=MARKET_WINDOWS, now=datetime.now):
+        self.calendar = calendar if calendar else get_trading_calendar()
+        self.phase_table = [(_seconds(start), MarketPhase(name)) for name, start in phases]
+        self.window_table = {name: (_seconds(start), _seconds(end)) for name, (start, end) in windows.items()}
+        self.boundaries = sorted({s for s, _ in self.phase_table} | {s for r in self.window_table.values() for s in r})
+        self.now = now
+        self.lock = threading.Condition()
+        self.callbacks = []
+        self.async_subscribers = []  # [(loop, callback)]
+        self.thread = None
+        self.stop_event = threading.Event()
+
+        self.today = None
+        self.is_trading_day = False
+        self.phase = MarketPhase.CLOSED
+        self.active_windows = frozenset()
+        self.tick()
+
+    # 캐시된 상태
+
+    @property
+    def is_open(self):
+        """정규장 또는 동시호가 중"""
+        return self.phase in (MarketPhase.PRE_OPEN, MarketPhase.CONTINUOUS, MarketPhase.CLOSING_AUCTION)
+
+    @property
+    def is_continuous(self):
+        return self.phase is MarketPhase.CONTINUOUS
+
+    def in_window(self, name):
+        return name in self.active_windows
+
+    # 구독
+
+    def subscribe(self, callback):
+        """callback(MarketEvent)을 등록합니다. 시계 스레드에서 호출됩니다."""
+        with self.lock:
+            self.callbacks.append(callback)
+
+    def subscribe_async(self, loop, callback):
+        """callback(MarketEvent)을 loop에서 실행되도록 등록합니다 (예: asyncio.Queue.put_nowait)."""
+        with self.lock:
+            self.async_subscribers.append((loop, callback))
+
+    def unsubscribe(self, callback):
+        with self.lock:
+            self.callbacks = [c for c in self.callbacks if c is not callback]
+            self.async_subscribers = [(l, c) for l, c in self.async_subscribers if c is not callback]
+
+    def wait_for(self, phase, timeout=None):
+        """장 구분이 phase가 될 때까지 기다립니다. 시간 내에 되면 True."""
+        with self.lock:
+            return self.lock.wait_for(lambda: self.phase is phase, timeout=timeout)
+
+    # 상태 계산
+
+    def _state_at(self, now):
+        today = now.date()
+        trading_day = self.calendar.is_session(today)
+        seconds = now.hour * 3600 + now.minute * 60 + now.second
+        phase = MarketPhase.CLOSED
+        windows = frozenset()
+        if trading_day:
+            for start, candidate in self.phase_table:
+                if seconds >= start:
+                    phase = candidate
+            windows = frozenset(name for name, (start, end) in self.window_table.items() if start <= seconds < end)
+        return today, trading_day, phase, windows
+
+    def tick(self, now=None):
+        """현재 시각으로 상태를 다시 계산하고 바뀐 항목의 이벤트를 보냅니다."""
+        now = now or self.now()
+        today, trading_day, phase, windows = self._state_at(now)
+        events = []
+        with self.lock:
+            if today != self.today and self.today is not None:
+                events.append(MarketEvent('day', str(today), str(self.today), now))
+            if phase is not self.phase:
+                events.append(MarketEvent('phase', phase.value, self.phase.value, now))
+            for name in sorted(windows - self.active_windows):
+                events.append(MarketEvent('window_open', name, None, now))
+            for name in sorted(self.active_windows - windows):
+                events.append(MarketEvent('window_close', name, None, now))
+            self.today, self.is_trading_day, self.phase, self.active_windows = today, trading_day, phase, windows
+            self.lock.notify_all()
+            callbacks = list(self.callbacks)
+            async_subscribers = list(self.async_subscribers)
+        for event in events:
+            logger.info("Market clock: %s", event)
+            for callback in callbacks:
+                try:
+                    callback(event)
+                except Exception as e:
+                    logger.error("Market clock callback error: %s", e)
+            for loop, callback in async_subscribers:
+                if not loop.is_closed():
+                    loop.call_soon_threadsafe(callback, event)
+        return events
+
+    def next_boundary(self, now):
+        """now 이후 처음 상태가 바뀔 수 있는 시각 (구분/구간 경계 또는 자정)"""
+        seconds = now.hour * 3600 + now.minute * 60 + now.second
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        for boundary in self.boundaries:
+            if boundary > seconds:
+                return min(datetime.combine(now.date(), datetime.min.time()) + timedelta(seconds=boundary), midnight)
+        return midnight
+
+    # 시계 스레드
+
+    def start(self):
+        with self.lock:
+            if self.thread and self.thread.is_alive():
+                return
+            self.stop_event.clear()
+            self.thread = threading.Thread(target=self._run, name="MarketClock", daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def _run(self):
+        while not self.stop_event.is_set():
+            now = self.now()
+            delay = (self.next_boundary(now) - now).total_seconds()
+            if self.stop_event.wait(min(max(delay, 0.01), self.RESYNC_INTERVAL)):
+                break
+            self.tick()
+
+
+_clock = None
+_clock_lock = threading.Lock()
+
+
+def get_market_clock():
+    """프로세스 공용 장 시계를 반환합니다 (최초 호출 시 생성, 시계 스레드 시작)."""
+    global _clock
+    if _clock is None:
+        with _clock_lock:
+            if _clock is None:
+                _clock = MarketClock()
+                _clock.start()
+    return _clock
@@ -0,0 +1,125 @@
+# trading/order_dispatcher.py
+import time
+import logging
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from config.condition import DISPATCH_SPIN, DISPATCH_RATE_LIMIT_RETRY, SESSION_ORDER_WORKERS
+from trading.order_manager import RATE_LIMIT_MSG
+from utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class PreparedOrder:
+    """헤더/본문까지 만들어 둔 주문 한 건과 전송 결과"""
+
+    def __init__(self, ticker, quantity, side, price, request, session_id=None):
+        self.ticker = ticker
+        self.quantity = quantity
+        self.side = side
+        self.price = price
+        self.request = request  # KISOrder.build_order_request 결과
+        self.session_id = session_id
+        self.result = None
+        self.sent_at = None  # 첫 전송 시각 (epoch 초)
+        self.latency = None  # 전송 시작부터 응답까지 (유량 제한 대기 포함) / 초
+        self.retries = 0
+
+
+class OrderDispatcher:
+    """
+    미리 만든 주문 요청을 목표 시각에 맞춰 보냅니다.
+    목표 시각 DISPATCH_SPIN초 전까지는 sleep으로, 그 뒤로는 시계를 계속 확인하며 기다려 정각에 전송하고
+    목표 대비 실제 전송 시각 차이를 로그와 order_dispatch_delay_seconds에 남깁니다.
+    여러 건은 동시에 보내며 간격은 KISAuth의 공용 유량 제한이 맞춥니다.
+    """
+
+    def __init__(self, kis_api, spin=DISPATCH_SPIN, rate_limit_retry=DISPATCH_RATE_LIMIT_RETRY,
+                 workers=SESSION_ORDER_WORKERS, clock=time.time):
+        self.kis_api = kis_api
+        self.spin = spin
+        self.rate_limit_retry = rate_limit_retry
+        self.workers = workers
+        self.clock = clock
+        self.metrics = get_metrics()
+
+    def prepare(self, ticker, quantity, side, price=None, session_id=None):
+        """주문 요청을 만들어 PreparedOrder로 반환합니다 (토큰/헤더/본문 준비 완료)."""
+        request = self.kis_api.build_order_request(ticker, quantity, side, price)
+        return PreparedOrder(ticker, quantity, side, price, request, session_id)
+
+    def wait_until(self, target):
+        """target(epoch 초)까지 기다린 뒤 실제 깨어난 시각을 반환합니다. 이미 지났으면 바로 반환합니다."""
+        while True:
+            remaining = target - self.clock()
+            if remaining <= self.spin:
+                break
+            time.sleep(min(remaining - self.spin, 1.0))
+        now = self.clock()
+        while now < target:
+            now = self.clock()
+        return now
+
+    def dispatch(self, orders, target=None):
+        """
+        준비된 주문을 target 시각(없으면 즉시)에 스레드 풀로 동시에 전송합니다.
+        전송 간격은 KISAuth.request의 서버별 유량 제한이 맞춥니다.
+
+        Args:
+            orders (list): PreparedOrder 목록
+            target (float, optional): 전송 목표 시각 (epoch 초)
+
+        Returns:
+            list: 전송 결과가 채워진 orders
+        """
+        if not orders:
+            return orders
+        # 전송 스레드는 목표 시각 전에 만들어 둡니다.
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(orders)), thread_name_prefix="OrderDispatch") as pool:
+            if target is not None:
+                late = self.clock() - target
+                if late > 0:
+                    logger.warning("주문 준비가 목표 시각보다 %.3fs 늦게 끝났습니다.", late)
+                self.wait_until(target)
+            started = self.clock()
+            list(pool.map(self._send_order, orders))
+        if target is not None:
+            self._log_timing(orders, target)
+        self._log_latency(orders, self.clock() - started)
+        return orders
+
+    def _send_order(self, order):
+        order.sent_at = self.clock()
+        order.result = self._send(order)
+        order.latency = self.clock() - order.sent_at
+        self.metrics.observe('order_send_seconds', order.latency, side=order.side)
+        return order
+
+    def _send(self, order):
+        while True:
+            try:
+                result = self.kis_api.send_order_request(order.request)
+            except Exception as e:
+                logger.error("주문 전송 실패: %s", e, extra={"ticker": order.ticker, "session_id": order.session_id})
+                return None
+            if result.get('msg1') != RATE_LIMIT_MSG:
+                return result
+            order.retries += 1
+            logger.warning("초당 거래건수 초과, 재전송합니다.", extra={"ticker": order.ticker, "session_id": order.session_id})
+            time.sleep(self.rate_limit_retry)
+
+    def _log_timing(self, orders, target):
+        intended = datetime.fromtimestamp(target).isoformat(timespec='milliseconds')
+        for order in orders:
+            delay = order.sent_at - target
+            self.metrics.observe('order_dispatch_delay_seconds', max(delay, 0.0), side=order.side)
+            logger.info("주문 전송 목표 %s / 실제 %s (%+.2fms, 재전송 %d회)",
+                        intended, datetime.fromtimestamp(order.sent_at).isoformat(timespec='milliseconds'),
+                        delay * 1000, order.retries,
+                        extra={"ticker": order.ticker, "session_id": order.session_id,
+                               "dispatch_delay_ms": round(delay * 1000, 3)})
+
+    def _log_latency(self, orders, elapsed):
+        latencies = [order.latency for order in orders]
+        logger.info("주문 %d건 전송 완료: 전체 %.1fms, 건별 최소 %.1fms / 최대 %.1fms",
+                    len(orders), elapsed * 1000, min(latencies) * 1000, max(latencies) * 1000)
@@ -0,0 +1,224 @@
+# trading/order_manager.py
+import time
+import asyncio
+import logging
+import threading
+from enum import Enum
+from config.condition import ORDER_ESCALATION, ORDER_MAX_ATTEMPTS, ORDER_CANCEL_SETTLE
+from utils.tick_utils import shift_ticks
+from utils.metrics import get_metrics
+from utils.log_setup import bind_log_context
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_MSG = '초당 거래건수를 초과하였습니다.'
+
+
+class OrderState(Enum):
+    NEW = "new"
+    SUBMITTED = "submitted"
+    PARTIALLY_FILLED = "partially_filled"
+    CANCEL_PENDING = "cancel_pending"
+    REPLACED = "replaced"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class ManagedOrder:
+    """주문 하나의 상태 머신. 상태 전이마다 최초 발주 이후 경과 시간을 기록합니다."""
+
+    def __init__(self, ticker, quantity, side, price=None, policy=None):
+        self.ticker = ticker
+        self.quantity = int(quantity)
+        self.side = side
+        self.price = price
+        self.policy = policy or ORDER_ESCALATION[side]
+        self.state = OrderState.NEW
+        self.filled = 0
+        self.tracked_filled = 0  # 현재 발주분의 체결 수량
+        self.odno = None
+        self.attempts = 0
+        self.first_result = None
+        self.last_result = None
+        self.first_fill_ratio = None
+        self.created_at = time.perf_counter()
+        self.transitions = []  # [(상태, 경과 ms)]
+
+    @property
+    def remaining(self):
+        return self.quantity - self.filled
+
+    def transition(self, state):
+        self.state = state
+        self.transitions.append((state.value, round((time.perf_counter() - self.created_at) * 1000, 1)))
+
+    def summary(self):
+        return {
+            "ticker": self.ticker,
+            "side": self.side,
+            "quantity": self.quantity,
+            "filled": self.filled,
+            "attempts": self.attempts,
+            "first_fill_ratio": self.first_fill_ratio,
+            "state": self.state.value,
+            "transitions": self.transitions,
+        }
+
+
+class OrderManager:
+    """
+    매수/매도 주문의 발주-체결대기-취소-재주문을 하나의 이벤트 루프에서 관리합니다.
+    주문마다 상태 머신(ManagedOrder)을 두고 에스컬레이션 정책(지정가 → 유리한 지정가 → 시장가)에 따라
+    재주문하며, 대기는 time.sleep 대신 비동기 타이머와 FillTracker 체결통보로 처리합니다.
+    """
+
+    def __init__(self, kis_api, fill_tracker=None, policies=None, pricer=None):
+        self.kis_api = kis_api
+        self.fill_tracker = fill_tracker
+        self.pricer = pricer  # OrderPricer, 없으면 'marketable' 단계는 지정가로 동작
+        self.policies = policies or ORDER_ESCALATION
+        self.loop = None
+        self.thread = None
+        self.active_orders = set()
+        self.start_lock = threading.Lock()
+        self.metrics = get_metrics()
+
+    def start(self):
+        """주문 관리용 이벤트 루프 스레드를 시작합니다."""
+        with self.start_lock:
+            if self.thread and self.thread.is_alive():
+                return
+            self.loop = asyncio.new_event_loop()
+            self.thread = threading.Thread(target=self.loop.run_forever, name="OrderManager", daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        if self.loop and self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+
+    def submit(self, ticker, quantity, side, price=None, policy=None):
+        """
+        주문을 등록하고 완료 시 ManagedOrder를 돌려주는 concurrent Future를 반환합니다.
+        여러 주문을 동시에 걸어두고 각각의 Future를 기다릴 수 있습니다.
+        """
+        self.start()
+        order = ManagedOrder(ticker, quantity, side, price, policy or self.policies.get(side))
+        return asyncio.run_coroutine_threadsafe(self._run(order), self.loop)
+
+    def execute(self, ticker, quantity, side, price=None, policy=None):
+        """주문을 실행하고 완료(DONE/FAILED)까지 기다린 뒤 ManagedOrder를 반환합니다."""
+        return self.submit(ticker, quantity, side, price, policy).result()
+
+    async def _run(self, order):
+        bind_log_context(ticker=order.ticker, side=order.side)
+        self.active_orders.add(order)
+        try:
+            while order.remaining > 0:
+                if order.attempts >= ORDER_MAX_ATTEMPTS:
+                    logger.error("Order %s %s gave up after %d attempts", order.side, order.ticker, order.attempts)
+                    order.transition(OrderState.FAILED)
+                    break
+                kind, ticks, wait = order.policy[min(order.attempts, len(order.policy) - 1)]
+                price = await self._step_price(order, kind, ticks)
+                result = await self._place(order, price)
+                if result is None or result.get('rt_cd') != '0':
+                    order.transition(OrderState.FAILED)
+                    break
+                order.odno = result.get('output', {}).get('ODNO')
+                order.transition(OrderState.SUBMITTED if order.attempts == 1 else OrderState.REPLACED)
+
+                filled = await self._wait_fill(order, order.remaining, wait)
+                order.filled += filled
+                if order.attempts == 1:
+                    order.first_fill_ratio = self._record_first_attempt(order, filled)
+                if order.remaining <= 0:
+                    break
+                order.transition(OrderState.CANCEL_PENDING)
+                await asyncio.to_thread(self.kis_api.cancel_order, order.odno)
+                await asyncio.sleep(ORDER_CANCEL_SETTLE)
+                order.filled += await self._late_fills(order)
+            if order.remaining <= 0:
+                order.transition(OrderState.DONE)
+        except Exception as e:
+            logger.error("Order %s %s failed: %s", order.side, order.ticker, e)
+            order.transition(OrderState.FAILED)
+        finally:
+            self.active_orders.discard(order)
+        # 최초 발주 요청부터 전량 체결(또는 실패)까지
+        self.metrics.observe('order_fill_seconds', time.perf_counter() - order.created_at,
+                             side=order.side, state=order.state.value)
+        logger.info("Order finished: %s", order.summary())
+        return order
+
+    async def _step_price(self, order, kind, ticks):
+        """정책 단계별 주문 가격. 시장가는 None."""
+        if kind == 'market':
+            return None
+        if kind == 'marketable' and self.pricer:
+            price, _ = await asyncio.to_thread(self.pricer.marketable_price, order.ticker, order.side, order.remaining)
+            if price:
+                return shift_ticks(price, ticks, order.side)
+        base = order.price
+        if base is None:
+            base = int((await asyncio.to_thread(self.kis_api.get_current_price, order.ticker))[0])
+        return shift_ticks(base, ticks, order.side)
+
+    async def _place(self, order, price):
+        """발주. 초당 거래건수 초과 응답은 잠시 후 재시도합니다."""
+        while True:
+            result = await asyncio.to_thread(self.kis_api.place_order, order.ticker, order.remaining, order.side, price)
+            if result.get('msg1') == RATE_LIMIT_MSG:
+                await asyncio.sleep(0.5)
+                continue
+            order.attempts += 1
+            order.last_result = result
+            if order.first_result is None:
+                order.first_result = result
+            return result
+
+    async def _wait_fill(self, order, quantity, timeout):
+        """
+        현재 발주분의 체결 수량을 반환합니다.
+        FillTracker가 있으면 전량 체결 통보 즉시 깨어나고, 없으면 timeout 후 체결조회합니다.
+        """
+        if self.fill_tracker is None:
+            await asyncio.sleep(timeout)
+            order.tracked_filled = await self._inquire_filled(order)
+            return order.tracked_filled
+
+        loop = asyncio.get_running_loop()
+
+        def on_fill(tracked):
+            if tracked.filled and tracked.remaining:
+                loop.call_soon_threadsafe(self._mark_partial, order)
+
+        future = self.fill_tracker.track(order.odno, quantity, listener=on_fill)
+        await asyncio.wait([asyncio.wrap_future(future)], timeout=timeout)
+        tracked = self.fill_tracker.get_order(order.odno)
+        order.tracked_filled = tracked.filled if tracked else 0
+        if tracked and tracked.remaining == 0:
+            self.fill_tracker.untrack(order.odno)
+        return order.tracked_filled
+
+    async def _inquire_filled(self, order):
+        exec_result = await asyncio.to_thread(self.kis_api.daily_order_execution_inquiry, order.odno)
+        return int(exec_result.get('output1')[0].get('tot_ccld_qty'))
+
+    async def _late_fills(self, order):
+        """취소 확정 전 체결된 수량을 추가로 반영합니다."""
+        if self.fill_tracker is None:
+            return max(await self._inquire_filled(order) - order.tracked_filled, 0)
+        tracked = self.fill_tracker.get_order(order.odno)
+        self.fill_tracker.untrack(order.odno)
+        if tracked is None:
+            return 0
+        return max(tracked.filled - order.tracked_filled, 0)
+
+    def _record_first_attempt(self, order, filled):
+        if self.pricer:
+            return self.pricer.record_first_attempt(order, filled)
+        return round(filled / order.quantity, 4) if order.quantity else 0.0
+
+    def _mark_partial(self, order):
+        if order.state in (OrderState.SUBMITTED, OrderState.REPLACED):
+            order.transition(OrderState.PARTIALLY_FILLED)
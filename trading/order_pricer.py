@@ -0,0 +1,88 @@
+# trading/order_pricer.py
+import logging
+import threading
+from bisect import bisect_left
+from config.condition import PRICING_SLIPPAGE_TICKS, PRICING_MAX_BOOK_AGE
+from api.order_book import BOOK_LEVELS
+from utils.tick_utils import snap_to_tick, shift_ticks
+
+logger = logging.getLogger(__name__)
+
+
+class OrderPricer:
+    """
+    호가창 잔량을 기준으로 한 번에 체결될 지정가(marketable limit)를 계산합니다.
+    매도는 매수호가 누적 잔량이, 매수는 매도호가 누적 잔량이 주문 수량을 덮는 호가를 택하고
+    KRX 호가 단위에 맞춥니다. 최초 발주 체결률도 함께 집계합니다.
+    """
+
+    def __init__(self, kis_api=None, order_books=None, slippage_ticks=PRICING_SLIPPAGE_TICKS,
+                 max_book_age=PRICING_MAX_BOOK_AGE):
+        self.kis_api = kis_api
+        self.order_books = order_books  # OrderBookRegistry
+        self.slippage_ticks = slippage_ticks
+        self.max_book_age = max_book_age
+        self.lock = threading.Lock()
+        self.first_attempts = 0
+        self.first_fill_qty = 0
+        self.first_order_qty = 0
+        self.one_shot_fills = 0
+
+    def marketable_price(self, ticker, side, quantity):
+        """
+        즉시 체결 가능한 지정가를 반환합니다.
+
+        Args:
+            ticker (str): 종목코드
+            side (str): 'buy' 또는 'sell'
+            quantity (int): 주문 수량
+
+        Returns:
+            tuple: (가격, 근거 'book' | 'stale_book' | 'quote') / 가격을 정할 수 없으면 (None, None)
+        """
+        book = self.order_books.snapshot(ticker) if self.order_books else None
+        if book:
+            price = self._price_from_book(book, side, quantity)
+            if price:
+                if book.age() <= self.max_book_age:
+                    return snap_to_tick(price, side), 'book'
+                return shift_ticks(price, self.slippage_ticks, side), 'stale_book'
+        if self.kis_api is None:
+            return None, None
+        current_price = int(self.kis_api.get_current_price(ticker)[0])
+        return shift_ticks(current_price, self.slippage_ticks, side), 'quote'
+
+    def _price_from_book(self, book, side, quantity):
+        """누적 잔량이 quantity 이상이 되는 호가. 잔량이 모자라면 마지막 호가에서 여유 틱을 더합니다."""
+        if side == 'sell':
+            prices, cumulative = book.bid_prices, book.bid_cum
+        else:
+            prices, cumulative = book.ask_prices, book.ask_cum
+        level = bisect_left(cumulative, quantity)
+        if level < BOOK_LEVELS and prices[level]:
+            return prices[level]
+        deepest = next((p for p in reversed(prices) if p), 0)
+        if not deepest:
+            return None
+        return shift_ticks(deepest, self.slippage_ticks, side)
+
+    def record_first_attempt(self, order, filled):
+        """최초 발주분의 체결률을 기록하고 반환합니다."""
+        ratio = filled / order.quantity if order.quantity else 0.0
+        with self.lock:
+            self.first_attempts += 1
+            self.first_fill_qty += filled
+            self.first_order_qty += order.quantity
+            if filled >= order.quantity:
+                self.one_shot_fills += 1
+        logger.info("First attempt fill ratio %s %s: %.2f", order.side, order.ticker, ratio)
+        return ratio
+
+    def stats(self):
+        """최초 발주 체결률 누적 통계"""
+        with self.lock:
+            return {
+                "orders": self.first_attempts,
+                "first_fill_ratio": round(self.first_fill_qty / self.first_order_qty, 4) if self.first_order_qty else None,
+                "one_shot_rate": round(self.one_shot_fills / self.first_attempts, 4) if self.first_attempts else None,
+            }
@@ -0,0 +1,48 @@
+# trading/session_events.py
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class SessionEvents:
+    """
+    거래 세션 변경(생성/갱신/삭제) 알림.
+    스케줄러 스레드에서 publish하면 구독 중인 asyncio 이벤트와 콜백이 즉시 깨어납니다.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.async_subscribers = []  # [(loop, asyncio.Event)]
+        self.callbacks = []
+
+    def subscribe_async(self, loop, event):
+        """asyncio.Event를 구독 등록합니다. publish 시 해당 루프에서 set됩니다."""
+        with self.lock:
+            self.async_subscribers.append((loop, event))
+
+    def subscribe(self, callback):
+        """callback(reason, session_id)을 구독 등록합니다."""
+        with self.lock:
+            self.callbacks.append(callback)
+
+    def unsubscribe_async(self, event):
+        with self.lock:
+            self.async_subscribers = [(l, e) for l, e in self.async_subscribers if e is not event]
+
+    def publish(self, reason, session_id=None):
+        with self.lock:
+            async_subscribers = list(self.async_subscribers)
+            callbacks = list(self.callbacks)
+        for loop, event in async_subscribers:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(event.set)
+        for callback in callbacks:
+            try:
+                callback(reason, session_id)
+            except Exception as e:
+                logger.error("Session event callback error: %s", e)
+
+
+# 프로세스 공용 인스턴스
+session_events = SessionEvents()
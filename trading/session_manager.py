@@ -1,33 +1,62 @@
 # trading/session_manager.py
+import logging
 import random
 import time
 import asyncio
 from datetime import datetime, date
+from concurrent.futures import ThreadPoolExecutor
 from database.db_manager import DatabaseManager
 from utils.date_utils import DateUtils
 from utils.slack_logger import SlackLogger
 from api.kis_api import KISApi
 from api.kis_websocket import KISWebSocket
-from config.condition import DAYS_LATER, COUNT, SELL_WAIT
+from trading.order_manager import OrderManager, OrderState
+from trading.order_pricer import OrderPricer
+from trading.order_dispatcher import OrderDispatcher
+from trading.session_events import session_events as default_session_events
+from trading.session_store import get_session_store
+from config.condition import DAYS_LATER, COUNT, SESSION_ORDER_WORKERS, SESSION_UPDATE_SETTLE
+from utils.tracing import traced
+
+logger = logging.getLogger(__name__)
+
+
+def _odno_key(odno):
+    """주문번호 색인 키 (응답마다 앞자리 0 채움이 달라도 같은 주문으로 봄)"""
+    return str(odno).lstrip('0')
 
 class SessionManager:
-    def __init__(self, kis_api=None, slack_logger=None, date_utils=None):
+    def __init__(self, kis_api=None, slack_logger=None, date_utils=None, fill_tracker=None, order_manager=None,
+                 order_books=None, session_events=None, session_store=None, order_dispatcher=None,
+                 order_workers=SESSION_ORDER_WORKERS):
         # 의존성 주입: 외부에서 인스턴스를 전달하거나 기본값 사용
         self.kis_api = kis_api if kis_api else KISApi(is_mock=True)
         self.slack_logger = slack_logger if slack_logger else SlackLogger()
         self.date_utils = date_utils if date_utils else DateUtils()
+        self.fill_tracker = fill_tracker
+        self.order_manager = order_manager if order_manager else OrderManager(
+            self.kis_api, fill_tracker, pricer=OrderPricer(self.kis_api, order_books))
+        # 세션 변경 알림 (MonitoringManager가 구독해 모니터링 대상을 즉시 갱신)
+        self.session_events = session_events if session_events else default_session_events
+        # 세션 조회/변경은 메모리 저장소에서 (DB에는 저장소가 비동기로 반영)
+        self.session_store = session_store if session_store else get_session_store()
+        # 매수 요청을 미리 만들어 정해진 시각에 보내는 발송기
+        self.order_dispatcher = order_dispatcher if order_dispatcher else OrderDispatcher(self.kis_api)
+        self.order_workers = order_workers  # 세션별 주문 준비를 동시에 처리할 스레드 수
 
-    def start_trading_session(self):
+    @traced(cat='trading')
+    def start_trading_session(self, target=None):
         """
         거래 세션을 시작하고, 각 세션별 주문을 실행한 후 결과 리스트를 반환합니다.
+        가용 현금/종목 배정/현재가/수량/주문 요청은 먼저 준비하고, target(epoch 초)이 있으면 그 시각에 전송합니다.
+        세션별 준비와 전송은 동시에 진행하고(속도는 공용 유량 제한이 결정) 결과는 세션 순서대로 반환합니다.
         """
-        db = DatabaseManager()
         session_info = self.check_trading_session()
         fund = self.calculate_funds(session_info['slot'])
         
-        # 신규 세션 생성(빈 슬롯 만큼)
-        for _ in range(int(session_info['slot'])):
-            self.add_new_session(fund)
+        # 신규 세션 생성(빈 슬롯 만큼, 종목은 한 번에 배정)
+        for stock in self.allocate_stocks(int(session_info['slot'])):
+            self.add_new_session(fund, stock)
         
         try:
             # 세션 시작 로그 전송
@@ -40,44 +69,43 @@ class SessionManager:
                 }
             )
             
-            sessions = db.load_trading_session()
-            db.close()
+            sessions = self.session_store.all()
             if not sessions:
-                print("진행 중인 거래 세션이 없습니다.")
+                logger.info("진행 중인 거래 세션이 없습니다.")
                 return []
             
-            order_list = []
+            targets = []
             for session in sessions:
                 # 거래 횟수가 COUNT에 도달하면 건너뜁니다.
                 if session.get("count") == COUNT:
-                    print(f"{session.get('name')}은 {COUNT}번의 거래를 진행해 넘어갑니다.")
+                    logger.info("%s은 %d번의 거래를 진행해 넘어갑니다.", session.get('name'), COUNT, extra={"ticker": session.get('ticker'), "session_id": session.get('id')})
                     continue
-                order_result = self.place_order_for_session(session)
-                order_list.append(order_result)
-            return order_list
+                targets.append(session)
+            if not targets:
+                return []
+            with ThreadPoolExecutor(max_workers=min(self.order_workers, len(targets)),
+                                    thread_name_prefix="SessionOrder") as pool:
+                orders = list(pool.map(self._try_prepare_order, targets))
+            self.order_dispatcher.dispatch([order for order in orders if order], target)
+            return [self.finish_order_for_session(session, order) if order else None
+                    for session, order in zip(targets, orders)]
         except Exception as e:
-            db.close()
-            print("Trading session 실행 중 에러:", e)
+            logger.error("Trading session 실행 중 에러: %s", e)
             return []
 
     def check_trading_session(self):
         """
         현재 진행 중인 거래 세션 수를 확인하고, 남은 슬롯 수를 계산합니다.
         """
-        db = DatabaseManager()
-        db.cursor.execute('SELECT COUNT(*) FROM trading_session')
-        result = db.cursor.fetchone()
-        session_count = result.get('COUNT(*)')
+        session_count = self.session_store.count()
         slot_count = 3 - session_count
-        db.close()
         return {'session': session_count, 'slot': slot_count}
 
-    def add_new_session(self, fund):
+    def add_new_session(self, fund, stock=None):
         """
-        새로운 거래 세션을 생성합니다.
+        새로운 거래 세션을 생성합니다. stock이 없으면 매수 후보에서 한 종목을 배정합니다.
         """
-        db = DatabaseManager()
-        exclude_nums = []  # 필요한 경우 기존 세션 ID를 수집
+        exclude_nums = self.session_store.ids()
         random_id = self.generate_random_id(exclude=exclude_nums)
         today = datetime.now()
         count = 0
@@ -85,22 +113,36 @@ class SessionManager:
         quantity = 0
         avr_price = 0
         
-        # 거래에 사용할 종목 할당 (allocate_stock는 TradingLogic과 공유하거나 별도 유틸로 분리 가능)
-        stock = self.allocate_stock()
         if stock is None:
-            db.close()
+            stock = self.allocate_stock()
+        if stock is None:
             return None
         
-        db.save_trading_session(random_id, today, today, stock['ticker'], stock['name'], fund, spent_fund, quantity, avr_price, count)
-        db.close()
+        self.session_store.upsert((random_id, today, today, stock['ticker'], stock['name'], fund, spent_fund, quantity, avr_price, count))
+        self.session_events.publish('created', random_id)
         return random_id
 
     def place_order_for_session(self, session):
         """
         주어진 세션 정보를 바탕으로 매수 주문을 진행합니다.
         """
-        time.sleep(0.9)  # API 호출 간 간격 조정
-        db = DatabaseManager()
+        order = self.prepare_order_for_session(session)
+        self.order_dispatcher.dispatch([order])
+        return self.finish_order_for_session(session, order)
+
+    def _try_prepare_order(self, session):
+        """준비 중 오류가 난 세션은 이번 매수에서 빼고(None) 나머지 세션은 계속 진행합니다."""
+        try:
+            return self.prepare_order_for_session(session)
+        except Exception as e:
+            logger.error("매수 주문 준비 실패: %s", e, extra={"ticker": session.get('ticker'), "session_id": session.get('id')})
+            return None
+
+    def prepare_order_for_session(self, session):
+        """
+        세션의 매수 수량을 계산하고 주문 요청(헤더/본문)을 미리 만듭니다.
+        API 호출 간격은 KISAuth의 공용 유량 제한이 맞춥니다.
+        """
         result = self.kis_api.get_current_price(session.get('ticker'))
         price = int(result[0])
         
@@ -113,90 +155,134 @@ class SessionManager:
             remaining_fund = float(session.get('fund')) - session.get('spent_fund')
             quantity = remaining_fund / price
         quantity = int(quantity)
-        
-        # 주문 실행 및 미체결 주문 처리
-        order_result = None
-        if session.get('count') < COUNT:
-            while True:
-                order_result = self.kis_api.place_order(session.get('ticker'), quantity, order_type='buy')
-                if order_result['msg1'] == '초당 거래건수를 초과하였습니다.':
-                    print("초당 거래건수 초과, 재시도합니다.")
-                    continue
-                break
-        
-        # 첫 주문 실패시 세션 삭제
+        return self.order_dispatcher.prepare(session.get('ticker'), quantity, 'buy', session_id=session.get('id'))
+
+    def finish_order_for_session(self, session, order):
+        """
+        전송 결과를 확인합니다. 첫 주문이 실패하면 세션을 삭제합니다.
+        """
+        order_result = order.result or {'rt_cd': '1', 'msg1': '주문 전송 실패'}
         if order_result['rt_cd'] == '1' and session.get('count') == 0:
-            print("첫 주문 실패, 해당 세션을 삭제합니다:", session)
-            db.delete_session_one_row(session.get('id'))
-        db.close()
+            logger.warning("첫 주문 실패, 해당 세션을 삭제합니다: %s", order_result.get('msg1'), extra={"ticker": session.get('ticker'), "session_id": session.get('id')})
+            self.session_store.delete(session.get('id'))
+            self.session_events.publish('deleted', session.get('id'))
         return order_result
 
     def load_and_update_sessions(self, order_list):
         """
-        거래 세션을 불러와 주문 결과에 따라 세션을 업데이트합니다.
+        주문 결과에 따라 세션을 업데이트합니다.
+        당일 체결 내역과 잔고를 한 번씩만 (연속조회로 전부) 받아 주문번호/종목코드로 색인한 뒤
+        모든 세션을 한 번에 갱신하고 DB에는 배치 한 번으로 반영합니다.
         """
-        db = DatabaseManager()
         try:
-            sessions = db.load_trading_session()
+            sessions = {session.get('ticker'): session for session in self.session_store.all()}
             if not sessions:
-                print("진행 중인 거래 세션이 없습니다.")
+                logger.info("진행 중인 거래 세션이 없습니다.")
                 return
-            for index, session in enumerate(sessions):
-                self.update_session(session, order_list[index])
-            db.close()
+            executions, holdings = self._fetch_fills()
+            updates = []
+            for order_result in order_list:
+                if order_result is None:
+                    continue
+                odno = (order_result.get('output') or {}).get('ODNO')
+                execution = executions.get(_odno_key(odno)) if odno else None
+                session = sessions.get(execution.get('pdno')) if execution else None
+                if session is None:
+                    logger.warning("세션을 찾을 수 없는 주문 결과: %s %s", odno, order_result.get('msg1'))
+                    continue
+                row = self._build_session_update(session, order_result, executions, holdings)
+                if row:
+                    updates.append(row)
+            for record in self.session_store.upsert_many(updates):
+                self._notify_session_update(record.as_row())
         except Exception as e:
-            print("세션 업데이트 중 에러 발생:", e)
-            db.close()
+            logger.error("세션 업데이트 중 에러 발생: %s", e)
 
     def update_session(self, session, order_result):
         """
         주문 결과에 따라 세션 정보를 업데이트합니다.
         """
         try:
-            time.sleep(0.8)
-            db = DatabaseManager()
-            odno = order_result.get('output', {}).get('ODNO')
-            if odno is not None:
-                exec_result = self.kis_api.daily_order_execution_inquiry(odno)
-                real_spent_fund = exec_result.get('output1')[0].get('tot_ccld_amt')
-                real_quantity = exec_result.get('output1')[0].get('tot_ccld_qty')
-                
-                balance_result = self.kis_api.balance_inquiry()
-                index_of_odno = next((i for i, d in enumerate(balance_result) if d.get('pdno') == session.get('ticker')), -1)
-                avr_price = int(float(balance_result[index_of_odno].get("pchs_avg_pric")))
-                print("업데이트된 매입 단가:", avr_price)
-            else:
-                print("주문 번호가 없으므로 세션 업데이트를 취소합니다. 사유:", order_result.get('msg1'))
-                db.close()
+            executions, holdings = self._fetch_fills()
+            row = self._build_session_update(session, order_result, executions, holdings)
+            if row is None:
                 return
+            self.session_store.upsert(row)
+            self._notify_session_update(row)
+        except Exception as e:
+            logger.error("세션 업데이트 중 에러: %s", e, extra={"ticker": session.get('ticker'), "session_id": session.get('id')})
+
+    def _fetch_fills(self):
+        """
+        체결 반영을 잠시 기다린 뒤 당일 체결 내역과 잔고를 한 번씩 조회합니다.
+
+        Returns:
+            tuple: ({주문번호 키: 체결 행}, {종목코드: 잔고 행})
+        """
+        time.sleep(SESSION_UPDATE_SETTLE)
+        executions = {_odno_key(row.get('odno')): row for row in self.kis_api.daily_order_executions()}
+        holdings = {row.get('pdno'): row for row in self.kis_api.balance_holdings()}
+        return executions, holdings
+
+    def _build_session_update(self, session, order_result, executions, holdings):
+        """
+        주문 결과를 반영한 세션 행
+        (id, start_date, current_date, ticker, name, fund, spent_fund, quantity, avr_price, count)을 만듭니다.
+        executions/holdings는 _fetch_fills 결과. 주문이 실패했거나 체결 내역이 없으면 None.
+        """
+        if order_result is None:
+            return None
+        log_extra = {"ticker": session.get('ticker'), "session_id": session.get('id')}
+        try:
+            odno = (order_result.get('output') or {}).get('ODNO')
+            if odno is None:
+                logger.warning("주문 번호가 없으므로 세션 업데이트를 취소합니다. 사유: %s", order_result.get('msg1'),
+                               extra=log_extra)
+                return None
+            if order_result.get('rt_cd') != "0":
+                logger.warning("주문 실패: %s", order_result.get('message'), extra=log_extra)
+                return None
+            execution = executions.get(_odno_key(odno))
+            if execution is None:
+                logger.warning("체결 내역에 주문 %s이 없어 세션 업데이트를 건너뜁니다.", odno, extra=log_extra)
+                return None
+            real_spent_fund = execution.get('tot_ccld_amt')
+            real_quantity = execution.get('tot_ccld_qty')
 
-            current_date = datetime.now()
-            if order_result.get('rt_cd') == "0":
-                spent_fund = int(session.get('spent_fund')) + int(real_spent_fund)
-                quantity = int(session.get('quantity')) + int(real_quantity)
-                count = session.get('count') + 1
-                db.save_trading_session(session.get('id'), session.get('start_date'), current_date, 
-                                          session.get('ticker'), session.get('name'),
-                                          session.get('fund'), spent_fund, quantity, avr_price, count)
-                db.close()
-                self.slack_logger.send_log(
-                    level="INFO",
-                    message="세션 업데이트",
-                    context={
-                        "세션ID": session.get('id'),
-                        "종목명": session.get('name'),
-                        "투자금액": session.get('fund'),
-                        "사용금액": spent_fund,
-                        "평균단가": avr_price,
-                        "보유수량": quantity,
-                        "거래횟수": count
-                    }
-                )
+            holding = holdings.get(session.get('ticker'))
+            if holding:
+                avr_price = int(float(holding.get("pchs_avg_pric")))
+                logger.info("업데이트된 매입 단가: %s", avr_price, extra=log_extra)
             else:
-                print("주문 실패:", order_result.get('message'))
-                db.close()
+                avr_price = session.get('avr_price')
+                logger.warning("잔고에 종목이 없어 기존 매입 단가를 유지합니다.", extra=log_extra)
+
+            spent_fund = int(session.get('spent_fund')) + int(real_spent_fund)
+            quantity = int(session.get('quantity')) + int(real_quantity)
+            count = session.get('count') + 1
+            return (session.get('id'), session.get('start_date'), datetime.now(),
+                    session.get('ticker'), session.get('name'),
+                    session.get('fund'), spent_fund, quantity, avr_price, count)
         except Exception as e:
-            print("세션 업데이트 중 에러:", e)
+            logger.error("세션 업데이트 중 에러: %s", e, extra=log_extra)
+        return None
+
+    def _notify_session_update(self, row):
+        session_id, _, _, _, name, fund, spent_fund, quantity, avr_price, count = row
+        self.session_events.publish('updated', session_id)
+        self.slack_logger.send_log(
+            level="INFO",
+            message="세션 업데이트",
+            context={
+                "세션ID": session_id,
+                "종목명": name,
+                "투자금액": fund,
+                "사용금액": spent_fund,
+                "평균단가": avr_price,
+                "보유수량": quantity,
+                "거래횟수": count
+            }
+        )
 
     def monitor_for_selling(self, sessions_info):
         """
@@ -204,33 +290,28 @@ class SessionManager:
         sessions_info는 (session_id, ticker, name, quantity, avr_price, start_date, target_date)의 리스트입니다.
         """
         async def _monitor():
-            kis_ws = KISWebSocket(self.sell_order)
+            kis_ws = KISWebSocket(self.sell_order, fill_tracker=self.fill_tracker)
             complete = await kis_ws.real_time_monitoring(sessions_info)
             if complete:
-                print("모니터링 정상 종료")
+                logger.info("모니터링 정상 종료")
             else:
-                print("모니터링 비정상 종료")
+                logger.warning("모니터링 비정상 종료")
         return asyncio.run(_monitor())
 
+    @traced(cat='trading')
     def sell_order(self, session_id, ticker, quantity, price=None):
         """
         매도 주문 실행 및 미체결 주문 처리 후 완료되면 해당 세션 삭제.
         """
         try:
-            order_result = self.kis_api.place_order(ticker, quantity, order_type='sell', price=price)
-            time.sleep(SELL_WAIT)
-            unfilled_qty = self.order_complete_check(order_result)
-            new_order_result = order_result
-            while unfilled_qty > 0:
-                cancel_result = self.kis_api.cancel_order(new_order_result.get('output').get('ODNO'))
-                time.sleep(1)
-                new_order_result = self.kis_api.place_order(ticker, unfilled_qty, order_type='sell')
-                time.sleep(SELL_WAIT)
-                unfilled_qty = self.order_complete_check(new_order_result)
+            order = self.order_manager.execute(ticker, quantity, 'sell', price=price)
+            logger.info("매도 주문 결과: %s", order.summary(), extra={"ticker": ticker, "session_id": session_id})
+            if order.state != OrderState.DONE:
+                return False
             self.delete_finished_session(session_id)
             return True
         except Exception as e:
-            print("매도 주문 중 에러 발생:", e)
+            logger.error("매도 주문 중 에러 발생: %s", e, extra={"ticker": ticker, "session_id": session_id})
 
     def order_complete_check(self, order_result):
         exec_result = self.kis_api.daily_order_execution_inquiry(order_result.get('output').get('ODNO'))
@@ -238,17 +319,13 @@ class SessionManager:
         return unfilled_qty
 
     def delete_finished_session(self, session_id):
-        db = DatabaseManager()
-        db.delete_session_one_row(session_id)
-        db.close()
-        print(f"{session_id} 세션 삭제됨.")
+        self.session_store.delete(session_id)
+        self.session_events.publish('deleted', session_id)
+        logger.info("%s 세션 삭제됨.", session_id, extra={"session_id": session_id})
 
     def get_session_info(self):
-        db = DatabaseManager()
-        sessions = db.load_trading_session()
-        db.close()
         sessions_info = []
-        for session in sessions:
+        for session in self.session_store.all():
             target_date = self.date_utils.get_target_date(
                 date.fromisoformat(str(session.get('start_date')).split()[0]), DAYS_LATER
             )
@@ -276,12 +353,8 @@ class SessionManager:
     def calculate_funds(self, slot):
         data = self.kis_api.purchase_availability_inquiry()
         balance = float(data.get('output').get('nrcvb_buy_amt'))
-        print("가용 현금:", balance)
-        session_fund = 0
-        with DatabaseManager() as db:
-            sessions = db.load_trading_session()
-            for session in sessions:
-                session_fund += int(session.get('spent_fund'))
+        logger.info("가용 현금: %s", balance)
+        session_fund = self.session_store.spent_fund_total()
         try:
             if slot == 3:
                 allocated = balance / 3
@@ -291,23 +364,23 @@ class SessionManager:
                 allocated = (balance - session_fund)
             else:
                 allocated = 0
-            print("할당 자금:", allocated)
+            logger.info("할당 자금: %s", allocated)
             return int(allocated)
         except Exception as e:
-            print("자금 할당 에러:", e)
+            logger.error("자금 할당 에러: %s", e)
             return 0
 
     def allocate_stock(self):
-        db = DatabaseManager()
+        stocks = self.allocate_stocks(1)
+        return stocks[0] if stocks else None
+
+    def allocate_stocks(self, count):
+        """매수 후보에서 최대 count개 종목을 한 트랜잭션으로 배정합니다 (동시 실행 시 중복 배정 없음)."""
+        if count <= 0:
+            return []
         try:
-            selected_stock = db.get_selected_stocks()
-            if selected_stock:
-                db.delete_selected_stock_by_no(selected_stock.get('no'))
-                db.close()
-                return selected_stock
-            else:
-                db.close()
-                return None
+            with DatabaseManager() as db:
+                return db.claim_selected_stocks(count)
         except Exception as e:
-            print("종목 할당 에러:", e)
-            return None
\ No newline at end of file
+            logger.error("종목 할당 에러: %s", e)
+            return []
\ No newline at end of file
@@ -0,0 +1,301 @@
+# trading/session_store.py
+import queue
+import logging
+import threading
+from collections import Counter
+from datetime import datetime
+from database.db_connection_manager import DBConnectionManager
+from database.trading_session_repository import TradingSessionRepository
+from trading.session_events import session_events as default_session_events
+from config.condition import SESSION_STORE_REFRESH_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+
+class SessionRecord:
+    """trading_session 한 행. 기존 세션 dict처럼 get()으로도 읽을 수 있습니다."""
+    __slots__ = ('id', 'start_date', 'current_date', 'ticker', 'name', 'fund', 'spent_fund', 'quantity',
+                 'avr_price', 'count')
+
+    def __init__(self, id, start_date, current_date, ticker, name, fund, spent_fund, quantity, avr_price, count):
+        self.id = int(id)
+        self.start_date = _to_date(start_date)
+        self.current_date = _to_date(current_date)
+        self.ticker = ticker
+        self.name = name
+        self.fund = int(fund or 0)
+        self.spent_fund = int(spent_fund or 0)
+        self.quantity = int(quantity or 0)
+        self.avr_price = int(avr_price or 0)
+        self.count = int(count or 0)
+
+    @classmethod
+    def from_row(cls, row):
+        """DB 조회 결과(dict) 또는 save_trading_session 인자 순서의 튜플로 생성합니다."""
+        if isinstance(row, dict):
+            return cls(*(row.get(field) for field in cls.__slots__))
+        return cls(*row)
+
+    def as_row(self):
+        """save_trading_session(s) 인자 순서의 튜플"""
+        return tuple(getattr(self, field) for field in self.__slots__)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def __repr__(self):
+        return f"SessionRecord({', '.join(f'{f}={getattr(self, f)!r}' for f in self.__slots__)})"
+
+
+def _to_date(value):
+    return value.date() if isinstance(value, datetime) else value
+
+
+class SessionStore:
+    """
+    거래 세션의 메모리 저장소. 시작 시 한 번 DB에서 읽고 이후 조회는 메모리에서 처리합니다.
+    변경은 메모리에 즉시 반영하고 전용 스레드가 순서대로 DB에 씁니다 (write-through).
+    주기적으로 DB를 다시 읽어 외부에서 바뀐 세션을 반영합니다.
+    """
+
+    def __init__(self, pool=None, session_events=None, refresh_interval=SESSION_STORE_REFRESH_INTERVAL):
+        self.pool = pool
+        self.session_events = session_events if session_events else default_session_events
+        self.refresh_interval = refresh_interval
+        self.lock = threading.RLock()
+        self.by_id = {}
+        self.by_ticker = {}     # 종목코드 -> {세션 ID}
+        self.loaded = False
+        self.pending = Counter()    # 세션 ID별 DB 미반영 쓰기 수
+        self.mutations = Counter()  # 세션 ID별 메모리 변경 횟수 (refresh 중 변경 감지)
+        self.writes = queue.Queue()
+        self.writer = None
+        self.refresher = None
+        self.stop_event = threading.Event()
+        self.write_errors = 0
+
+    # 조회
+
+    def ensure_loaded(self):
+        if not self.loaded:
+            self.load()
+
+    def all(self):
+        """전체 세션 (DB 조회와 같은 ID 순서)"""
+        self.ensure_loaded()
+        with self.lock:
+            return [self.by_id[session_id] for session_id in sorted(self.by_id)]
+
+    def get(self, session_id):
+        self.ensure_loaded()
+        return self.by_id.get(int(session_id))
+
+    def find_by_ticker(self, ticker):
+        self.ensure_loaded()
+        with self.lock:
+            return [self.by_id[session_id] for session_id in sorted(self.by_ticker.get(ticker, ()))]
+
+    def ids(self):
+        self.ensure_loaded()
+        with self.lock:
+            return set(self.by_id)
+
+    def count(self):
+        self.ensure_loaded()
+        return len(self.by_id)
+
+    def spent_fund_total(self):
+        self.ensure_loaded()
+        with self.lock:
+            return sum(record.spent_fund for record in self.by_id.values())
+
+    # 변경 (메모리 즉시 반영 + 비동기 DB 반영)
+
+    def upsert(self, row):
+        """세션을 추가/갱신합니다. row는 SessionRecord, dict 또는 save_trading_session 인자 순서의 튜플."""
+        record = row if isinstance(row, SessionRecord) else SessionRecord.from_row(row)
+        self.ensure_loaded()
+        with self.lock:
+            self._put(record)
+            self._enqueue(('upsert', record.id, record.as_row()))
+        return record
+
+    def upsert_many(self, rows):
+        """여러 세션을 갱신합니다. DB에는 한 번의 배치로 씁니다."""
+        records = [row if isinstance(row, SessionRecord) else SessionRecord.from_row(row) for row in rows]
+        self.ensure_loaded()
+        with self.lock:
+            for record in records:
+                self._put(record)
+                self._enqueue(('upsert', record.id, record.as_row()))
+        return records
+
+    def delete(self, session_id):
+        session_id = int(session_id)
+        self.ensure_loaded()
+        with self.lock:
+            self._remove(session_id)
+            self._enqueue(('delete', session_id, None))
+
+    def _put(self, record):
+        previous = self.by_id.get(record.id)
+        if previous and previous.ticker != record.ticker:
+            self.by_ticker.get(previous.ticker, set()).discard(record.id)
+        self.by_id[record.id] = record
+        self.by_ticker.setdefault(record.ticker, set()).add(record.id)
+        self.mutations[record.id] += 1
+
+    def _remove(self, session_id):
+        record = self.by_id.pop(session_id, None)
+        if record:
+            ids = self.by_ticker.get(record.ticker)
+            if ids:
+                ids.discard(session_id)
+                if not ids:
+                    del self.by_ticker[record.ticker]
+        self.mutations[session_id] += 1
+
+    def _enqueue(self, op):
+        self.pending[op[1]] += 1
+        self.start()
+        self.writes.put(op)
+
+    # DB 동기화
+
+    def _load_rows(self):
+        with DBConnectionManager(self.pool) as db:
+            return TradingSessionRepository(db).load_trading_session()
+
+    def load(self):
+        """DB에서 전체 세션을 읽어 메모리 상태를 맞춥니다."""
+        self.refresh()
+
+    def refresh(self):
+        """
+        DB를 다시 읽어 외부에서 바뀐 세션을 반영합니다.
+        아직 DB에 쓰지 않았거나 읽는 동안 메모리에서 바뀐 세션은 메모리 상태를 유지합니다.
+
+        Returns:
+            list: 바뀐 세션 ID
+        """
+        with self.lock:
+            mutations = dict(self.mutations)
+            pending = set(self.pending)
+        rows = self._load_rows()
+        changed = []
+        with self.lock:
+            def local(session_id):
+                return (session_id in pending or self.pending[session_id]
+                        or self.mutations[session_id] != mutations.get(session_id, 0))
+
+            db_ids = set()
+            for row in rows:
+                record = SessionRecord.from_row(row)
+                db_ids.add(record.id)
+                if local(record.id):
+                    continue
+                current = self.by_id.get(record.id)
+                if current is None or current.as_row() != record.as_row():
+                    self._put(record)
+                    changed.append(record.id)
+            for session_id in list(self.by_id):
+                if session_id not in db_ids and not local(session_id):
+                    self._remove(session_id)
+                    changed.append(session_id)
+            was_loaded, self.loaded = self.loaded, True
+        if changed and was_loaded:
+            logger.info("Session store picked up external changes: %s", changed)
+            self.session_events.publish('refreshed')
+        return changed
+
+    def flush(self):
+        """대기 중인 DB 쓰기가 모두 끝날 때까지 기다립니다."""
+        if self.writer and self.writer.is_alive():
+            self.writes.join()
+
+    def start(self):
+        """DB 쓰기 스레드와 주기적 재조회 스레드를 시작합니다."""
+        with self.lock:
+            if self.writer is None or not self.writer.is_alive():
+                self.stop_event.clear()
+                self.writer = threading.Thread(target=self._writer_loop, name="SessionStoreWriter", daemon=True)
+                self.writer.start()
+            if self.refresh_interval and (self.refresher is None or not self.refresher.is_alive()):
+                self.refresher = threading.Thread(target=self._refresh_loop, name="SessionStoreRefresh", daemon=True)
+                self.refresher.start()
+
+    def stop(self):
+        """남은 쓰기를 반영하고 스레드를 멈춥니다."""
+        self.stop_event.set()
+        if self.writer and self.writer.is_alive():
+            self.writes.put(None)
+            self.writer.join(timeout=10)
+
+    def _writer_loop(self):
+        while True:
+            ops = [self.writes.get()]
+            while True:
+                try:
+                    ops.append(self.writes.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write([op for op in ops if op is not None])
+            finally:
+                for _ in ops:
+                    self.writes.task_done()
+            if None in ops:
+                return
+
+    def _write(self, ops):
+        """쌓인 변경을 세션별 마지막 상태로 합쳐 upsert는 배치 한 번, 삭제는 행 단위로 씁니다."""
+        if not ops:
+            return
+        latest = {}
+        for kind, session_id, row in ops:
+            latest[session_id] = (kind, row)
+        upserts = [row for kind, row in latest.values() if kind == 'upsert']
+        deletes = [session_id for session_id, (kind, _) in latest.items() if kind == 'delete']
+        try:
+            with DBConnectionManager(self.pool) as db:
+                repo = TradingSessionRepository(db)
+                if upserts:
+                    result = repo.save_trading_sessions(upserts)
+                    if not result.ok:
+                        self.write_errors += len(result.failed)
+                for session_id in deletes:
+                    repo.delete_session_row(session_id)
+        except Exception as e:
+            # 메모리와 DB가 어긋났으므로 다음 refresh에서 DB 상태로 다시 맞춥니다
+            self.write_errors += 1
+            logger.error("Session store write-through failed: %s", e)
+        finally:
+            with self.lock:
+                for _, session_id, _ in ops:
+                    self.pending[session_id] -= 1
+                    if self.pending[session_id] <= 0:
+                        del self.pending[session_id]
+
+    def _refresh_loop(self):
+        while not self.stop_event.wait(self.refresh_interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error("Session store refresh failed: %s", e)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_session_store():
+    """프로세스 공용 세션 저장소를 반환합니다 (최초 호출 시 생성)."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = SessionStore()
+    return _store
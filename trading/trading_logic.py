@@ -1,21 +1,28 @@
 # trading/trading_logic.py
-import time
-from config.condition import BUY_WAIT, SELL_WAIT, COUNT
+import logging
+from config.condition import COUNT
 from utils.slack_logger import SlackLogger
 from api.kis_api import KISApi
 from api.kis_market_data import KISMarketData
-from api.kis_auth import KISAuth
 from trading.trading_strategy import TradingStrategy
+from trading.order_manager import OrderManager, OrderState
+from trading.order_pricer import OrderPricer
 from database.db_manager import DatabaseManager
+from utils.tracing import traced
 from datetime import datetime, timedelta
 
+logger = logging.getLogger(__name__)
+
 
 class TradingLogic:
-    def __init__(self, kis_api=None, slack_logger=None):
+    def __init__(self, kis_api=None, slack_logger=None, fill_tracker=None, order_manager=None, order_books=None):
         # 공통 의존성 초기화
         self.kis_api = kis_api if kis_api else KISApi(is_mock=True)
         self.slack_logger = slack_logger if slack_logger else SlackLogger()
-        self.auth = KISAuth()
+        self.fill_tracker = fill_tracker  # 없으면 대기 후 체결조회로 확인
+        self.order_manager = order_manager if order_manager else OrderManager(
+            self.kis_api, fill_tracker, pricer=OrderPricer(self.kis_api, order_books))
+        self.auth = self.kis_api.auth  # 토큰 캐시를 공유하도록 API 클라이언트의 인증 객체 사용
         # 종목별 TechnicalAnalysis와 TradingStrategy를 저장할 캐시
         self.technical_analyses = {}
         self.strategies = {}
@@ -41,55 +48,42 @@ class TradingLogic:
                 message="매수 주문 시작",
                 context={"종목코드": ticker, "주문수량": quantity, "주문타입": "매수"}
             )
-            order_result = self.kis_api.place_order(ticker, quantity, order_type='buy')
-            print("매수 주문 실행:", ticker, order_result)
-            if order_result['rt_cd'] != '0':
+            order = self.order_manager.execute(ticker, quantity, 'buy')
+            order_result = order.last_result
+            logger.info("매수 주문 실행: %s", order.summary(), extra={"ticker": ticker})
+            if order.state != OrderState.DONE:
                 self.slack_logger.send_log(
                     level="ERROR",
                     message="매수 주문 실패",
-                    context={"종목코드": ticker, "메시지": order_result.get('msg1')}
+                    context={"종목코드": ticker, "체결수량": order.filled, "메시지": (order_result or {}).get('msg1')}
                 )
                 return order_result
 
-            time.sleep(BUY_WAIT)
-            unfilled_qty = self.order_complete_check(order_result)
-            while unfilled_qty > 0:
-                cancel_result = self.kis_api.cancel_order(order_result.get('output', {}).get('ODNO'))
-                time.sleep(1)
-                order_result = self.kis_api.place_order(ticker, unfilled_qty, order_type='buy')
-                time.sleep(BUY_WAIT)
-                unfilled_qty = self.order_complete_check(order_result)
             self.slack_logger.send_log(
                 level="INFO",
                 message="매수 주문 결과",
-                context={"종목코드": ticker, "주문번호": order_result.get('output', {}).get('ODNO')}
+                context={"종목코드": ticker, "주문번호": order_result.get('output', {}).get('ODNO'),
+                         "최초체결률": order.first_fill_ratio, "주문횟수": order.attempts}
             )
             return order_result
         except Exception as e:
-            print("매수 주문 중 에러 발생:", e)
+            logger.error("매수 주문 중 에러 발생: %s", e, extra={"ticker": ticker})
             return None
 
+    @traced(cat='trading')
     def sell_order(self, ticker, quantity, price=None):
         try:
-            order_result = self.kis_api.place_order(ticker, quantity, order_type='sell', price=price)
-            print("매도 주문 실행:", ticker, quantity, price, order_result)
-            time.sleep(SELL_WAIT)
-            unfilled_qty = self.order_complete_check(order_result)
-            while unfilled_qty > 0:
-                cancel_result = self.kis_api.cancel_order(order_result.get('output', {}).get('ODNO'))
-                time.sleep(1)
-                order_result = self.kis_api.place_order(ticker, unfilled_qty, order_type='sell')
-                time.sleep(SELL_WAIT)
-                unfilled_qty = self.order_complete_check(order_result)
-            return True
+            order = self.order_manager.execute(ticker, quantity, 'sell', price=price)
+            logger.info("매도 주문 실행: %s %s %s", quantity, price, order.summary(), extra={"ticker": ticker})
+            return order.state == OrderState.DONE
         except Exception as e:
-            print("매도 주문 중 에러 발생:", e)
+            logger.error("매도 주문 중 에러 발생: %s", e, extra={"ticker": ticker})
             return False
 
     def order_complete_check(self, order_result):
         exec_result = self.kis_api.daily_order_execution_inquiry(order_result.get('output', {}).get('ODNO'))
         unfilled_qty = int(exec_result.get('output1')[0].get('rmn_qty'))
-        print("미체결 수량:", unfilled_qty)
+        logger.info("미체결 수량: %s", unfilled_qty)
         return unfilled_qty
 
     def fetch_and_save_previous_upper_limit_stocks(self):
@@ -100,21 +94,29 @@ class TradingLogic:
             today = datetime.now().date()
             db = DatabaseManager()
             if stocks_info:
-                db.save_upper_limit_stocks(today.strftime('%Y-%m-%d'), stocks_info)
-                print(today.strftime('%Y-%m-%d'), stocks_info)
+                result = db.save_upper_limit_stocks(today.strftime('%Y-%m-%d'), stocks_info)
+                logger.info("상한가 종목 저장 %s: %s/%s", today, result.written, result.total)
+                if not result.ok:
+                    self.slack_logger.send_log(
+                        level="ERROR",
+                        message="상한가 종목 일부 저장 실패",
+                        context={"저장": result.written, "실패": result.failed[:10]}
+                    )
             else:
-                print("상한가 종목이 없습니다.")
+                logger.info("상한가 종목이 없습니다.")
             db.close()
 
+    @traced(cat='trading')
     def select_stocks_to_buy(self):
         db = DatabaseManager()
         selected_stocks = []
         tickers_with_prices = db.get_upper_limit_stocks_days_ago()  # 메서드 정의 필요
-        print("이전 상한가 종목:", tickers_with_prices)
+        logger.info("이전 상한가 종목: %s", tickers_with_prices)
         for stock in tickers_with_prices:
             current_price, temp_stop_yn = self.kis_api.get_current_price(stock.get('ticker'))
             if int(current_price) > (int(stock.get('closing_price')) * 0.92) and temp_stop_yn == 'N':
-                print(f"매수 후보 종목: {stock.get('ticker')}, {stock.get('name')}, 현재가: {current_price}")
+                logger.info("매수 후보 종목: %s, 현재가: %s", stock.get('name'), current_price,
+                            extra={"ticker": stock.get('ticker')})
                 selected_stocks.append(stock)
         if selected_stocks:
             db.save_selected_stocks(selected_stocks)  # 메서드 정의 필요
@@ -157,7 +159,7 @@ class TradingLogic:
             order_result = self.buy_order(ticker, quantity)
             if order_result and order_result['rt_cd'] == '0':
                 strategy.set_entry(current_price)
-                print(f"상승 추세 매수: {ticker} at {current_price}")
+                logger.info("상승 추세 매수 at %s", current_price, extra={"ticker": ticker})
 
         elif strategy.should_buy_downtrend(prev_fast_k_down):
             current_price = float(self.kis_api.get_current_price(ticker)[0])
@@ -165,18 +167,18 @@ class TradingLogic:
             order_result = self.buy_order(ticker, quantity)
             if order_result and order_result['rt_cd'] == '0':
                 strategy.set_entry(current_price)
-                print(f"하락 추세 매수: {ticker} at {current_price}")
+                logger.info("하락 추세 매수 at %s", current_price, extra={"ticker": ticker})
 
         # 매도 조건 체크 (실시간 모니터링은 별도로 처리)
         if strategy.entry_price:
             current_price = float(self.kis_api.get_current_price(ticker)[0])
             if strategy.is_uptrend() and strategy.should_sell_uptrend(current_price):
                 self.sell_order(ticker, quantity, current_price)
-                print(f"상승 추세 매도: {ticker}")
+                logger.info("상승 추세 매도", extra={"ticker": ticker})
                 strategy.entry_price = None
             elif strategy.is_downtrend() and strategy.should_sell_downtrend(current_price):
                 self.sell_order(ticker, quantity, current_price)
-                print(f"하락 추세 매도: {ticker}")
+                logger.info("하락 추세 매도", extra={"ticker": ticker})
                 strategy.entry_price = None
 
     def calculate_quantity(self, price: float) -> int:
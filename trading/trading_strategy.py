@@ -1,9 +1,11 @@
-from datetime import datetime, time
+from datetime import datetime
 from utils.date_utils import DateUtils
+from trading.market_clock import get_market_clock
 
 class TradingStrategy:
     def __init__(self):
         self.date_utils = DateUtils
+        self.market_clock = get_market_clock()
         self.entry_price = None
         self.entry_date = None
 
@@ -17,8 +19,7 @@ class TradingStrategy:
 
     def _is_time_to_check(self):
         """오후 3시 10분인지 확인"""
-        now = datetime.now()
-        return now.time() >= time(15, 10) and now.time() < time(15, 11)
+        return self.market_clock.in_window('strategy_check')
 
     def should_buy_uptrend(self, prev_fast_k: float = None):
         """상승 추세 매수 조건 확인"""
@@ -96,9 +97,8 @@ class TradingStrategy:
         self.entry_date = datetime.now().date()
 
     def _is_time_to_check(self):
-            """오후 3시 10분인지 확인"""
-            now = datetime.now()
-            return now.time() >= time(15, 10) and now.time() < time(15, 11)
+        """오후 3시 10분인지 확인"""
+        return self.market_clock.in_window('strategy_check')
 
     def should_buy_uptrend(self, prev_fast_k: float = None):
         if not self.is_uptrend() or not self._is_time_to_check():
@@ -1,9 +1,9 @@
 """ 날짜를 워킹데이로 변환하는 모듈 """
-from datetime import timedelta, date as dt # date 클래스를 추가로 가져옵니다.
-import holidays
+from datetime import datetime
+from utils.trading_calendar import get_trading_calendar
 
 class DateUtils:
-    """날짜 관련 유틸리티 기능을 제공하는 클래스입니다."""
+    """날짜 관련 유틸리티 기능을 제공하는 클래스입니다. 계산은 미리 만들어 둔 거래 캘린더로 처리합니다."""
 
     @staticmethod
     def get_business_days(start_date, end_date):
@@ -17,19 +17,13 @@ class DateUtils:
         Returns:
             list: 영업일 목록
         """
-        kr_holidays = holidays.country_holidays('KR')
-        business_days = []
-        current_date = start_date
-        while current_date <= end_date:
-            if current_date.weekday() < 5 and current_date not in kr_holidays:
-                business_days.append(current_date)
-            current_date += timedelta(days=1)
-        return business_days
+        return get_trading_calendar().sessions_between(start_date, end_date)
 
     @staticmethod
     def get_previous_business_day(date, days_back):
         """
         주어진 날짜로부터 지정된 영업일 수만큼 이전의 영업일을 반환합니다.
+        기준 날짜가 휴일이면 직전 영업일에서부터 셉니다.
 
         Args:
             date (datetime): 기준 날짜
@@ -38,140 +32,44 @@ class DateUtils:
         Returns:
             datetime: 계산된 이전 영업일
         """
-        # 한국의 2024년 공휴일 가져오기
-        kr_holidays = holidays.CountryHoliday('KR', years=2024)  
-        
-        # 추가 공휴일 수동으로 추가 (datetime.date 객체로 추가)
-        additional_holidays = [
-            dt(2024, 10, 1)
-        ]
-
-        # 기존 공휴일에 추가 공휴일 합치기
-        all_holidays = set(kr_holidays.keys()).union(additional_holidays)
-        current_date = date
-        current_date = date.date() 
-
-        while days_back > 0 or current_date.weekday() == 5 or current_date.weekday() == 6 or ((current_date in all_holidays) and (current_date.weekday() < 5)):
-
-            # 주말 건너뛰기
-            if current_date.weekday() == 5:
-                current_date -= timedelta(days=1)
-                continue
-            elif current_date.weekday() == 6:
-                current_date -= timedelta(days=2)
-                continue
-
-            days_back -= 1
-            current_date -= timedelta(days=1)
-
-            #공휴일 건너뛰기
-            if (current_date in all_holidays) and (current_date.weekday() < 5):
-                current_date -= timedelta(days=1)
-
-        return current_date
-
+        calendar = get_trading_calendar()
+        return calendar.offset(calendar.rollback(date), -days_back)
 
     @staticmethod
     def is_business_day(date):
         """
-        주어진 날짜가 영업일인지 확인합니다.
+        주어진 날짜가 영업일이면 그대로, 아니면 직전 영업일을 반환합니다.
 
         Args:
             date (datetime): 확인할 날짜
 
         Returns:
-            bool: 영업일이면 True, 아니면 False
+            date: 해당일 이하의 마지막 영업일
         """
-        # 한국의 2024년 공휴일 가져오기
-        all_holidays = DateUtils.get_holidays()
-        current_date = date
-
-#####################예외 없이 확인하려면 2번씩 돌려야 함. 임시방편###################
-        #주말에만 동작
-        while current_date.weekday() > 4:
-            # 주말 건너뛰기
-            if current_date.weekday() == 5:
-                current_date -= timedelta(days=1)
-            elif current_date.weekday() == 6:
-                current_date -= timedelta(days=2)
-
-        #공휴일에만 동작, 건너뛰기
-        while (current_date in all_holidays) and (current_date.weekday() < 5):
-            current_date -= timedelta(days=1)
-
-        #주말에만 동작
-        while current_date.weekday() > 4:
-            # 주말 건너뛰기
-            if current_date.weekday() == 5:
-                current_date -= timedelta(days=1)
-            elif current_date.weekday() == 6:
-                current_date -= timedelta(days=2)
-
-        #공휴일에만 동작, 건너뛰기
-        while (current_date in all_holidays) and (current_date.weekday() < 5):
-            current_date -= timedelta(days=1)
-
-        return current_date
-
+        return get_trading_calendar().rollback(date)
 
     @staticmethod
     def get_target_date(date, later):
         """
-        강제 매도일자 계산. 당일은 영업일+later 
+        강제 매도일자 계산. 당일(휴일이면 직전 영업일)로부터 later 영업일 후
 
         Args:
             date (datetime): 확인할 날짜
 
         Returns:
-            bool: 영업일이면 True, 아니면 False
+            date: 강제 매도일
         """
-        # 한국의 2024년 공휴일 가져오기
-        all_holidays = DateUtils.get_holidays()
-        target_date = DateUtils.is_business_day(date)
-
-        for _ in range(later):
-            target_date += timedelta(days=1)
-    #####################예외 없이 확인하려면 2번씩 돌려야 함. 임시방편###################
-            #주말에만 동작
-            while target_date.weekday() > 4:
-                if target_date.weekday() == 5:
-                    target_date += timedelta(days=2)
-                elif target_date.weekday() == 6:
-                    target_date += timedelta(days=1)
-
-            #공휴일에만 동작, 건너뛰기
-            while (target_date in all_holidays) and (target_date.weekday() < 5):
-                target_date += timedelta(days=1)
-
-            #주말에만 동작
-            while target_date.weekday() > 4:
-                if target_date.weekday() == 5:
-                    target_date += timedelta(days=2)
-                elif target_date.weekday() == 6:
-                    target_date += timedelta(days=1)
-
-            #공휴일에만 동작, 건너뛰기
-            while (target_date in all_holidays) and (target_date.weekday() < 5):
-                target_date += timedelta(days=1)
-    #############################################################################
-        
-        return target_date
+        calendar = get_trading_calendar()
+        return calendar.offset(calendar.rollback(date), later)
 
     @staticmethod
     def get_holidays():
         """
-        공휴일 받아오기
+        KRX 휴장일(공휴일 + 근로자의 날 + 연말 휴장일 + 추가 휴장일) 받아오기
         """
-        
-        # 한국의 2024년 공휴일 가져오기
-        kr_holidays = holidays.CountryHoliday('KR', years=2024)  
-        
-        # 추가 공휴일 수동으로 추가 (datetime.date 객체로 추가)
-        additional_holidays = [
-            dt(2024, 10, 1)
-        ]
+        return get_trading_calendar().holidays
 
-        # 기존 공휴일에 추가 공휴일 합치기
-        all_holidays = set(kr_holidays.keys()).union(additional_holidays)
-        
-        return all_holidays
+    @staticmethod
+    def is_trading_day(date=None):
+        """영업일 여부 (기본값: 오늘)"""
+        return get_trading_calendar().is_session(date or datetime.now())
@@ -0,0 +1,85 @@
+""" 진입 모듈 import 시간 측정 - 예산 초과 또는 지연 로딩 대상 패키지를 미리 불러오면 실패 (종료 코드 1) """
+import os
+import sys
+import json
+import argparse
+import subprocess
+from config.config import IMPORT_TIME_BUDGET, IMPORT_BENCHMARK_MODULES, IMPORT_LAZY_MODULES
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 새 인터프리터에서 모듈 하나를 import하고 걸린 시간과 불러온 지연 로딩 대상 패키지를 출력
+_PROBE = """
+import sys, json, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"elapsed": elapsed, "loaded": [m for m in {lazy!r} if m in sys.modules]}}))
+"""
+
+
+def _top_imports(stderr, top):
+    """-X importtime 출력에서 누적 시간이 큰 최상위 패키지 top개 [(초, 이름)]"""
+    totals = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if not cumulative.strip().isdigit():
+            continue
+        package = name.strip().split('.')[0]
+        # 중첩 import는 바깥 모듈 누적 시간에 이미 포함되므로 가장 큰 값만 사용
+        totals[package] = max(totals.get(package, 0), int(cumulative) / 1_000_000)
+    return sorted(((t, n) for n, t in totals.items()), reverse=True)[:top]
+
+
+def measure(module, lazy_modules=IMPORT_LAZY_MODULES, runs=3):
+    """
+    module을 새 프로세스에서 runs번 import해 가장 빠른 시간을 돌려줍니다 (디스크 캐시 영향 제거).
+
+    Returns:
+        dict: {"module", "elapsed", "loaded", "top", "error"}
+    """
+    code = _PROBE.format(module=module, lazy=tuple(lazy_modules))
+    best = None
+    for _ in range(runs):
+        proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT,
+                              capture_output=True, text=True)
+        if proc.returncode != 0:
+            error = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f"exit {proc.returncode}"
+            return {"module": module, "elapsed": None, "loaded": [], "top": [], "error": error}
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        if best is None or result['elapsed'] < best['elapsed']:
+            best = {"module": module, **result, "top": _top_imports(proc.stderr, 5), "error": None}
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="진입 모듈 import 시간 예산 검사")
+    parser.add_argument('modules', nargs='*', default=list(IMPORT_BENCHMARK_MODULES))
+    parser.add_argument('--budget', type=float, default=IMPORT_TIME_BUDGET, help="허용 시간 / 초")
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    failed = False
+    for module in args.modules:
+        result = measure(module, runs=args.runs)
+        if result['error']:
+            failed = True
+            print(f"FAIL {module}: import error - {result['error']}")
+            continue
+        problems = []
+        if result['elapsed'] > args.budget:
+            problems.append(f"budget {args.budget:.3f}s exceeded")
+        if result['loaded']:
+            problems.append(f"eagerly loaded {', '.join(result['loaded'])}")
+        failed = failed or bool(problems)
+        status = "FAIL" if problems else "ok"
+        print(f"{status:4} {module}: {result['elapsed']:.3f}s" + (f" ({'; '.join(problems)})" if problems else ""))
+        for seconds, name in result['top']:
+            print(f"       {seconds:.3f}s {name}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+""" 로깅 설정 - 큐 기반 비동기 기록, JSON lines 파일(회전), 모듈별 레벨, 종목별 컨텍스트 """
+import os
+import json
+import queue
+import atexit
+import logging
+import threading
+import contextvars
+from contextlib import contextmanager
+from datetime import datetime
+from logging.handlers import QueueListener, RotatingFileHandler
+from config.config import (LOG_LEVEL, LOG_MODULE_LEVELS, LOG_FILE, LOG_MAX_BYTES, LOG_BACKUP_COUNT, LOG_QUEUE_SIZE,
+                           LOG_CONSOLE)
+
+# 현재 스레드/태스크의 로그 컨텍스트 (ticker, session_id 등)
+_log_context = contextvars.ContextVar('log_context', default={})
+
+# LogRecord 기본 속성 (이 외의 속성은 extra 필드로 기록)
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime', 'context'}
+
+
+@contextmanager
+def log_context(**fields):
+    """
+    블록 안에서 남기는 모든 로그에 fields를 붙입니다 (스레드/asyncio 태스크 단위).
+
+    Example:
+        with log_context(ticker='005930', session_id=1234):
+            logger.info("매수 주문 실행")
+    """
+    token = _log_context.set({**_log_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+
+def bind_log_context(**fields):
+    """
+    현재 asyncio 태스크의 로그 컨텍스트에 fields를 더합니다. 태스크는 자기 컨텍스트 사본에서 돌므로
+    태스크가 끝나면 함께 사라집니다 (종목별 모니터링/주문 코루틴 시작 시 사용).
+    """
+    _log_context.set({**_log_context.get(), **fields})
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 한 건을 JSON 한 줄로 만듭니다 (컨텍스트와 extra 필드 포함)."""
+
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "msg": record.getMessage(),
+        }
+        entry.update(getattr(record, 'context', None) or {})
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class AsyncQueueHandler(logging.Handler):
+    """
+    호출 스레드에서는 메시지 문자열과 컨텍스트만 만들어 큐에 넣습니다.
+    JSON 직렬화와 파일/콘솔 쓰기는 QueueListener 스레드에서 합니다. 큐가 가득 차면 버리고 개수를 셉니다.
+    """
+
+    def __init__(self, log_queue):
+        super().__init__()
+        self.queue = log_queue
+        self.dropped = 0
+
+    def emit(self, record):
+        try:
+            record.msg = record.getMessage()
+            record.args = None
+            if record.exc_info:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+                record.exc_info = None
+            context = _log_context.get()
+            if context:
+                record.context = context
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+        except Exception:
+            self.handleError(record)
+
+
+_listener = None
+_handler = None
+_setup_lock = threading.Lock()
+
+
+def _parse_levels(text):
+    """'database=DEBUG,api.kis_websocket=INFO' -> {모듈: 레벨}"""
+    levels = {}
+    for item in (text or '').split(','):
+        if '=' in item:
+            name, level = item.split('=', 1)
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def setup_logging(level=LOG_LEVEL, module_levels=None, log_file=LOG_FILE, console=LOG_CONSOLE):
+    """
+    루트 로거에 큐 핸들러를 달고 기록 스레드(QueueListener)를 시작합니다. 여러 번 호출해도 한 번만 설정합니다.
+
+    Args:
+        level (str): 루트 로그 레벨
+        module_levels (dict, optional): {로거 이름: 레벨}. 기본값은 LOG_MODULE_LEVELS + 환경변수 LOG_LEVELS
+        log_file (str): JSON lines 로그 파일 경로 (없으면 파일 기록 안 함)
+        console (bool): 콘솔에도 사람이 읽는 형식으로 출력
+    """
+    global _listener, _handler
+    with _setup_lock:
+        if _listener is not None:
+            return _handler
+        handlers = []
+        if log_file:
+            os.makedirs(os.path.dirname(log_file) or '.', exist_ok=True)
+            file_handler = RotatingFileHandler(log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT,
+                                               encoding='utf-8')
+            file_handler.setFormatter(JsonFormatter())
+            handlers.append(file_handler)
+        if console:
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(name)s - %(message)s'))
+            handlers.append(console_handler)
+
+        log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        _handler = AsyncQueueHandler(log_queue)
+        root = logging.getLogger()
+        for existing in list(root.handlers):
+            root.removeHandler(existing)
+        root.addHandler(_handler)
+        root.setLevel(level)
+        levels = module_levels if module_levels is not None else {
+            **LOG_MODULE_LEVELS, **_parse_levels(os.getenv('LOG_LEVELS'))}
+        for name, module_level in levels.items():
+            logging.getLogger(name).setLevel(module_level)
+
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(stop_logging)
+        return _handler
+
+
+def stop_logging():
+    """큐에 남은 로그를 모두 쓰고 기록 스레드를 멈춥니다."""
+    global _listener
+    with _setup_lock:
+        listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
@@ -0,0 +1,126 @@
+""" 이벤트 루프 지연 측정 및 블로킹 호출 탐지 """
+import sys
+import time
+import asyncio
+import logging
+import threading
+import traceback
+from datetime import date
+from config.condition import LOOP_LAG_INTERVAL, LOOP_BLOCK_THRESHOLD, LOOP_BLOCK_STACK_DEPTH, LOOP_BLOCK_REPORT_TOP
+from utils.metrics import get_metrics
+from utils.slack_logger import SlackLogger
+
+logger = logging.getLogger(__name__)
+
+
+class LoopLagMonitor:
+    """
+    이벤트 루프 감시기.
+    루프 안의 하트비트 코루틴이 interval마다 깨어나 예정보다 늦은 시간(스케줄링 지연)을 기록하고,
+    별도 감시 스레드가 하트비트가 threshold 이상 밀리면 그 순간 루프 스레드의 스택을 캡처합니다.
+    캡처된 스택별로 일자별 횟수/최대/누적 차단 시간을 모아 날짜가 바뀌면(또는 종료 시) 상위 항목을 보고합니다.
+    """
+
+    def __init__(self, name='monitoring', interval=LOOP_LAG_INTERVAL, threshold=LOOP_BLOCK_THRESHOLD,
+                 stack_depth=LOOP_BLOCK_STACK_DEPTH, report_top=LOOP_BLOCK_REPORT_TOP, slack_logger=None):
+        self.name = name
+        self.interval = interval
+        self.threshold = threshold
+        self.stack_depth = stack_depth
+        self.report_top = report_top
+        self.metrics = get_metrics()
+        self.slack_logger = slack_logger if slack_logger else SlackLogger()
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.heartbeat_task = None
+        self.watch_thread = None
+        self.loop_thread_id = None
+        self.beat_at = time.monotonic()
+        self.episode = None  # 진행 중인 차단의 캡처된 스택
+        self.day = date.today()
+        self.offenders = {}  # {스택: {'count', 'worst', 'total', 'stack'}}
+        self.beats = 0
+        self.max_lag = 0.0
+
+    def start(self, loop=None):
+        """loop(기본값: 실행 중인 루프)에 하트비트를 띄우고 감시 스레드를 시작합니다."""
+        loop = loop or asyncio.get_running_loop()
+        self.stop_event.clear()
+        self.beat_at = time.monotonic()
+        self.heartbeat_task = loop.create_task(self._heartbeat())
+        self.watch_thread = threading.Thread(target=self._watch, name=f"LoopWatch-{self.name}", daemon=True)
+        self.watch_thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.heartbeat_task and not self.heartbeat_task.done():
+            self.heartbeat_task.cancel()
+        self._report_day()
+
+    async def _heartbeat(self):
+        self.loop_thread_id = threading.get_ident()
+        while True:
+            self.beat_at = time.monotonic()
+            await asyncio.sleep(self.interval)
+            lag = max(time.monotonic() - self.beat_at - self.interval, 0.0)
+            self.beats += 1
+            if lag > self.max_lag:
+                self.max_lag = lag
+            self.metrics.observe('event_loop_lag_seconds', lag, loop=self.name)
+            with self.lock:
+                episode, self.episode = self.episode, None
+            if episode and lag >= self.threshold:
+                self._record(episode, lag)
+            if date.today() != self.day:
+                self._report_day()
+
+    def _watch(self):
+        check_interval = max(self.threshold / 2, 0.01)
+        while not self.stop_event.wait(check_interval):
+            overdue = time.monotonic() - self.beat_at - self.interval
+            if overdue < self.threshold or self.episode is not None or self.loop_thread_id is None:
+                continue
+            frame = sys._current_frames().get(self.loop_thread_id)
+            if frame is None:
+                continue
+            stack = tuple(f"{f.filename}:{f.lineno} in {f.name}"
+                          for f in traceback.extract_stack(frame)[-self.stack_depth:])
+            with self.lock:
+                self.episode = stack
+            logger.warning("Event loop '%s' blocked for %.3fs at %s", self.name, overdue, stack[-1])
+
+    def _record(self, stack, blocked):
+        with self.lock:
+            entry = self.offenders.setdefault(stack, {'count': 0, 'worst': 0.0, 'total': 0.0, 'stack': stack})
+            entry['count'] += 1
+            entry['total'] += blocked
+            entry['worst'] = max(entry['worst'], blocked)
+
+    def worst_offenders(self, top=None):
+        """차단 시간이 가장 길었던 스택 목록 (worst 내림차순)"""
+        with self.lock:
+            entries = sorted(self.offenders.values(), key=lambda e: e['worst'], reverse=True)
+        return entries[:top or self.report_top]
+
+    def stats(self):
+        with self.lock:
+            blocked = sum(e['count'] for e in self.offenders.values())
+        return {"loop": self.name, "beats": self.beats, "max_lag": round(self.max_lag, 4), "blocked": blocked}
+
+    def _report_day(self):
+        """하루치 상위 차단 지점을 로그/Slack으로 보고하고 새 날짜로 초기화합니다."""
+        offenders = self.worst_offenders()
+        stats = self.stats()
+        day, self.day = self.day, date.today()
+        with self.lock:
+            self.offenders = {}
+        self.max_lag = 0.0
+        if not offenders:
+            return
+        lines = [f"{e['worst']:.3f}s x{e['count']} (total {e['total']:.3f}s) {e['stack'][-1]}" for e in offenders]
+        logger.warning("Event loop '%s' worst blocking calls on %s:\n%s", self.name, day, "\n".join(lines))
+        self.slack_logger.send_log(
+            level="WARNING",
+            message=f"Event loop '{self.name}' blocking report ({day})\n" + "\n".join(lines),
+            context=stats
+        )
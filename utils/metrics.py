@@ -0,0 +1,245 @@
+""" 지연 시간 계측 (히스토그램 + Prometheus 텍스트 엔드포인트/스냅샷 파일) """
+import os
+import json
+import time
+import bisect
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from config.config import (METRICS_ENABLED, METRICS_BUCKETS, METRICS_PORT, METRICS_SNAPSHOT_PATH,
+                           METRICS_SNAPSHOT_INTERVAL)
+
+logger = logging.getLogger(__name__)
+
+
+class Histogram:
+    """누적이 아닌 버킷별 개수를 세는 고정 버킷 히스토그램 (단위: 초)"""
+    __slots__ = ('buckets', 'counts', 'count', 'sum', 'max', 'lock')
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 칸은 +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.lock = threading.Lock()
+
+    def observe(self, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.sum += value
+            if value > self.max:
+                self.max = value
+
+    def quantile(self, q, counts=None, count=None):
+        """버킷 상한 기준 근사 분위수"""
+        counts = counts if counts is not None else self.counts
+        count = count if count is not None else self.count
+        if not count:
+            return 0.0
+        rank = q * count
+        seen = 0
+        for bound, n in zip(self.buckets, counts):
+            seen += n
+            if seen >= rank:
+                return bound
+        return self.max
+
+    def snapshot(self):
+        with self.lock:
+            counts, count, total, peak = list(self.counts), self.count, self.sum, self.max
+        return {
+            "count": count,
+            "sum": round(total, 6),
+            "max": round(peak, 6),
+            "p50": self.quantile(0.5, counts, count),
+            "p90": self.quantile(0.9, counts, count),
+            "p99": self.quantile(0.99, counts, count),
+            "counts": counts,
+        }
+
+
+class _Timer:
+    __slots__ = ('metrics', 'name', 'labels', 'start')
+
+    def __init__(self, metrics, name, labels):
+        self.metrics = metrics
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.metrics.observe(self.name, time.perf_counter() - self.start, **self.labels)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NULL_TIMER = _NullTimer()
+
+
+class Metrics:
+    """
+    이름 + 라벨별 지연 시간 히스토그램 모음.
+    비활성화(METRICS_ENABLED=0)면 observe()는 바로 반환하고 timer()는 공용 빈 컨텍스트를 돌려줍니다.
+    """
+
+    def __init__(self, enabled=METRICS_ENABLED, buckets=METRICS_BUCKETS):
+        self.enabled = enabled
+        self.buckets = tuple(sorted(buckets))
+        self.histograms = {}  # {(이름, ((라벨, 값), ...)): Histogram}
+        self.lock = threading.Lock()
+
+    def observe(self, name, seconds, **labels):
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            with self.lock:
+                histogram = self.histograms.setdefault(key, Histogram(self.buckets))
+        histogram.observe(seconds)
+
+    def timer(self, name, **labels):
+        """with 블록 실행 시간을 기록합니다."""
+        if not self.enabled:
+            return NULL_TIMER
+        return _Timer(self, name, labels)
+
+    def timed(self, name, **labels):
+        """함수 실행 시간을 기록하는 데코레이터"""
+        def decorator(func):
+            def wrapper(*args, **kwargs):
+                with self.timer(name, **labels):
+                    return func(*args, **kwargs)
+            wrapper.__name__ = getattr(func, '__name__', name)
+            wrapper.__doc__ = func.__doc__
+            return wrapper
+        return decorator
+
+    def snapshot(self):
+        """{이름: [{labels, count, sum, max, p50, p90, p99, counts}]}"""
+        with self.lock:
+            items = list(self.histograms.items())
+        result = {}
+        for (name, labels), histogram in sorted(items, key=lambda item: item[0]):
+            result.setdefault(name, []).append({"labels": dict(labels), **histogram.snapshot()})
+        return result
+
+    def render_prometheus(self):
+        """Prometheus 텍스트 형식 (histogram)"""
+        lines = []
+        bounds = [str(b) for b in self.buckets] + ['+Inf']
+        for name, series in self.snapshot().items():
+            lines.append(f"# TYPE {name} histogram")
+            for item in series:
+                label_text = ",".join(f'{k}="{v}"' for k, v in item['labels'].items())
+                prefix = label_text + "," if label_text else ""
+                cumulative = 0
+                for bound, n in zip(bounds, item['counts']):
+                    cumulative += n
+                    lines.append(f'{name}_bucket{{{prefix}le="{bound}"}} {cumulative}')
+                suffix = f"{{{label_text}}}" if label_text else ""
+                lines.append(f"{name}_sum{suffix} {item['sum']}")
+                lines.append(f"{name}_count{suffix} {item['count']}")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsExporter:
+    """
+    계측값을 밖으로 내보냅니다.
+    port가 있으면 127.0.0.1:port/metrics에서 Prometheus 텍스트를, snapshot_path가 있으면
+    interval초마다 JSON 스냅샷 파일을 씁니다.
+    """
+
+    def __init__(self, metrics=None, port=METRICS_PORT, snapshot_path=METRICS_SNAPSHOT_PATH,
+                 interval=METRICS_SNAPSHOT_INTERVAL):
+        self.metrics = metrics if metrics else get_metrics()
+        self.port = port
+        self.snapshot_path = snapshot_path
+        self.interval = interval
+        self.server = None
+        self.stop_event = threading.Event()
+        self.snapshot_thread = None
+
+    def start(self):
+        if not self.metrics.enabled:
+            return
+        if self.port and self.server is None:
+            self.server = ThreadingHTTPServer(('127.0.0.1', self.port), self._handler())
+            threading.Thread(target=self.server.serve_forever, name="MetricsHTTP", daemon=True).start()
+            logger.info("Metrics endpoint: http://127.0.0.1:%d/metrics", self.port)
+        if self.snapshot_path and self.snapshot_thread is None:
+            self.stop_event.clear()
+            self.snapshot_thread = threading.Thread(target=self._snapshot_loop, name="MetricsSnapshot", daemon=True)
+            self.snapshot_thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.server:
+            self.server.shutdown()
+            self.server = None
+        if self.snapshot_path and self.metrics.enabled:
+            self.write_snapshot()
+
+    def write_snapshot(self):
+        """스냅샷을 임시 파일에 쓴 뒤 교체합니다 (읽는 쪽이 반쯤 쓴 파일을 보지 않도록)."""
+        data = {"timestamp": time.time(), "metrics": self.metrics.snapshot()}
+        tmp_path = f"{self.snapshot_path}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.snapshot_path)
+        except OSError as e:
+            logger.error("Failed to write metrics snapshot: %s", e)
+
+    def _snapshot_loop(self):
+        while not self.stop_event.wait(self.interval):
+            self.write_snapshot()
+
+    def _handler(self):
+        metrics = self.metrics
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = metrics.render_prometheus().encode('utf-8')
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+_metrics = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics():
+    """프로세스 공용 계측 저장소를 반환합니다 (최초 호출 시 생성)."""
+    global _metrics
+    if _metrics is None:
+        with _metrics_lock:
+            if _metrics is None:
+                _metrics = Metrics()
+    return _metrics
@@ -0,0 +1,35 @@
+""" 스레드 공유 토큰 버킷 유량 제한 """
+import time
+import threading
+from utils.metrics import get_metrics
+
+
+class RateLimiter:
+    """
+    초당 rate건, 최대 burst건까지 몰아서 허용하는 토큰 버킷.
+    acquire()는 자기 차례를 먼저 예약(토큰을 음수까지 차감)한 뒤 락 밖에서 기다리므로
+    여러 스레드가 동시에 불러도 요청 순서대로 일정 간격으로 풀려납니다.
+    """
+
+    def __init__(self, rate, burst=None, name='default', clock=time.monotonic):
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(rate, 1))
+        self.name = name
+        self.clock = clock
+        self.tokens = self.burst
+        self.updated = clock()
+        self.lock = threading.Lock()
+        self.metrics = get_metrics()
+
+    def acquire(self):
+        """토큰 하나를 얻을 때까지 기다리고 기다린 시간(초)을 반환합니다."""
+        with self.lock:
+            now = self.clock()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+            self.metrics.observe('rate_limit_wait_seconds', wait, bucket=self.name)
+        return wait
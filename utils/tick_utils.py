@@ -0,0 +1,58 @@
+""" KRX 호가 단위 관련 모듈 """
+
+# (가격 상한, 호가 단위) - 2023년 1월 이후 유가증권/코스닥 공통
+KRX_TICK_TABLE = (
+    (2000, 1),
+    (5000, 5),
+    (20000, 10),
+    (50000, 50),
+    (200000, 100),
+    (500000, 500),
+)
+KRX_MAX_TICK = 1000
+
+
+def get_tick_size(price):
+    """
+    가격에 해당하는 호가 단위를 반환합니다.
+
+    Args:
+        price (int): 기준 가격
+
+    Returns:
+        int: 호가 단위
+    """
+    for upper, tick in KRX_TICK_TABLE:
+        if price < upper:
+            return tick
+    return KRX_MAX_TICK
+
+
+def snap_to_tick(price, side):
+    """
+    가격을 호가 단위에 맞춥니다. 매수는 올림, 매도는 내림으로 체결에 유리한 쪽을 택합니다.
+
+    Args:
+        price (float): 원 가격
+        side (str): 'buy' 또는 'sell'
+
+    Returns:
+        int: 호가 단위에 맞춘 가격
+    """
+    tick = get_tick_size(int(price))
+    if side == 'buy':
+        return int(-(-price // tick) * tick)
+    return int(price // tick * tick)
+
+
+def shift_ticks(price, ticks, side):
+    """
+    체결에 유리한 방향(매수는 위, 매도는 아래)으로 ticks 호가만큼 이동한 가격을 반환합니다.
+    """
+    price = snap_to_tick(price, side)
+    for _ in range(ticks):
+        if side == 'buy':
+            price += get_tick_size(price)
+        else:
+            price -= get_tick_size(price - 1)
+    return price
@@ -0,0 +1,193 @@
+""" 구간(span) 추적 - 일자별 Chrome trace / Perfetto JSON 파일 """
+import os
+import json
+import time
+import atexit
+import asyncio
+import logging
+import functools
+import threading
+from collections import deque
+from datetime import datetime
+from config.config import TRACE_ENABLED, TRACE_DIR, TRACE_FLUSH_INTERVAL, TRACE_BUFFER_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+def _current_task_name():
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        return None
+    return task.get_name() if task else None
+
+
+class _Span:
+    __slots__ = ('tracer', 'name', 'cat', 'args', 'ts', 'start')
+
+    def __init__(self, tracer, name, cat, args):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.ts = time.time_ns() // 1000
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = (time.perf_counter_ns() - self.start) // 1000
+        if exc_type:
+            self.args['error'] = exc_type.__name__
+        self.tracer.record(self.name, self.cat, self.ts, duration, self.args)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """
+    완료된 구간을 메모리 버퍼(deque)에 쌓고, 기록 스레드가 TRACE_FLUSH_INTERVAL마다
+    TRACE_DIR/trace-YYYYMMDD.json에 이어 씁니다. 파일은 Chrome trace 'JSON Array' 형식이라
+    닫는 괄호 없이도 chrome://tracing, ui.perfetto.dev에서 열립니다.
+    버퍼가 가득 차면 오래된 구간부터 버립니다.
+    """
+
+    def __init__(self, enabled=TRACE_ENABLED, trace_dir=TRACE_DIR, flush_interval=TRACE_FLUSH_INTERVAL,
+                 buffer_size=TRACE_BUFFER_SIZE):
+        self.enabled = enabled
+        self.trace_dir = trace_dir
+        self.flush_interval = flush_interval
+        self.buffer = deque(maxlen=buffer_size)
+        self.pid = os.getpid()
+        self.thread_names = {}  # {tid: 스레드 이름}
+        self.written_threads = {}  # {파일 경로: 이름을 기록한 tid 집합}
+        self.write_lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def span(self, name, cat='app', **args):
+        """with 블록을 구간으로 기록합니다. 비활성화면 공용 빈 컨텍스트를 반환합니다."""
+        if not self.enabled:
+            return NULL_SPAN
+        return _Span(self, name, cat, args)
+
+    def record(self, name, cat, ts, duration, args):
+        tid = threading.get_ident()
+        if tid not in self.thread_names:
+            self.thread_names[tid] = threading.current_thread().name
+        task = _current_task_name()
+        if task:
+            args['task'] = task
+        self.buffer.append((name, cat, ts, duration, tid, args))
+
+    # 기록 스레드
+
+    def start(self):
+        if not self.enabled or (self.thread and self.thread.is_alive()):
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, name="TraceWriter", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        self.flush()
+
+    def _run(self):
+        while not self.stop_event.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        """버퍼의 구간을 일자별 파일에 씁니다."""
+        with self.write_lock:
+            by_path = {}
+            while self.buffer:
+                try:
+                    event = self.buffer.popleft()
+                except IndexError:
+                    break
+                day = datetime.fromtimestamp(event[2] / 1_000_000).strftime('%Y%m%d')
+                by_path.setdefault(os.path.join(self.trace_dir, f"trace-{day}.json"), []).append(event)
+            for path, events in by_path.items():
+                try:
+                    self._append(path, events)
+                except OSError as e:
+                    logger.error("Failed to write trace file %s: %s", path, e)
+
+    def _append(self, path, events):
+        os.makedirs(self.trace_dir, exist_ok=True)
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        written = self.written_threads.setdefault(path, set())
+        lines = []
+        for name, cat, ts, duration, tid, args in events:
+            if tid not in written:
+                written.add(tid)
+                lines.append({"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid,
+                              "args": {"name": self.thread_names.get(tid, str(tid))}})
+            lines.append({"name": name, "cat": cat, "ph": "X", "ts": ts, "dur": duration,
+                          "pid": self.pid, "tid": tid, "args": args})
+        with open(path, 'a', encoding='utf-8') as f:
+            if new_file:
+                f.write("[\n")
+            for line in lines:
+                f.write(json.dumps(line, ensure_ascii=False, default=str))
+                f.write(",\n")
+
+
+_tracer = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer():
+    """프로세스 공용 추적기를 반환합니다 (활성화 시 기록 스레드 시작, 종료 시 남은 구간 기록)."""
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                _tracer = Tracer()
+                if _tracer.enabled:
+                    _tracer.start()
+                    atexit.register(_tracer.stop)
+    return _tracer
+
+
+def traced(name=None, cat='app'):
+    """
+    함수(동기/async) 실행을 구간으로 기록하는 데코레이터. 이름 기본값은 '클래스.메서드'.
+    추적이 꺼져 있으면 함수를 그대로 호출합니다.
+    """
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                tracer = get_tracer()
+                if not tracer.enabled:
+                    return await func(*args, **kwargs)
+                with _Span(tracer, span_name, cat, {}):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer = get_tracer()
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with _Span(tracer, span_name, cat, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
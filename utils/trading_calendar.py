@@ -0,0 +1,182 @@
+""" KRX 거래 캘린더 (영업일 계산) """
+import threading
+from datetime import date, datetime, timedelta
+import holidays
+import numpy as np
+from config.condition import CALENDAR_START_YEAR, CALENDAR_END_YEAR, KRX_EXTRA_CLOSURES
+
+# numpy datetime64[D]의 0일(1970-01-01)에 해당하는 date.toordinal() 값
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _to_ordinal(value):
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, str):
+        value = date.fromisoformat(value[:10])
+    return value.toordinal()
+
+
+class TradingCalendar:
+    """
+    연도 범위의 영업일을 한 번 계산해 두는 KRX 캘린더.
+    영업일 서수 배열과 날짜별 '해당일 이하 마지막 영업일' 인덱스를 두어
+    영업일 여부/이동/개수 계산을 O(1)로 처리합니다. *_many 메서드는 날짜 배열을 한 번에 처리합니다.
+    """
+
+    def __init__(self, start_year=CALENDAR_START_YEAR, end_year=CALENDAR_END_YEAR, extra_closures=KRX_EXTRA_CLOSURES):
+        self.start_year = start_year
+        self.end_year = end_year
+        self.holidays = self._krx_closures(start_year, end_year, extra_closures)
+
+        self.first_ordinal = date(start_year, 1, 1).toordinal()
+        self.last_ordinal = date(end_year, 12, 31).toordinal()
+        days = np.arange(self.first_ordinal, self.last_ordinal + 1, dtype=np.int64)
+        weekdays = (days + 6) % 7  # date.weekday()와 같은 값 (월=0)
+        closed = np.isin(days, np.fromiter((d.toordinal() for d in self.holidays), dtype=np.int64))
+        self.session_array = days[(weekdays < 5) & ~closed]
+        # 날짜(first_ordinal 기준 오프셋) -> 그날 이하 마지막 영업일의 인덱스 (없으면 -1)
+        self.rollback_array = np.searchsorted(self.session_array, days, side='right') - 1
+
+        # 스칼라 조회용 파이썬 리스트
+        self.sessions = self.session_array.tolist()
+        self.rollback_index = self.rollback_array.tolist()
+
+    @staticmethod
+    def _krx_closures(start_year, end_year, extra_closures):
+        """법정 공휴일 + 근로자의 날(5/1) + 연말 휴장일(12/31) + 추가 휴장일"""
+        years = range(start_year, end_year + 1)
+        closures = set(holidays.country_holidays('KR', years=years).keys())
+        for year in years:
+            closures.add(date(year, 5, 1))
+            closures.add(date(year, 12, 31))
+        closures.update(date.fromisoformat(day) for day in extra_closures)
+        return closures
+
+    def _index(self, ordinal):
+        offset = ordinal - self.first_ordinal
+        if offset < 0 or ordinal > self.last_ordinal:
+            raise ValueError(f"{date.fromordinal(ordinal)} is outside the trading calendar "
+                             f"({self.start_year}-{self.end_year})")
+        return self.rollback_index[offset]
+
+    def _index_before(self, ordinal):
+        """ordinal 전날 이하의 마지막 영업일 인덱스 (ordinal이 캘린더 첫날이면 -1)"""
+        if ordinal == self.first_ordinal:
+            return -1
+        return self._index(ordinal - 1)
+
+    def _session(self, index):
+        if index < 0 or index >= len(self.sessions):
+            raise ValueError("Business day offset is outside the trading calendar")
+        return date.fromordinal(self.sessions[index])
+
+    # 스칼라
+
+    def is_session(self, day):
+        """영업일 여부"""
+        ordinal = _to_ordinal(day)
+        index = self._index(ordinal)
+        return index >= 0 and self.sessions[index] == ordinal
+
+    def rollback(self, day):
+        """day 이하의 마지막 영업일 (영업일이면 그대로)"""
+        return self._session(self._index(_to_ordinal(day)))
+
+    def rollforward(self, day):
+        """day 이상의 첫 영업일 (영업일이면 그대로)"""
+        ordinal = _to_ordinal(day)
+        index = self._index(ordinal)
+        if index >= 0 and self.sessions[index] == ordinal:
+            return date.fromordinal(ordinal)
+        return self._session(index + 1)
+
+    def next_session(self, day):
+        """day 다음 영업일"""
+        return self._session(self._index(_to_ordinal(day)) + 1)
+
+    def previous_session(self, day):
+        """day 이전 영업일"""
+        return self._session(self._index(_to_ordinal(day) - 1))
+
+    def offset(self, day, n):
+        """
+        day에서 n 영업일 이동한 날짜. day가 휴일이면 n > 0은 다음 영업일이 +1, n < 0은 이전 영업일이 -1,
+        n == 0은 이전 영업일입니다.
+        """
+        ordinal = _to_ordinal(day)
+        index = self._index(ordinal)
+        if n < 0 and (index < 0 or self.sessions[index] != ordinal):
+            index += 1
+        return self._session(index + n)
+
+    def count(self, start, end):
+        """start~end(양 끝 포함) 영업일 수"""
+        start_ordinal, end_ordinal = _to_ordinal(start), _to_ordinal(end)
+        if end_ordinal < start_ordinal:
+            return 0
+        return self._index(end_ordinal) - self._index_before(start_ordinal)
+
+    def sessions_between(self, start, end):
+        """start~end(양 끝 포함) 영업일 목록"""
+        start_ordinal, end_ordinal = _to_ordinal(start), _to_ordinal(end)
+        if end_ordinal < start_ordinal:
+            return []
+        first = self._index_before(start_ordinal) + 1
+        last = self._index(end_ordinal)
+        return [date.fromordinal(ordinal) for ordinal in self.sessions[first:last + 1]]
+
+    # 배열 (백테스트용)
+
+    def _offsets(self, days):
+        ordinals = np.asarray(days, dtype='datetime64[D]').astype(np.int64) + EPOCH_ORDINAL
+        offsets = ordinals - self.first_ordinal
+        if offsets.size and (offsets.min() < 0 or ordinals.max() > self.last_ordinal):
+            raise ValueError(f"Dates outside the trading calendar ({self.start_year}-{self.end_year})")
+        return ordinals, offsets
+
+    def _to_dates(self, indexes):
+        if indexes.size and (indexes.min() < 0 or indexes.max() >= len(self.session_array)):
+            raise ValueError("Business day offset is outside the trading calendar")
+        return (self.session_array[indexes] - EPOCH_ORDINAL).astype('datetime64[D]')
+
+    def is_session_many(self, days):
+        """날짜 배열 -> 영업일 여부 bool 배열"""
+        ordinals, offsets = self._offsets(days)
+        index = self.rollback_array[offsets]
+        return (index >= 0) & (self.session_array[np.maximum(index, 0)] == ordinals)
+
+    def rollback_many(self, days):
+        """날짜 배열 -> 각 날짜 이하의 마지막 영업일 (datetime64[D] 배열)"""
+        _, offsets = self._offsets(days)
+        return self._to_dates(self.rollback_array[offsets])
+
+    def offset_many(self, days, n):
+        """날짜 배열을 각각 n(스칼라 또는 배열) 영업일 이동 (offset()과 같은 규칙)"""
+        ordinals, offsets = self._offsets(days)
+        n = np.asarray(n, dtype=np.int64)
+        index = self.rollback_array[offsets]
+        is_session = (index >= 0) & (self.session_array[np.maximum(index, 0)] == ordinals)
+        index = index + np.where((n < 0) & ~is_session, 1, 0)
+        return self._to_dates(index + n)
+
+    def count_many(self, starts, ends):
+        """구간 배열별 영업일 수 (양 끝 포함)"""
+        _, start_offsets = self._offsets(starts)
+        _, end_offsets = self._offsets(ends)
+        before_start = np.where(start_offsets > 0, self.rollback_array[np.maximum(start_offsets - 1, 0)], -1)
+        return np.maximum(self.rollback_array[end_offsets] - before_start, 0)
+
+
+_calendar = None
+_calendar_lock = threading.Lock()
+
+
+def get_trading_calendar():
+    """프로세스 공용 거래 캘린더를 반환합니다 (최초 호출 시 생성)."""
+    global _calendar
+    if _calendar is None:
+        with _calendar_lock:
+            if _calendar is None:
+                _calendar = TradingCalendar()
+    return _calendar